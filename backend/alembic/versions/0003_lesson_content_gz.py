@@ -0,0 +1,54 @@
+"""store lesson content gzip-compressed
+
+Revision ID: 0003_lesson_content_gz
+Revises: 0002_refresh_tokens
+Create Date: 2026-10-17 00:00:00
+
+"""
+import gzip
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_lesson_content_gz"
+down_revision = "0002_refresh_tokens"
+branch_labels = None
+depends_on = None
+
+BATCH = 500
+
+
+def _convert(source: str, target: str, transform) -> None:  # noqa: ANN001
+    """Copy lessons.source into lessons.target through transform, in id-ordered batches."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(f"SELECT id, {source} FROM lessons WHERE id > :last AND {source} IS NOT NULL ORDER BY id LIMIT :n"),
+            {"last": last_id, "n": BATCH},
+        ).all()
+        if not rows:
+            return
+        bind.execute(
+            sa.text(f"UPDATE lessons SET {target} = :value WHERE id = :id"),
+            [{"id": row[0], "value": transform(row[1])} for row in rows],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("lessons") as batch:
+        batch.add_column(sa.Column("content_gz", sa.LargeBinary()))
+    # same encoding as src.db.types.compress_text
+    _convert("content", "content_gz", lambda text: gzip.compress(text.encode("utf-8"), compresslevel=6, mtime=0))
+    with op.batch_alter_table("lessons") as batch:
+        batch.drop_column("content")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("lessons") as batch:
+        batch.add_column(sa.Column("content", sa.Text()))
+    _convert("content_gz", "content", lambda blob: gzip.decompress(blob).decode("utf-8"))
+    with op.batch_alter_table("lessons") as batch:
+        batch.drop_column("content_gz")
@@ -0,0 +1,25 @@
+"""composite index on lessons(module_id, order_index)
+
+Revision ID: 0004_lessons_module_order_index
+Revises: 0003_lesson_content_gz
+Create Date: 2026-10-17 00:00:00
+
+"""
+from alembic import op
+
+
+revision = "0004_lessons_module_order_index"
+down_revision = "0003_lesson_content_gz"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_lessons_module_id_order_index", "lessons", ["module_id", "order_index"])
+    # module_id alone is the composite index's leftmost column, so the single-column index is redundant
+    op.drop_index("ix_lessons_module_id", table_name="lessons")
+
+
+def downgrade() -> None:
+    op.create_index("ix_lessons_module_id", "lessons", ["module_id"])
+    op.drop_index("ix_lessons_module_id_order_index", table_name="lessons")
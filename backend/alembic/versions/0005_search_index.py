@@ -0,0 +1,61 @@
+"""FTS5 search index over modules, lessons and interview questions
+
+Revision ID: 0005_search_index
+Revises: 0004_lessons_module_order_index
+Create Date: 2026-10-17 00:00:00
+
+"""
+import gzip
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005_search_index"
+down_revision = "0004_lessons_module_order_index"
+branch_labels = None
+depends_on = None
+
+BATCH = 2000
+
+# rowid = source id * 4 + kind code (module=1, lesson=2, interview_question=3), as in src/db/search_index.py
+SOURCES = (
+    (1, "SELECT id, title, description FROM modules"),
+    (2, "SELECT id, title, content_gz FROM lessons"),
+    (3, "SELECT id, question, coalesce(category, '') || ' ' || coalesce(answer_hint, '') FROM interview_questions"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "title, body, kind UNINDEXED, ref_id UNINDEXED, tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    insert = sa.text(
+        "INSERT INTO search_index (rowid, title, body, kind, ref_id) VALUES (:rowid, :title, :body, :kind, :ref_id)"
+    )
+    for kind, query in SOURCES:
+        last_id = 0
+        while True:
+            rows = bind.execute(
+                sa.text(f"{query} WHERE id > :last ORDER BY id LIMIT :n"), {"last": last_id, "n": BATCH}
+            ).all()
+            if not rows:
+                break
+            batch = []
+            for ref_id, title, body in rows:
+                if kind == 2 and body is not None:
+                    body = gzip.decompress(body).decode("utf-8")
+                row = {"rowid": ref_id * 4 + kind, "kind": kind, "ref_id": ref_id}
+                batch.append({**row, "title": title or "", "body": body or ""})
+            bind.execute(insert, batch)
+            last_id = rows[-1][0]
+    op.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,74 @@
+"""lesson completions, denormalized module lesson counts, one progress row per (user, module)
+
+Revision ID: 0006_lesson_completions
+Revises: 0005_search_index
+Create Date: 2026-10-17 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006_lesson_completions"
+down_revision = "0005_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("modules", sa.Column("lesson_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute("UPDATE modules SET lesson_count = (SELECT count(*) FROM lessons WHERE lessons.module_id = modules.id)")
+
+    op.create_table(
+        "lesson_completions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("lesson_id", sa.Integer(), sa.ForeignKey("lessons.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("module_id", sa.Integer(), sa.ForeignKey("modules.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=False),
+        sa.UniqueConstraint("user_id", "lesson_id", name="uq_lesson_completions_user_lesson"),
+    )
+    op.create_index("ix_lesson_completions_lesson_id", "lesson_completions", ["lesson_id"])
+
+    # Keep the most advanced progress row of each (user, module) before enforcing uniqueness
+    op.execute(
+        "DELETE FROM progress WHERE EXISTS (SELECT 1 FROM progress p2 "
+        "WHERE p2.user_id = progress.user_id AND p2.module_id = progress.module_id "
+        "AND (p2.progress_percent > progress.progress_percent "
+        "OR (p2.progress_percent = progress.progress_percent AND p2.id > progress.id)))"
+    )
+    op.create_index("uq_progress_user_module", "progress", ["user_id", "module_id"], unique=True)
+    # user_id lookups use the unique index's leftmost column
+    op.drop_index("ix_progress_user_id", table_name="progress")
+    op.add_column("progress", sa.Column("completed_lessons", sa.Integer(), nullable=False, server_default="0"))
+
+    # The old endpoint only kept current_lesson_id; treat every lesson up to it (by order_index) as completed,
+    # which is what its percent assumed, then derive the counters from the completions.
+    op.execute(
+        "INSERT INTO lesson_completions (user_id, lesson_id, module_id, completed_at) "
+        "SELECT p.user_id, l.id, l.module_id, p.updated_at FROM progress p "
+        "JOIN lessons cur ON cur.id = p.current_lesson_id "
+        "JOIN lessons l ON l.module_id = p.module_id AND l.order_index <= cur.order_index"
+    )
+    op.execute(
+        "UPDATE progress SET completed_lessons = (SELECT count(*) FROM lesson_completions c "
+        "WHERE c.user_id = progress.user_id AND c.module_id = progress.module_id)"
+    )
+    op.execute(
+        "UPDATE progress SET "
+        "progress_percent = CASE WHEN completed_lessons >= m.lesson_count THEN 100.0 "
+        "ELSE completed_lessons * 100.0 / m.lesson_count END, "
+        "status = CASE WHEN completed_lessons >= m.lesson_count THEN 'completed' ELSE 'in_progress' END "
+        "FROM modules m WHERE m.id = progress.module_id"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("progress") as batch:
+        batch.drop_column("completed_lessons")
+    op.create_index("ix_progress_user_id", "progress", ["user_id"])
+    op.drop_index("uq_progress_user_module", table_name="progress")
+    op.drop_index("ix_lesson_completions_lesson_id", table_name="lesson_completions")
+    op.drop_table("lesson_completions")
+    with op.batch_alter_table("modules") as batch:
+        batch.drop_column("lesson_count")
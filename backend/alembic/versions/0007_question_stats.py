@@ -0,0 +1,51 @@
+"""per-answer capture and running per-question statistics
+
+Revision ID: 0007_question_stats
+Revises: 0006_lesson_completions
+Create Date: 2026-10-17 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_question_stats"
+down_revision = "0006_lesson_completions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Earlier attempts kept only their aggregate score, so both tables start empty
+    op.create_table(
+        "attempt_answers",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("attempt_id", sa.Integer(), sa.ForeignKey("attempts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("questions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("selected_option", sa.String(length=1), nullable=True),
+        sa.Column("is_correct", sa.Boolean(), nullable=False),
+    )
+    op.create_index("ix_attempt_answers_attempt_id", "attempt_answers", ["attempt_id"])
+    op.create_index("ix_attempt_answers_question_id", "attempt_answers", ["question_id"])
+    op.create_table(
+        "question_stats",
+        sa.Column(
+            "question_id", sa.Integer(), sa.ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("correct", sa.Integer(), nullable=False),
+        sa.Column("count_a", sa.Integer(), nullable=False),
+        sa.Column("count_b", sa.Integer(), nullable=False),
+        sa.Column("count_c", sa.Integer(), nullable=False),
+        sa.Column("count_d", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("score_sq_sum", sa.Float(), nullable=False),
+        sa.Column("correct_score_sum", sa.Float(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("question_stats")
+    op.drop_index("ix_attempt_answers_question_id", table_name="attempt_answers")
+    op.drop_index("ix_attempt_answers_attempt_id", table_name="attempt_answers")
+    op.drop_table("attempt_answers")
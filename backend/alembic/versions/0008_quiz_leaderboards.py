@@ -0,0 +1,56 @@
+"""quiz leaderboards: best score per (quiz, user) and users per distinct best score
+
+Revision ID: 0008_quiz_leaderboards
+Revises: 0007_question_stats
+Create Date: 2026-10-17 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_quiz_leaderboards"
+down_revision = "0007_question_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "quiz_best_scores",
+        sa.Column("quiz_id", sa.Integer(), sa.ForeignKey("quizzes.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("best_score", sa.Float(), nullable=False),
+        sa.Column("achieved_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_quiz_best_scores_user_id", "quiz_best_scores", ["user_id"])
+    op.create_index(
+        "ix_quiz_best_scores_ranking",
+        "quiz_best_scores",
+        ["quiz_id", sa.text("best_score DESC"), "achieved_at", "user_id"],
+    )
+    op.create_table(
+        "quiz_score_counts",
+        sa.Column("quiz_id", sa.Integer(), sa.ForeignKey("quizzes.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("score", sa.Float(), primary_key=True),
+        sa.Column("users", sa.Integer(), nullable=False),
+    )
+    # Same as src.db.leaderboard.rebuild: earliest attempt reaching each user's best, scores rounded to 4 places
+    op.execute(
+        "INSERT INTO quiz_best_scores (quiz_id, user_id, best_score, achieved_at) "
+        "SELECT a.quiz_id, a.user_id, round(CAST(a.score AS NUMERIC), 4), min(a.submitted_at) FROM attempts a "
+        "JOIN (SELECT quiz_id, user_id, max(score) AS score FROM attempts GROUP BY quiz_id, user_id) b "
+        "ON b.quiz_id = a.quiz_id AND b.user_id = a.user_id AND b.score = a.score "
+        "GROUP BY a.quiz_id, a.user_id, a.score"
+    )
+    op.execute(
+        "INSERT INTO quiz_score_counts (quiz_id, score, users) "
+        "SELECT quiz_id, best_score, count(*) FROM quiz_best_scores GROUP BY quiz_id, best_score"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("quiz_score_counts")
+    op.drop_index("ix_quiz_best_scores_ranking", table_name="quiz_best_scores")
+    op.drop_index("ix_quiz_best_scores_user_id", table_name="quiz_best_scores")
+    op.drop_table("quiz_best_scores")
@@ -0,0 +1,31 @@
+"""unread notification counters and a (user_id, is_read, id) notifications index
+
+Revision ID: 0009_unread_notification_counts
+Revises: 0008_quiz_leaderboards
+Create Date: 2026-10-17 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009_unread_notification_counts"
+down_revision = "0008_quiz_leaderboards"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_notifications_user_unread", "notifications", ["user_id", "is_read", "id"])
+    op.add_column("users", sa.Column("unread_notifications", sa.Integer(), nullable=False, server_default="0"))
+    # Same as src.db.notification_counts.recount
+    op.execute(
+        "UPDATE users SET unread_notifications = "
+        "(SELECT count(*) FROM notifications n WHERE n.user_id = users.id AND n.is_read = FALSE)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("unread_notifications")
+    op.drop_index("ix_notifications_user_unread", table_name="notifications")
@@ -0,0 +1,3 @@
+"""
+Benchmarks for the SkillBridge backend. Run modules with `python -m benchmarks.<name>` from backend/.
+"""
@@ -0,0 +1,132 @@
+"""
+Compare the sync (threadpool) and async (aiosqlite) database request paths.
+
+Two endpoints run the same module listing query against a seeded temporary SQLite file:
+- GET /sync:  `def` endpoint using a sync Session; FastAPI runs it in the AnyIO threadpool (40 threads by default)
+- GET /async: `async def` endpoint using an AsyncSession on the event loop
+
+Optional --db-latency-ms adds a per-query wait (time.sleep vs asyncio.sleep) to model a networked database,
+which is where threadpool capacity becomes the bottleneck.
+
+Usage:
+    python -m benchmarks.db_paths --requests 2000 --concurrency 1 16 64 256 --db-latency-ms 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src import models  # noqa: F401  (register all tables)
+from src.models.content import Module
+
+
+def build_app(db_path: str, latency_s: float) -> tuple[FastAPI, callable]:
+    """Build a minimal app exposing the two paths over the same database file."""
+    sync_engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    SyncSession = sessionmaker(bind=sync_engine)
+    AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    Base.metadata.create_all(bind=sync_engine)
+    with SyncSession() as db:
+        if not db.scalar(select(Module.id).limit(1)):
+            db.add_all(Module(title=f"Module {i}", description="benchmark") for i in range(50))
+            db.commit()
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_path():
+        with SyncSession() as db:
+            if latency_s:
+                time.sleep(latency_s)
+            rows = db.scalars(select(Module)).all()
+            return [{"id": m.id, "title": m.title} for m in rows]
+
+    @app.get("/async")
+    async def async_path():
+        async with AsyncSession() as db:
+            if latency_s:
+                await asyncio.sleep(latency_s)
+            rows = (await db.scalars(select(Module))).all()
+            return [{"id": m.id, "title": m.title} for m in rows]
+
+    async def dispose() -> None:
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+    return app, dispose
+
+
+async def drive(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    """Issue `total` GETs against path with `concurrency` in-flight requests; return throughput and latency."""
+    latencies: list[float] = []
+    queue = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in queue:
+                start = time.perf_counter()
+                resp = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                resp.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+
+    return {
+        "path": path,
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+async def main(args: argparse.Namespace) -> list[dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        app, dispose = build_app(os.path.join(tmp, "bench.db"), args.db_latency_ms / 1000.0)
+        results = []
+        try:
+            for concurrency in args.concurrency:
+                for path in ("/sync", "/async"):
+                    await drive(app, path, min(50, args.requests), concurrency)  # warm-up
+                    results.append(await drive(app, path, args.requests, concurrency))
+        finally:
+            await dispose()
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="Write JSON results to this file as well as stdout")
+    cli_args = parser.parse_args()
+    out = asyncio.run(main(cli_args))
+    text = json.dumps(out, indent=2)
+    print(text)
+    if cli_args.output:
+        with open(cli_args.output, "w") as f:
+            f.write(text)
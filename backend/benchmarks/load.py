@@ -0,0 +1,346 @@
+"""
+In-process load test and latency benchmark for the full API.
+
+Drives the real `src.api.main.app` through httpx's ASGI transport against a freshly seeded temporary
+SQLite database and reports throughput and p50/p95/p99 latency per endpoint (keyed by route template).
+
+Scenarios:
+- login:         POST /auth/login
+- browse:        GET /modules, GET /modules/{module_id}, GET /lessons/{lesson_id}, GET /lessons/{lesson_id}/content
+- complete:      POST /lessons/{lesson_id}/complete
+- quiz:          POST /quizzes/{module_id}/start, POST /quizzes/{quiz_id}/submit
+- portfolio:     GET/POST /portfolio, PUT/DELETE /portfolio/{item_id}
+- notifications: GET /notifications
+
+Baselines:
+- --save-baseline writes the run's results to --baseline.
+- Otherwise, when --baseline exists, the run fails (exit 1) if any endpoint's p95 grows or its throughput
+  shrinks by more than --tolerance relative to the stored numbers.
+
+Usage:
+    python -m benchmarks.load --iterations 200 --concurrency 16 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "load.json")
+PASSWORD = "bench-password"
+
+
+class Recorder:
+    """Collects per-endpoint latencies and errors for one scenario."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, client, name: str, method: str, url: str, **kwargs):  # noqa: ANN001
+        start = time.perf_counter()
+        resp = await client.request(method, url, **kwargs)
+        self.latencies[name].append(time.perf_counter() - start)
+        if resp.status_code >= 400:
+            self.errors[name] += 1
+        return resp
+
+
+def seed(db_url: str, users: int, modules: int, lessons: int, questions: int, notifications: int) -> dict:
+    """Bulk-seed the benchmark dataset and return ids/tokens the scenarios draw from."""
+    from datetime import datetime
+
+    from sqlalchemy import create_engine, insert, select
+
+    from src.core.security import create_access_token, hash_password
+    from src.models.content import Lesson, Module, Question, Quiz
+    from src.models.extras import Notification
+    from src.models.user import User
+
+    engine = create_engine(db_url)
+    now = datetime.utcnow()
+    hashed = hash_password(PASSWORD)  # one bcrypt for every seeded user
+    with engine.begin() as cx:
+        first_user = cx.execute(select(User.id).order_by(User.id.desc()).limit(1)).scalar() or 0
+        cx.execute(
+            insert(User),
+            [
+                {
+                    "email": f"bench{i}@example.com",
+                    "hashed_password": hashed,
+                    "full_name": f"Bench {i}",
+                    "created_at": now,
+                    # Core inserts skip the ORM counter hooks, so denormalized counts are seeded explicitly
+                    "unread_notifications": notifications,
+                }
+                for i in range(users)
+            ],
+        )
+        user_ids = list(range(first_user + 1, first_user + users + 1))
+        module_ids = []
+        for m in range(modules):
+            module_id = cx.execute(
+                insert(Module).values(
+                    title=f"Bench module {m}", description="Seeded for load tests", created_at=now, lesson_count=lessons
+                )
+            ).inserted_primary_key[0]
+            module_ids.append(module_id)
+            cx.execute(
+                insert(Lesson),
+                [
+                    {
+                        "module_id": module_id,
+                        "title": f"Lesson {i + 1}",
+                        "content": "lorem ipsum " * 200,
+                        "order_index": i + 1,
+                    }
+                    for i in range(lessons)
+                ],
+            )
+            quiz_id = cx.execute(insert(Quiz).values(module_id=module_id, title=f"Quiz {m}")).inserted_primary_key[0]
+            cx.execute(
+                insert(Question),
+                [
+                    {
+                        "quiz_id": quiz_id,
+                        "prompt": f"Question {q}",
+                        "option_a": "a",
+                        "option_b": "b",
+                        "option_c": "c",
+                        "option_d": "d",
+                        "correct_option": "ABCD"[q % 4],
+                    }
+                    for q in range(questions)
+                ],
+            )
+        if notifications:
+            cx.execute(
+                insert(Notification),
+                [
+                    {"user_id": uid, "message": f"Reminder {n}", "is_read": False, "created_at": now}
+                    for uid in user_ids
+                    for n in range(notifications)
+                ],
+            )
+        lesson_ids = list(cx.execute(select(Lesson.id).where(Lesson.module_id.in_(module_ids))).scalars())
+    engine.dispose()
+    return {
+        "users": [(uid, f"bench{i}@example.com", create_access_token(str(uid))) for i, uid in enumerate(user_ids)],
+        "modules": module_ids,
+        "lessons": lesson_ids,
+    }
+
+
+def scenarios(data: dict) -> dict[str, Callable[..., Awaitable[None]]]:
+    """Map scenario name -> coroutine(client, recorder, rnd) performing one iteration."""
+
+    def auth(rnd: random.Random) -> dict:
+        _, _, token = rnd.choice(data["users"])
+        return {"Authorization": f"Bearer {token}"}
+
+    async def login(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        _, email, _ = rnd.choice(data["users"])
+        await rec.call(client, "POST /auth/login", "POST", "/auth/login", json={"email": email, "password": PASSWORD})
+
+    async def browse(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        h = auth(rnd)
+        await rec.call(client, "GET /modules", "GET", "/modules", headers=h)
+        await rec.call(client, "GET /modules/{module_id}", "GET", f"/modules/{rnd.choice(data['modules'])}", headers=h)
+        await rec.call(client, "GET /lessons/{lesson_id}", "GET", f"/lessons/{rnd.choice(data['lessons'])}", headers=h)
+        await rec.call(
+            client,
+            "GET /lessons/{lesson_id}/content",
+            "GET",
+            f"/lessons/{rnd.choice(data['lessons'])}/content",
+            headers={**h, "Accept-Encoding": "gzip"},
+        )
+
+    async def complete(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        lesson_id = rnd.choice(data["lessons"])
+        await rec.call(
+            client, "POST /lessons/{lesson_id}/complete", "POST", f"/lessons/{lesson_id}/complete", headers=auth(rnd)
+        )
+
+    async def quiz(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        h = auth(rnd)
+        module_id = rnd.choice(data["modules"])
+        resp = await rec.call(
+            client, "POST /quizzes/{module_id}/start", "POST", f"/quizzes/{module_id}/start", headers=h
+        )
+        if resp.status_code != 200:
+            return
+        body = resp.json()
+        answers = {str(q["id"]): rnd.choice("ABCD") for q in body["questions"]}
+        await rec.call(
+            client,
+            "POST /quizzes/{quiz_id}/submit",
+            "POST",
+            f"/quizzes/{body['id']}/submit",
+            headers=h,
+            json={"answers": answers},
+        )
+
+    async def portfolio(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        h = auth(rnd)
+        await rec.call(client, "GET /portfolio", "GET", "/portfolio", headers=h)
+        item = {"title": "Bench project", "description": "x" * 200, "url": "https://example.com"}
+        resp = await rec.call(client, "POST /portfolio", "POST", "/portfolio", headers=h, json=item)
+        if resp.status_code != 200:
+            return
+        item_id = resp.json()["id"]
+        await rec.call(client, "PUT /portfolio/{item_id}", "PUT", f"/portfolio/{item_id}", headers=h, json=item)
+        await rec.call(client, "DELETE /portfolio/{item_id}", "DELETE", f"/portfolio/{item_id}", headers=h)
+
+    async def notifications(client, rec: Recorder, rnd: random.Random) -> None:  # noqa: ANN001
+        await rec.call(client, "GET /notifications", "GET", "/notifications", headers=auth(rnd))
+
+    return {
+        "login": login,
+        "browse": browse,
+        "complete": complete,
+        "quiz": quiz,
+        "portfolio": portfolio,
+        "notifications": notifications,
+    }
+
+
+def summarize(rec: Recorder, elapsed: float) -> dict[str, dict]:
+    out = {}
+    for name, lat in rec.latencies.items():
+        lat = sorted(lat)
+
+        def pct(p: float) -> float:
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000, 3)
+
+        out[name] = {
+            "count": len(lat),
+            "errors": rec.errors.get(name, 0),
+            "throughput_rps": round(len(lat) / elapsed, 1),
+            "mean_ms": round(statistics.fmean(lat) * 1000, 3),
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+        }
+    return out
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from src.api.main import app
+
+    db_url = os.environ["DATABASE_URL"]
+    async with app.router.lifespan_context(app):
+        data = seed(db_url, args.users, args.modules, args.lessons, args.questions, args.notifications)
+        results: dict[str, dict] = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, fn in scenarios(data).items():
+                if args.scenarios and name not in args.scenarios:
+                    continue
+                iterations = args.login_iterations if name == "login" else args.iterations
+                rec = Recorder()
+                pending = iter(range(iterations))
+                rnd_seed = random.Random(args.seed)
+
+                async def worker(rnd: random.Random) -> None:
+                    for _ in pending:
+                        await fn(client, rec, rnd)
+
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *(worker(random.Random(rnd_seed.random())) for _ in range(args.concurrency))
+                )
+                results.update(summarize(rec, time.perf_counter() - started))
+    return {
+        "meta": {
+            "iterations": args.iterations,
+            "login_iterations": args.login_iterations,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "modules": args.modules,
+            "lessons_per_module": args.lessons,
+            "questions_per_quiz": args.questions,
+            "notifications_per_user": args.notifications,
+            "python": sys.version.split()[0],
+        },
+        "endpoints": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return human-readable regressions of current vs baseline endpoints."""
+    regressions = []
+    for name, base in baseline.get("endpoints", {}).items():
+        cur = current["endpoints"].get(name)
+        if cur is None:
+            continue
+        if cur["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {cur['p95_ms']}ms > baseline {base['p95_ms']}ms (+{tolerance:.0%})")
+        if cur["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {cur['throughput_rps']} rps < baseline {base['throughput_rps']} rps "
+                f"(-{tolerance:.0%})"
+            )
+        if cur["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: {cur['errors']} errors (baseline {base.get('errors', 0)})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per scenario")
+    parser.add_argument("--login-iterations", type=int, default=20, help="Iterations for the bcrypt-bound login")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--modules", type=int, default=10)
+    parser.add_argument("--lessons", type=int, default=10, help="Lessons per module")
+    parser.add_argument("--questions", type=int, default=10, help="Questions per quiz")
+    parser.add_argument("--notifications", type=int, default=20, help="Notifications per user")
+    parser.add_argument("--scenarios", nargs="*", help="Subset of scenarios to run")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write JSON results to this file as well as stdout")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Configure the app for an isolated database before it is imported.
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        os.environ.pop("READ_DATABASE_URL", None)
+        os.environ.pop("RATE_LIMIT_MAX", None)
+        results = asyncio.run(run(args))
+
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            f.write(text)
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions against baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"- {line}", file=sys.stderr)
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Notification fan-out latency and throughput for N worker processes x M WebSocket connections each.
+
+Every worker process runs its own event loop and NotificationHub (src/core/notification_hub.py) with M
+in-memory sockets, one per user; users are spread over the workers. Each worker then publishes its share
+of --events notifications to uniformly random users, so with N > 1 most events must cross to another
+worker through the pub/sub backend. Sockets record publish-to-send latency (time.monotonic is system-wide
+on Linux, so stamps compare across processes) and each configuration reports throughput, p50/p95/p99
+latency and the share of events delivered.
+
+The memory backend only reaches sockets in the publishing process, so it runs with one worker as the
+single-process baseline.
+
+Usage:
+    python -m benchmarks.notify_fanout --workers 1 2 4 --connections 100 1000 --events 20000
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.core.notification_hub import NotificationHub
+from src.core.notification_pubsub import make_backend
+
+
+class FakeSocket:
+    """Stands in for a WebSocket: decodes each event like a client would and records its latency."""
+
+    def __init__(self, latencies: list[float]):
+        self.latencies = latencies
+
+    async def send_text(self, text: str) -> None:
+        self.latencies.append(time.monotonic() - json.loads(text)["t"])
+
+
+async def _worker_main(index: int, args: dict, barrier, results) -> None:  # noqa: ANN001
+    backend = make_backend(args["backend"], args["socket_path"])
+    hub = NotificationHub(queue_max=args["queue_max"], backend=backend)
+    await hub.start()
+    while backend.name == "unix" and not backend.stats()["connected"]:
+        await asyncio.sleep(0.01)
+    latencies: list[float] = []
+    conns = [
+        hub.register(index * args["connections"] + n, FakeSocket(latencies)) for n in range(args["connections"])
+    ]
+    await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+
+    rnd = random.Random(index)
+    users = args["workers"] * args["connections"]
+    share = args["events"] // args["workers"]
+    interval = args["workers"] / args["rate"] if args["rate"] else 0.0
+    started = time.monotonic()
+    for n in range(share):
+        hub.publish(rnd.randrange(users), {"type": "notification", "id": n, "message": "benchmark", "t": time.monotonic()})
+        if interval:
+            await asyncio.sleep(max(0.0, started + (n + 1) * interval - time.monotonic()))
+        elif n % 200 == 199:
+            await asyncio.sleep(0)  # let sockets and the broker connection drain
+    # wait until deliveries stop arriving
+    seen, quiet_since = -1, time.monotonic()
+    while time.monotonic() - quiet_since < 0.5:
+        await asyncio.sleep(0.05)
+        if len(latencies) != seen:
+            seen, quiet_since = len(latencies), time.monotonic()
+    finished = quiet_since
+    for conn in conns:
+        await hub.unregister(conn)
+    await asyncio.get_running_loop().run_in_executor(None, barrier.wait)  # keep the broker up until all finish
+    await hub.stop()
+    results.put({"started": started, "finished": finished, "latencies": latencies, "overflows": hub.overflows})
+
+
+def _worker(index: int, args: dict, barrier, results) -> None:  # noqa: ANN001
+    asyncio.run(_worker_main(index, args, barrier, results))
+
+
+def run(backend: str, workers: int, connections: int, events: int, rate: float, queue_max: int) -> dict:
+    """Run one configuration in fresh processes and summarize it."""
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        args = {
+            "backend": backend,
+            "socket_path": os.path.join(tmp, "notify.sock"),
+            "workers": workers,
+            "connections": connections,
+            "events": events,
+            "rate": rate,
+            "queue_max": queue_max,
+        }
+        barrier, results = ctx.Barrier(workers), ctx.Queue()
+        procs = [ctx.Process(target=_worker, args=(i, args, barrier, results)) for i in range(workers)]
+        for proc in procs:
+            proc.start()
+        parts = [results.get(timeout=300) for _ in procs]
+        for proc in procs:
+            proc.join()
+    latencies = sorted(lat for part in parts for lat in part["latencies"])
+    elapsed = max(p["finished"] for p in parts) - min(p["started"] for p in parts)
+    published = (events // workers) * workers
+
+    def pct(q: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3) if latencies else 0.0
+
+    return {
+        "backend": backend,
+        "workers": workers,
+        "connections_per_worker": connections,
+        "published": published,
+        "delivered": len(latencies),
+        "delivered_ratio": round(len(latencies) / published, 4) if published else 0.0,
+        "overflows": sum(p["overflows"] for p in parts),
+        "throughput_per_s": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+def main(args: argparse.Namespace) -> list[dict]:
+    results = []
+    for connections in args.connections:
+        if "memory" in args.backends:
+            results.append(run("memory", 1, connections, args.events, args.rate, args.queue_max))
+        if "unix" in args.backends:
+            for workers in args.workers:
+                results.append(run("unix", workers, connections, args.events, args.rate, args.queue_max))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=["memory", "unix"], default=["memory", "unix"])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--connections", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--events", type=int, default=20000, help="Total notifications published per run")
+    parser.add_argument("--rate", type=float, default=0.0, help="Total publish rate per second (0 = unpaced)")
+    parser.add_argument("--queue-max", type=int, default=100, help="Per-socket queue bound (NOTIFY_QUEUE_MAX)")
+    parser.add_argument("--output", help="Write JSON results to this file as well as stdout")
+    cli_args = parser.parse_args()
+    out = main(cli_args)
+    text = json.dumps(out, indent=2)
+    print(text)
+    if cli_args.output:
+        with open(cli_args.output, "w") as f:
+            f.write(text)
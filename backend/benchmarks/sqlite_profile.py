@@ -0,0 +1,167 @@
+"""
+Measure SQLite read/write throughput under concurrent load for each tuning profile.
+
+For every profile in src.db.session.sqlite_pragmas ("safe" = SQLite defaults, "production" = WAL etc.),
+a fresh database is seeded and R reader threads plus W writer threads run for a fixed duration:
+- readers: progress/attempt lookups for a random user (the shape of GET /progress)
+- writers: one Attempt insert + Progress update per transaction (the shape of quiz submit / lesson complete)
+
+Usage:
+    python -m benchmarks.sqlite_profile --readers 8 --writers 2 --seconds 5
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, event, insert, select, update
+from sqlalchemy.exc import OperationalError
+
+from src.db.base import Base
+from src import models  # noqa: F401  (register all tables)
+from src.db.session import apply_sqlite_pragmas, sqlite_pragmas
+from src.models.content import Module, Quiz
+from src.models.tracking import Attempt, Progress
+from src.models.user import User
+
+
+def make_engine(path: str, profile: str):
+    """Engine with the given tuning profile applied on connect; one pooled connection per thread."""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=64,
+        max_overflow=0,
+    )
+    pragmas = sqlite_pragmas(profile)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):  # noqa: ANN001
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    return engine
+
+
+def seed(engine, users: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as cx:
+        cx.execute(
+            insert(User),
+            [{"email": f"u{i}@bench", "hashed_password": "x", "created_at": datetime.utcnow()} for i in range(users)],
+        )
+        cx.execute(insert(Module), [{"title": "Bench", "created_at": datetime.utcnow()}])
+        cx.execute(insert(Quiz), [{"module_id": 1, "title": "Bench quiz"}])
+        cx.execute(
+            insert(Progress),
+            [
+                {"user_id": i + 1, "module_id": 1, "progress_percent": 0.0, "updated_at": datetime.utcnow()}
+                for i in range(users)
+            ],
+        )
+
+
+def run_profile(profile: str, readers: int, writers: int, seconds: float, users: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(os.path.join(tmp, "bench.db"), profile)
+        seed(engine, users)
+        stop = threading.Event()
+        counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+        lock = threading.Lock()
+        read_lat: list[float] = []
+        write_lat: list[float] = []
+
+        def reader() -> None:
+            rnd = random.Random()
+            local, errors, lat = 0, 0, []
+            while not stop.is_set():
+                uid = rnd.randint(1, users)
+                start = time.perf_counter()
+                try:
+                    with engine.connect() as cx:
+                        cx.execute(select(Progress).where(Progress.user_id == uid)).all()
+                        cx.execute(select(Attempt.score).where(Attempt.user_id == uid)).all()
+                    local += 1
+                    lat.append(time.perf_counter() - start)
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counts["reads"] += local
+                counts["read_errors"] += errors
+                read_lat.extend(lat)
+
+        def writer() -> None:
+            rnd = random.Random()
+            local, errors, lat = 0, 0, []
+            while not stop.is_set():
+                uid = rnd.randint(1, users)
+                start = time.perf_counter()
+                try:
+                    with engine.begin() as cx:
+                        cx.execute(
+                            insert(Attempt).values(
+                                user_id=uid, quiz_id=1, score=rnd.random() * 100, submitted_at=datetime.utcnow()
+                            )
+                        )
+                        cx.execute(
+                            update(Progress)
+                            .where(Progress.user_id == uid, Progress.module_id == 1)
+                            .values(progress_percent=rnd.random() * 100, updated_at=datetime.utcnow())
+                        )
+                    local += 1
+                    lat.append(time.perf_counter() - start)
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counts["writes"] += local
+                counts["write_errors"] += errors
+                write_lat.extend(lat)
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    def p(lat: list[float], q: float) -> float | None:
+        if not lat:
+            return None
+        lat.sort()
+        return round(lat[min(len(lat) - 1, int(q * len(lat)))] * 1000, 3)
+
+    return {
+        "profile": profile,
+        "readers": readers,
+        "writers": writers,
+        "seconds": seconds,
+        "reads_per_s": round(counts["reads"] / seconds, 1),
+        "writes_per_s": round(counts["writes"] / seconds, 1),
+        "read_p99_ms": p(read_lat, 0.99),
+        "write_p99_ms": p(write_lat, 0.99),
+        "read_errors": counts["read_errors"],
+        "write_errors": counts["write_errors"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--profiles", nargs="+", default=["safe", "production"])
+    parser.add_argument("--output", help="Write JSON results to this file as well as stdout")
+    args = parser.parse_args()
+    results = [run_profile(p, args.readers, args.writers, args.seconds, args.users) for p in args.profiles]
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
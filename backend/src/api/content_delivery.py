@@ -0,0 +1,134 @@
+import hashlib
+import zlib
+from typing import AsyncIterator, Iterator, Optional
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+from src.core.catalog_cache import etag_matches
+from src.db.types import gzip_uncompressed_size
+
+CHUNK_SIZE = 64 * 1024
+
+
+# PUBLIC_INTERFACE
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """True when Accept-Encoding allows gzip (explicitly or via `*`) with a non-zero q-value."""
+    if not accept_encoding:
+        return False
+    allowed: dict[str, bool] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        allowed[coding.strip().lower()] = q > 0
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in allowed:
+            return allowed[coding]
+    return False
+
+
+# PUBLIC_INTERFACE
+def parse_range(header: Optional[str], total: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single `bytes=` range against a representation of `total` bytes.
+
+    Returns:
+    - (start, end) inclusive, or None to serve the full representation (absent, malformed or multi-range).
+
+    Raises:
+    - ValueError: the range is well formed but unsatisfiable (answer 416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[6:].strip().partition("-")
+    if not sep or not (first or last) or not all(p == "" or p.isdigit() for p in (first, last)):
+        return None
+    if first == "":
+        suffix = int(last)
+        if suffix == 0 or total == 0:
+            raise ValueError("unsatisfiable suffix range")
+        return max(0, total - suffix), total - 1
+    start = int(first)
+    end = int(last) if last else total - 1
+    if last and end < start:
+        return None
+    if start >= total:
+        raise ValueError("range starts past the end")
+    return start, min(end, total - 1)
+
+
+async def _slices(blob: bytes, start: int, end: int) -> AsyncIterator[bytes]:
+    view = memoryview(blob)
+    for offset in range(start, end + 1, CHUNK_SIZE):
+        yield bytes(view[offset : min(offset + CHUNK_SIZE, end + 1)])
+
+
+def _inflate(blob: bytes, start: int, end: int) -> Iterator[bytes]:
+    # Bounded-output inflate so a highly compressible body never materializes in full.
+    decompressor = zlib.decompressobj(wbits=31)
+    pending, pos = blob, 0
+    while pos <= end:
+        out = decompressor.decompress(pending, CHUNK_SIZE) if pending else decompressor.flush()
+        pending = decompressor.unconsumed_tail
+        if not out:
+            return
+        if pos + len(out) > start:
+            yield out[max(0, start - pos) : end + 1 - pos]
+        pos += len(out)
+
+
+# PUBLIC_INTERFACE
+def stream_gzip_body(
+    blob: bytes,
+    accept_encoding: Optional[str],
+    range_header: Optional[str],
+    if_none_match: Optional[str] = None,
+    if_range: Optional[str] = None,
+    media_type: str = "text/plain; charset=utf-8",
+) -> Response:
+    """
+    Serve a gzip-stored body as a streamed, range-capable response.
+
+    Notes:
+    - Clients accepting gzip receive the stored bytes verbatim with `Content-Encoding: gzip`; others get
+      the body inflated chunk by chunk. Ranges apply to whichever representation is selected.
+    - Each representation has its own strong ETag; If-None-Match answers 304 and a stale If-Range
+      disables the Range header.
+    """
+    digest = hashlib.sha256(blob).hexdigest()[:32]
+    gzip_ok = accepts_gzip(accept_encoding)
+    etag = f'"{digest}-gz"' if gzip_ok else f'"{digest}"'
+    total = len(blob) if gzip_ok else gzip_uncompressed_size(blob)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "private, no-cache",
+    }
+    if gzip_ok:
+        headers["Content-Encoding"] = "gzip"
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    if if_range and if_range.strip() != etag:
+        range_header = None
+
+    try:
+        selected = parse_range(range_header, total)
+    except ValueError:
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{total}"})
+    status = 200
+    start, end = 0, total - 1
+    if selected is not None:
+        status = 206
+        start, end = selected
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+    headers["Content-Length"] = str(max(0, end - start + 1))
+    body = _slices(blob, start, end) if gzip_ok else _inflate(blob, start, end)
+    return StreamingResponse(body, status_code=status, media_type=media_type, headers=headers)
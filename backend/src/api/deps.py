@@ -1,26 +1,70 @@
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
 from fastapi import Depends, HTTPException, Header
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import get_settings
+from src.core.principal_cache import Principal, principal_cache
 from src.core.security import decode_token
-from src.db.session import db_session
+from src.db.session import async_db_session, async_read_session
 from src.models.user import User
 
 
 # PUBLIC_INTERFACE
-def get_db():
-    """Yield a SQLAlchemy Session from the pooled session maker."""
-    with db_session() as db:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession; commits when the request succeeds and rolls back on error."""
+    async with async_db_session() as db:
         yield db
 
 
 # PUBLIC_INTERFACE
-def get_current_user(
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield a read-only AsyncSession from the read engine's pool.
+
+    Use for GET endpoints: the session never commits or takes write locks (SQLite opens the file with
+    mode=ro and query_only), and READ_DATABASE_URL can move this traffic to a replica.
+    """
+    async with async_read_session() as db:
+        yield db
+
+
+# PUBLIC_INTERFACE
+async def resolve_principal(db: AsyncSession, sub) -> Optional[Principal]:  # noqa: ANN001
+    """
+    Resolve a token subject to a Principal, consulting the process-wide principal cache first.
+
+    Parameters:
+    - db: AsyncSession used only on a cache miss
+    - sub: JWT `sub` claim (user id or email)
+
+    Returns:
+    - Principal snapshot, or None if no such user exists
+    """
+    key = str(sub)
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
+    # sub is user id or email; try id int first then email
+    user: Optional[User] = None
+    if key.isdigit():
+        user = await db.scalar(select(User).where(User.id == int(key)))
+    if not user:
+        user = await db.scalar(select(User).where(User.email == key))
+    if not user:
+        return None
+    principal = Principal.from_user(user)
+    principal_cache.put(key, principal)
+    return principal
+
+
+# PUBLIC_INTERFACE
+async def get_current_user(
     authorization: Optional[str] = Header(default=None, alias="Authorization"),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_read_db),
+) -> Principal:
     """
     Resolve and return the authenticated user from a Bearer JWT in the Authorization header.
 
@@ -28,14 +72,32 @@ def get_current_user(
     - Authorization: "Bearer <token>"
 
     Returns:
-    - User ORM instance
+    - Principal snapshot. In claims-only mode it is rebuilt from the access token itself; otherwise it is
+      served from the principal cache when warm. Either way the common path needs no DB round trip.
 
     Raises:
     - 401 if header/token invalid or user not found.
     """
     if not authorization or not authorization.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Not authenticated")
-    token = authorization.split(" ", 1)[1].strip()
+    return await principal_from_token(db, authorization.split(" ", 1)[1].strip())
+
+
+# PUBLIC_INTERFACE
+async def principal_from_token(db: AsyncSession, token: Optional[str]) -> Principal:
+    """
+    Authenticate an access token; the single rule shared by HTTP (get_current_user) and WebSocket handshakes.
+
+    Parameters:
+    - db: AsyncSession used only when the principal is neither in the token (claims-only mode) nor cached
+    - token: encoded JWT
+
+    Returns:
+    - Principal of an active user
+
+    Raises:
+    - 401 if the token is missing, invalid, a refresh token, or names an unknown or inactive user.
+    """
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     try:
@@ -43,14 +105,14 @@ def get_current_user(
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
     sub = payload.get("sub")
-    if not sub:
+    # Refresh tokens are only exchangeable at POST /auth/refresh, never usable as credentials
+    if not sub or payload.get("typ") == "refresh":
         raise HTTPException(status_code=401, detail="Invalid token payload")
-    # sub is user id or email; try id int first then email
-    user: Optional[User] = None
-    if str(sub).isdigit():
-        user = db.query(User).filter(User.id == int(sub)).first()
-    if not user:
-        user = db.query(User).filter(User.email == str(sub)).first()
+    user: Optional[Principal] = None
+    if payload.get("typ") == "access" and get_settings().AUTH_CLAIMS_MODE:
+        user = Principal.from_claims(payload)
+    if user is None:
+        user = await resolve_principal(db, sub)
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
     return user
@@ -0,0 +1,56 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import MetricsRegistry, RequestStats, metrics, request_stats
+
+# Requests that never reach a route share one label so unknown paths cannot blow up series cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class QueryTimingMiddleware:
+    """
+    ASGI middleware measuring per-request SQL count, DB time and total time.
+
+    Notes:
+    - Binds a RequestStats to `request_stats`; the cursor hooks in src/db/session.py add to it.
+    - Adds `Server-Timing: db;dur=<ms>;desc="<n> queries", total;dur=<ms>` to the response head,
+      so DB time covers every statement issued before the response started.
+    - Once the body is sent, records the request in the metrics registry labeled by route template.
+    """
+
+    def __init__(
+        self, app: ASGIApp, registry: MetricsRegistry = metrics, exempt_paths: tuple[str, ...] = ("/metrics",)
+    ):
+        self.app = app
+        self.registry = registry
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = (
+                    f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", '
+                    f"total;dur={stats.elapsed() * 1000:.2f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats.reset(token)
+            self.registry.observe_request(scope["method"], _route_template(scope), status, stats, stats.elapsed())
@@ -3,8 +3,17 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
 
+from src.api.instrumentation import QueryTimingMiddleware
+from src.api.rate_limit import RateLimitMiddleware, rate_limit_options
 from src.core.config import get_settings
-from src.db.session import engine, db_session
+from src.core.catalog_cache import catalog_cache
+from src.core.metrics import metrics
+from src.core.notification_hub import notification_hub
+from src.core.notification_service import notification_writer
+from src.core.password_pool import password_pool
+from src.core.principal_cache import principal_cache
+from src.core.quiz_cache import quiz_cache
+from src.db.session import async_engine, engine, db_session, read_async_engine
 from src.db.base import Base
 from src.db.init_db import create_initial_data
 
@@ -19,6 +28,8 @@ from src.api.routers_portfolio import router as portfolio_router
 from src.api.routers_notifications import router as notifications_router
 from src.api.routers_jobtools import router as jobtools_router
 from src.api.routers_ws import router as ws_router
+from src.api.routers_search import router as search_router
+from src.api.routers_metrics import router as metrics_router
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +48,7 @@ openapi_tags = [
     {"name": "portfolio", "description": "Portfolio items"},
     {"name": "notifications", "description": "Notifications list"},
     {"name": "jobtools", "description": "Resume and interview tools"},
+    {"name": "search", "description": "Full-text search"},
     {"name": "websocket", "description": "Real-time notifications WebSocket"},
 ]
 
@@ -87,12 +99,46 @@ allow_origins = _augment_origins(allow_origins)
 allow_methods = _ensure_list_str(settings.ALLOWED_METHODS or ["*"], default=["*"])
 allow_headers = _ensure_list_str(settings.ALLOWED_HEADERS or ["*"], default=["*"])
 
+# Rate limiting is enabled only when RATE_LIMIT_MAX is configured
+_rate_limit = rate_limit_options()
+if _rate_limit is not None:
+    app.add_middleware(RateLimitMiddleware, **_rate_limit)
+
+# Outside the rate limiter so Server-Timing and /metrics cover every other middleware, including rate-limit
+# rejections
+if settings.METRICS_ENABLED is not False:
+    app.add_middleware(QueryTimingMiddleware)
+    metrics.register_gauges(
+        "Principal cache state.", lambda: {f"principal_cache_{k}": v for k, v in principal_cache.stats().items()}
+    )
+    metrics.register_gauges(
+        "Module catalog cache state.", lambda: {f"catalog_cache_{k}": v for k, v in catalog_cache.stats().items()}
+    )
+    metrics.register_gauges(
+        "Quiz payload cache state.", lambda: {f"quiz_cache_{k}": v for k, v in quiz_cache.stats().items()}
+    )
+    metrics.register_gauges(
+        "WebSocket notification hub state.",
+        lambda: {f"notification_hub_{k}": v for k, v in notification_hub.stats().items()},
+    )
+    metrics.register_gauges(
+        "Batched notification writer state.",
+        lambda: {f"notification_writer_{k}": v for k, v in notification_writer.stats().items()},
+    )
+    metrics.register_gauges(
+        "Password hashing pool state.",
+        lambda: {f"password_pool_{k}": v for k, v in password_pool.stats().items() if k != "kind"},
+    )
+
+# Added last, so outermost: every response, including 429s from the rate limiter, carries CORS headers, and
+# browsers may read the rate-limit headers
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
     allow_credentials=True,
     allow_methods=allow_methods,
     allow_headers=allow_headers,
+    expose_headers=["Retry-After", "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy"],
 )
 
 
@@ -121,6 +167,27 @@ def on_startup() -> None:
         logger.warning("DB seed failed on startup (continuing service): %s", exc)
 
 
+@app.on_event("startup")
+async def start_notification_hub() -> None:
+    """Start WebSocket notification fan-out (and, with NOTIFY_BACKEND=unix, join the cross-worker broker)."""
+    await notification_hub.start()
+    await notification_writer.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """
+    Write buffered notifications, stop notification fan-out and release the password hashing workers and
+    pooled async DB connections.
+    """
+    await notification_writer.stop()
+    await notification_hub.stop()
+    password_pool.shutdown()
+    await async_engine.dispose()
+    if read_async_engine is not async_engine:
+        await read_async_engine.dispose()
+
+
 # PUBLIC_INTERFACE
 @app.get("/", tags=["health"], summary="Health Check")
 def health_check():
@@ -144,4 +211,7 @@ app.include_router(mentorship_router)
 app.include_router(portfolio_router)
 app.include_router(notifications_router)
 app.include_router(jobtools_router)
+app.include_router(search_router)
 app.include_router(ws_router)
+if settings.METRICS_ENABLED is not False:
+    app.include_router(metrics_router)
@@ -0,0 +1,76 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """Validated cursor/limit query parameters."""
+
+    after: Optional[int]
+    limit: int
+
+
+# PUBLIC_INTERFACE
+def encode_cursor(last_id: int) -> str:
+    """Encode the keyset position after `last_id` as an opaque URL-safe token."""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+# PUBLIC_INTERFACE
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+    - HTTPException 400: the cursor is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        last_id = payload["id"]
+        if not isinstance(last_id, int) or isinstance(last_id, bool):
+            raise ValueError("cursor id must be an integer")
+        return last_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# PUBLIC_INTERFACE
+def page_params(
+    cursor: Optional[str] = Query(default=None, description="Opaque next_cursor from the previous page"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+) -> PageParams:
+    """FastAPI dependency parsing ?cursor=&limit= for keyset-paginated list endpoints."""
+    return PageParams(after=decode_cursor(cursor) if cursor else None, limit=limit)
+
+
+# PUBLIC_INTERFACE
+async def paginate(
+    db: AsyncSession, stmt: Select, key: Any, params: PageParams, descending: bool = False
+) -> tuple[list[Any], Optional[str]]:
+    """
+    Run one keyset page of stmt ordered by the unique, indexed column `key`.
+
+    The page seeks past the cursor with `key > after` (or `<` when descending) instead of OFFSET,
+    so every page costs the same index range scan however deep the client has paged.
+
+    Returns:
+    - (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if params.after is not None:
+        stmt = stmt.where(key < params.after if descending else key > params.after)
+    stmt = stmt.order_by(key.desc() if descending else key.asc()).limit(params.limit + 1)
+    rows = list((await db.scalars(stmt)).all())
+    if len(rows) <= params.limit:
+        return rows, None
+    rows = rows[: params.limit]
+    return rows, encode_cursor(getattr(rows[-1], key.key))
@@ -0,0 +1,268 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from jose import JWTError
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import get_settings
+from src.core.security import decode_token
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Allow `limit` requests per `window_s` seconds for one bucket."""
+
+    name: str
+    limit: int
+    window_s: int
+
+
+class _Shard:
+    """One lock-protected slice of the counter table."""
+
+    __slots__ = ("lock", "counters", "ops")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> [window_index, current_count, previous_count]
+        self.counters: dict[tuple, list[int]] = {}
+        self.ops = 0
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window counter limiter over a sharded in-memory table.
+
+    Each key keeps the count for the current fixed window and the previous one; the effective
+    count weights the previous window by how much of it still overlaps the sliding window.
+    Contention is limited to one of `shards` locks, and stale keys are swept opportunistically.
+    """
+
+    def __init__(self, shards: int = 64, sweep_every: int = 4096):
+        # power of two so the shard index is a mask
+        size = 1 << max(0, (shards - 1).bit_length())
+        self._mask = size - 1
+        self._shards = [_Shard() for _ in range(size)]
+        self._sweep_every = sweep_every
+
+    def hit(self, key: tuple, rule: RateLimitRule, now: Optional[float] = None) -> tuple[bool, int, float]:
+        """
+        Count one request for key under rule.
+
+        Returns:
+        - (allowed, remaining, reset_after_s)
+        """
+        now = time.time() if now is None else now
+        window = rule.window_s
+        idx = int(now // window)
+        elapsed = now - idx * window
+        shard = self._shards[hash(key) & self._mask]
+        with shard.lock:
+            entry = shard.counters.get(key)
+            if entry is None:
+                entry = shard.counters[key] = [idx, 0, 0]
+            elif entry[0] != idx:
+                entry[2] = entry[1] if entry[0] == idx - 1 else 0
+                entry[1] = 0
+                entry[0] = idx
+            weighted = entry[2] * (1.0 - elapsed / window) + entry[1]
+            allowed = weighted < rule.limit
+            if allowed:
+                entry[1] += 1
+                weighted += 1
+            shard.ops += 1
+            if shard.ops >= self._sweep_every:
+                shard.ops = 0
+                self._sweep(shard, now)
+        remaining = max(0, int(rule.limit - weighted))
+        if allowed or entry[1] >= rule.limit or not entry[2]:
+            reset_after = window - elapsed
+        else:
+            # previous-window weight decays linearly; solve for when one more request fits
+            reset_after = window * (1.0 - (rule.limit - entry[1]) / entry[2]) - elapsed
+        return allowed, remaining, max(0.0, reset_after)
+
+    @staticmethod
+    def _sweep(shard: _Shard, now: float) -> None:
+        # Caller holds the shard lock; drop keys idle for two or more windows.
+        stale = [k for k, v in shard.counters.items() if v[0] < int(now // k[-1]) - 1]
+        for k in stale:
+            del shard.counters[k]
+
+    def size(self) -> int:
+        """Number of tracked keys across all shards."""
+        return sum(len(s.counters) for s in self._shards)
+
+
+def parse_route_rules(spec: Optional[str], default_window_s: int) -> list[tuple[str, Optional[str], RateLimitRule]]:
+    """
+    Parse per-route overrides from a comma-separated spec.
+
+    Format: "[METHOD ]path_prefix=max[/window_s]", e.g. "POST /auth/login=10/60,/modules=120".
+    Returns (prefix, method or None, rule) tuples, longest prefix first.
+    """
+    rules: list[tuple[str, Optional[str], RateLimitRule]] = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part or "=" not in part:
+            continue
+        target, _, amount = part.rpartition("=")
+        target = target.strip()
+        method: Optional[str] = None
+        if " " in target:
+            method, target = target.split(None, 1)
+            method = method.upper()
+        limit_s, _, window_s = amount.partition("/")
+        try:
+            limit = int(limit_s)
+            window = int(window_s) if window_s else default_window_s
+        except ValueError:
+            continue
+        rules.append((target, method, RateLimitRule(name=f"{method or '*'} {target}", limit=limit, window_s=window)))
+    rules.sort(key=lambda r: (len(r[0]), r[1] is not None), reverse=True)
+    return rules
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing RATE_LIMIT_MAX requests per RATE_LIMIT_WINDOW_S.
+
+    Notes:
+    - Buckets are per route rule (longest matching prefix in RATE_LIMIT_ROUTES, else the default rule)
+      and per principal: the verified token subject when present, otherwise the client address.
+      Verified subjects are memoized per token until its exp (LRU-bounded) so the signature check runs
+      once per token; forged or expired tokens are not memoized and fall back to the client address
+      instead of opening fresh buckets.
+    - Responses carry RateLimit-Limit/Remaining/Reset/Policy; rejected requests get 429 with Retry-After.
+    - Only plain HTTP requests are limited; CORS preflights and exempt paths pass straight through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_rule: RateLimitRule,
+        route_rules: Optional[list[tuple[str, Optional[str], RateLimitRule]]] = None,
+        exempt_paths: tuple[str, ...] = ("/", "/docs", "/redoc", "/openapi.json"),
+        trust_proxy: bool = False,
+        limiter: Optional[SlidingWindowLimiter] = None,
+    ):
+        self.app = app
+        self.default_rule = default_rule
+        self.route_rules = route_rules or []
+        self.exempt_paths = frozenset(exempt_paths)
+        self.trust_proxy = trust_proxy
+        self.limiter = limiter or SlidingWindowLimiter()
+        self.rejected = 0
+        # raw token -> (subject, exp); valid tokens only, least recently used evicted first
+        self._token_subjects: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+        self._token_subjects_max = 10000
+
+    def _rule_for(self, method: str, path: str) -> RateLimitRule:
+        for prefix, rule_method, rule in self.route_rules:
+            if path.startswith(prefix) and (rule_method is None or rule_method == method):
+                return rule
+        return self.default_rule
+
+    def _token_subject(self, token: bytes) -> Optional[str]:
+        now = time.time()
+        cached = self._token_subjects.get(token)
+        if cached is not None:
+            if cached[1] > now:
+                self._token_subjects.move_to_end(token)
+                return cached[0]
+            del self._token_subjects[token]
+        try:
+            claims = decode_token(token.decode("latin-1"))
+        except JWTError:
+            # not memoized: the caller falls back to the IP key, and junk tokens must not evict real ones
+            return None
+        sub = claims.get("sub")
+        if not sub:
+            return None
+        subject = f"u:{sub}"
+        self._token_subjects[token] = (subject, float(claims.get("exp", math.inf)))
+        if len(self._token_subjects) > self._token_subjects_max:
+            self._token_subjects.popitem(last=False)
+        return subject
+
+    def _principal(self, scope: Scope) -> str:
+        forwarded: Optional[bytes] = None
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                if value[:7].lower() == b"bearer ":
+                    subject = self._token_subject(value[7:].strip())
+                    if subject:
+                        return subject
+            elif name == b"x-forwarded-for" and self.trust_proxy:
+                forwarded = value
+        if forwarded:
+            return "ip:" + forwarded.split(b",", 1)[0].strip().decode("latin-1")
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        path = scope["path"]
+        if method == "OPTIONS" or path in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._rule_for(method, path)
+        # the window is the last key element so the sweeper can age keys without a rule lookup
+        key = (rule.name, self._principal(scope), rule.window_s)
+        allowed, remaining, reset_after = self.limiter.hit(key, rule)
+        reset = str(math.ceil(reset_after))
+        limit_headers = [
+            (b"ratelimit-limit", str(rule.limit).encode()),
+            (b"ratelimit-remaining", str(remaining).encode()),
+            (b"ratelimit-reset", reset.encode()),
+            (b"ratelimit-policy", f"{rule.limit};w={rule.window_s}".encode()),
+        ]
+
+        if not allowed:
+            self.rejected += 1
+            body = b'{"detail":"Too many requests"}'
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"retry-after", reset.encode()),
+                        *limit_headers,
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message) -> None:  # noqa: ANN001
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + limit_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+# PUBLIC_INTERFACE
+def rate_limit_options() -> Optional[dict]:
+    """
+    Build RateLimitMiddleware kwargs from Settings, or None when RATE_LIMIT_MAX is unset (limiting disabled).
+    """
+    settings = get_settings()
+    if not settings.RATE_LIMIT_MAX:
+        return None
+    window = settings.RATE_LIMIT_WINDOW_S or 60
+    return {
+        "default_rule": RateLimitRule(name="default", limit=settings.RATE_LIMIT_MAX, window_s=window),
+        "route_rules": parse_route_rules(settings.RATE_LIMIT_ROUTES, window),
+        "trust_proxy": bool(settings.TRUST_PROXY),
+    }
@@ -1,19 +1,68 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from jose import JWTError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
-from src.api.schemas import LoginRequest, RegisterRequest, TokenResponse
-from src.core.security import create_access_token, verify_password, hash_password
-from src.models.user import User
+from src.api.schemas import LoginRequest, RefreshRequest, RegisterRequest, TokenResponse
+from src.core.config import get_settings
+from src.core.password_pool import PasswordPoolBusy, password_pool
+from src.core.principal_cache import Principal
+from src.core.security import create_access_token, create_refresh_token, decode_token
+from src.models.user import RefreshToken, User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+async def _issue_tokens(db: AsyncSession, user: User, replacing: Optional[RefreshToken] = None) -> TokenResponse:
+    """
+    Issue tokens for user.
+
+    Default mode returns a single 8h access token. Claims-only mode returns a short-lived access token
+    carrying the user's claims plus a refresh token whose jti is recorded (and chained from `replacing`).
+    """
+    settings = get_settings()
+    if not settings.AUTH_CLAIMS_MODE:
+        token = create_access_token(subject=str(user.id), expires_delta=timedelta(hours=8))
+        return TokenResponse(access_token=token, token_type="bearer")
+    ttl = timedelta(minutes=settings.ACCESS_TOKEN_TTL_MIN or 15)
+    access = create_access_token(subject=str(user.id), expires_delta=ttl, claims=Principal.from_user(user).to_claims())
+    refresh, jti, expires_at = create_refresh_token(user.id, timedelta(days=settings.REFRESH_TOKEN_TTL_DAYS or 14))
+    db.add(RefreshToken(jti=jti, user_id=user.id, expires_at=expires_at))
+    if replacing is not None:
+        replacing.replaced_by = jti
+    await db.flush()
+    return TokenResponse(
+        access_token=access,
+        token_type="bearer",
+        refresh_token=refresh,
+        expires_in=int(ttl.total_seconds()),
+    )
+
+
+async def _load_refresh_token(db: AsyncSession, token: str) -> RefreshToken:
+    try:
+        claims = decode_token(token)
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    if claims.get("typ") != "refresh" or not claims.get("jti"):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    row = await db.scalar(select(RefreshToken).where(RefreshToken.jti == claims["jti"]))
+    if not row:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    return row
+
+
+def _busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Authentication is busy, retry shortly", headers={"Retry-After": "1"})
+
+
 # PUBLIC_INTERFACE
 @router.post("/register", response_model=TokenResponse, summary="Register")
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db)):
     """
     Create a new user and return an access token.
 
@@ -21,34 +70,105 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     - email
     - password
     - full_name (optional)
+
+    Password hashing runs in the dedicated password pool; 503 is returned when its queue is full or its
+    workers are restarting.
     """
-    existing = db.query(User).filter(User.email == payload.email).first()
+    existing = await db.scalar(select(User).where(User.email == payload.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
+    try:
+        hashed = await password_pool.hash(payload.password)
+    except PasswordPoolBusy:
+        raise _busy()
     user = User(
         email=payload.email,
         full_name=payload.full_name,
-        hashed_password=hash_password(payload.password),
+        hashed_password=hashed,
         is_active=True,
     )
     db.add(user)
-    db.flush()
-    token = create_access_token(subject=str(user.id), expires_delta=timedelta(hours=8))
-    return TokenResponse(access_token=token, token_type="bearer")
+    await db.flush()
+    return await _issue_tokens(db, user)
 
 
 # PUBLIC_INTERFACE
 @router.post("/login", response_model=TokenResponse, summary="Login")
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
     """
     Authenticate user and return an access token.
 
     Body:
     - email
     - password
+
+    Password verification runs in the dedicated password pool; 503 is returned when its queue is full or its
+    workers are restarting.
     """
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.email == payload.email))
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    token = create_access_token(subject=str(user.id), expires_delta=timedelta(hours=8))
-    return TokenResponse(access_token=token, token_type="bearer")
+    try:
+        valid = await password_pool.verify(payload.password, user.hashed_password)
+    except PasswordPoolBusy:
+        raise _busy()
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    return await _issue_tokens(db, user)
+
+
+# PUBLIC_INTERFACE
+@router.post("/refresh", response_model=TokenResponse, summary="Refresh access token")
+async def refresh(payload: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Exchange a refresh token for a new access token and a rotated refresh token (claims-only auth mode).
+
+    Body:
+    - refresh_token
+
+    Revocation:
+    - The presented refresh token is revoked and replaced on every call.
+    - Presenting an already revoked token revokes every outstanding refresh token of that user. Rotation is a
+      conditional UPDATE, so when the same token is presented concurrently exactly one request wins and the
+      others are treated as reuse.
+    - Inactive users cannot refresh, so deactivation takes effect within one access token TTL.
+    """
+    row = await _load_refresh_token(db, payload.refresh_token)
+    now = datetime.utcnow()
+    if row.revoked_at is None and row.expires_at <= now:
+        raise HTTPException(status_code=401, detail="Refresh token expired")
+    # Claim the token with a conditional write: of two concurrent refreshes only one matches revoked_at IS NULL
+    claimed = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == row.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    if claimed.rowcount == 0:
+        # Reuse of a rotated token (sequential or concurrent) means it leaked; cut off the whole chain.
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == row.user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        await db.commit()
+        raise HTTPException(status_code=401, detail="Refresh token revoked")
+    user = await db.scalar(select(User).where(User.id == row.user_id))
+    if not user or not user.is_active:
+        await db.commit()
+        raise HTTPException(status_code=401, detail="User not found or inactive")
+    return await _issue_tokens(db, user, replacing=row)
+
+
+# PUBLIC_INTERFACE
+@router.post("/logout", summary="Revoke refresh token")
+async def logout(payload: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Revoke a refresh token so it can no longer be exchanged. Access tokens expire on their own.
+
+    Body:
+    - refresh_token
+    """
+    row = await _load_refresh_token(db, payload.refresh_token)
+    if row.revoked_at is None:
+        row.revoked_at = datetime.utcnow()
+    return {"status": "ok"}
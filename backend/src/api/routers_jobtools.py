@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user, get_db
 from src.api.schemas import (
@@ -8,14 +8,16 @@ from src.api.schemas import (
     ResumePreviewIn,
     ResumePreviewOut,
 )
-from src.models.user import User
+from src.core.principal_cache import Principal
 
 router = APIRouter(prefix="/jobtools", tags=["jobtools"])
 
 
 # PUBLIC_INTERFACE
 @router.post("/resume/preview", response_model=ResumePreviewOut, summary="Resume preview")
-def resume_preview(payload: ResumePreviewIn, _: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def resume_preview(
+    payload: ResumePreviewIn, _: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
     """
     Return a minimal preview summary and basic tips. No external services used.
     """
@@ -31,7 +33,9 @@ def resume_preview(payload: ResumePreviewIn, _: User = Depends(get_current_user)
 
 # PUBLIC_INTERFACE
 @router.post("/interview/simulate", response_model=InterviewSimulateOut, summary="Interview simulate")
-def interview_simulate(payload: InterviewSimulateIn, _: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def interview_simulate(
+    payload: InterviewSimulateIn, _: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
     """
     Return a small set of role-based mock interview questions (static demo).
     """
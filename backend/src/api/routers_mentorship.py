@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from src.api.deps import get_current_user, get_db
-from src.api.schemas import MentorOut, MentorshipRequestIn, MentorshipRequestOut
+from src.api.deps import get_current_user, get_db, get_read_db
+from src.api.pagination import PageParams, page_params, paginate
+from src.api.schemas import MentorOut, MentorshipRequestIn, MentorshipRequestOut, Page
+from src.core.notification_service import notify_after_commit
+from src.core.principal_cache import Principal
 from src.models.mentorship import MentorProfile, MentorshipRequest
 from src.models.user import User
 
@@ -10,12 +15,17 @@ router = APIRouter(prefix="/mentorship", tags=["mentorship"])
 
 
 # PUBLIC_INTERFACE
-@router.get("/mentors", response_model=list[MentorOut], summary="List mentors")
-def list_mentors(_: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@router.get("/mentors", response_model=Page[MentorOut], summary="List mentors")
+async def list_mentors(
+    page: PageParams = Depends(page_params),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Return available mentors with minimal info.
+    Return one page of available mentors with minimal info.
     """
-    profiles = db.query(MentorProfile).all()
+    stmt = select(MentorProfile).options(selectinload(MentorProfile.user))
+    profiles, next_cursor = await paginate(db, stmt, MentorProfile.id, page)
     out: list[MentorOut] = []
     for p in profiles:
         out.append(
@@ -26,15 +36,15 @@ def list_mentors(_: User = Depends(get_current_user), db: Session = Depends(get_
                 bio=p.bio,
             )
         )
-    return out
+    return Page[MentorOut](items=out, next_cursor=next_cursor)
 
 
 # PUBLIC_INTERFACE
 @router.post("/requests", response_model=MentorshipRequestOut, summary="Create mentorship request")
-def create_request(
+async def create_request(
     payload: MentorshipRequestIn,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a mentorship request to a mentor.
@@ -42,10 +52,12 @@ def create_request(
     if user.id == payload.mentor_id:
         raise HTTPException(status_code=400, detail="Cannot request yourself")
     # ensure mentor exists and is mentor
-    mentor = db.query(User).filter(User.id == payload.mentor_id, User.is_mentor.is_(True)).first()
+    mentor = await db.scalar(select(User).where(User.id == payload.mentor_id, User.is_mentor.is_(True)))
     if not mentor:
         raise HTTPException(status_code=404, detail="Mentor not found")
     req = MentorshipRequest(user_id=user.id, mentor_id=payload.mentor_id, message=payload.message)
     db.add(req)
-    db.flush()
+    # written by the batched notification writer once this transaction commits, then pushed to the mentor's sockets
+    notify_after_commit(db, mentor.id, f"New mentorship request from {user.full_name or user.email}")
+    await db.flush()
     return MentorshipRequestOut(id=req.id, mentor_id=req.mentor_id, status=req.status)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.core.metrics import metrics
+
+router = APIRouter(tags=["health"])
+
+
+# PUBLIC_INTERFACE
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics")
+def prometheus_metrics():
+    """
+    Request and database metrics in the Prometheus text exposition format.
+
+    Returns:
+    - http_requests_total, http_request_duration_seconds, db_query_duration_seconds and
+      db_queries_per_request labeled by method and route template, plus process gauges.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,34 +1,148 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable, Optional
 
-from src.api.deps import get_current_user, get_db
-from src.api.schemas import LessonOut, ModuleOut
-from src.models.content import Lesson, Module
-from src.models.user import User
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, LargeBinary, case, func, literal, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.content_delivery import stream_gzip_body
+from src.api.deps import get_current_user, get_db, get_read_db
+from src.api.pagination import PageParams, page_params, paginate
+from src.api.schemas import LessonOut, LessonSummaryOut, ModuleOut, ModuleOutlineOut, Page
+from src.core.catalog_cache import catalog_cache, etag_matches
+from src.core.principal_cache import Principal
+from src.db.types import compress_text
+from src.db.upsert import conflict_insert
+from src.models.content import Lesson, Module, Question, Quiz
+from src.models.tracking import LessonCompletion, Progress
 
 router = APIRouter(prefix="/modules", tags=["modules"])
 
 
+async def _catalog_response(
+    key: Hashable, if_none_match: Optional[str], build: Callable[[], Awaitable[BaseModel]]
+) -> Response:
+    """
+    Serve a catalog response from the pre-serialized cache, building and storing it on a miss.
+
+    Responses carry a strong ETag and `Cache-Control: private, no-cache` so clients revalidate;
+    a matching If-None-Match gets 304 without a body.
+    """
+    cached = catalog_cache.get(key)
+    if cached is None:
+        version = catalog_cache.version
+        body = (await build()).model_dump_json().encode()
+        etag = catalog_cache.put(key, body, version)
+    else:
+        etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # PUBLIC_INTERFACE
-@router.get("", response_model=list[ModuleOut], summary="List modules")
-def list_modules(_: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@router.get("", response_model=Page[ModuleOut], summary="List modules")
+async def list_modules(
+    page: PageParams = Depends(page_params),
+    if_none_match: Optional[str] = Header(default=None),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Return a minimal list of learning modules.
+    Return one page of learning modules ordered by id.
+
+    Parameters:
+    - cursor: next_cursor from the previous page (omit for the first page)
+    - limit: page size (default 50, max 200)
+    - If-None-Match: ETag from a previous response; answered with 304 when unchanged
     """
-    modules = db.query(Module).all()
-    return [ModuleOut(id=m.id, title=m.title, description=m.description) for m in modules]
+
+    async def build() -> Page[ModuleOut]:
+        modules, next_cursor = await paginate(db, select(Module), Module.id, page)
+        return Page[ModuleOut](
+            items=[ModuleOut(id=m.id, title=m.title, description=m.description) for m in modules],
+            next_cursor=next_cursor,
+        )
+
+    return await _catalog_response(("modules", page.after, page.limit), if_none_match, build)
 
 
 # PUBLIC_INTERFACE
 @router.get("/{module_id}", response_model=ModuleOut, summary="Module detail")
-def module_detail(module_id: int, _: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def module_detail(
+    module_id: int,
+    if_none_match: Optional[str] = Header(default=None),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Return a single module by id (ETag/If-None-Match aware, see list_modules).
+    """
+
+    async def build() -> ModuleOut:
+        m = await db.scalar(select(Module).where(Module.id == module_id))
+        if not m:
+            raise HTTPException(status_code=404, detail="Module not found")
+        return ModuleOut(id=m.id, title=m.title, description=m.description)
+
+    return await _catalog_response(("module", module_id), if_none_match, build)
+
+
+# PUBLIC_INTERFACE
+@router.get("/{module_id}/outline", response_model=ModuleOutlineOut, summary="Module outline")
+async def module_outline(
+    module_id: int,
+    if_none_match: Optional[str] = Header(default=None),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Return a single module by id.
+    Return a module with its ordered lessons (id/title/order only), its quiz id and question count.
+
+    Built from a single SQL statement: lessons come from an outer join walked in
+    ix_lessons_module_id_order_index order, and the quiz id/question count are uncorrelated scalar
+    subqueries evaluated once. Cached and ETag-aware like the other catalog endpoints.
     """
-    m = db.query(Module).filter(Module.id == module_id).first()
-    if not m:
-        raise HTTPException(status_code=404, detail="Module not found")
-    return ModuleOut(id=m.id, title=m.title, description=m.description)
+
+    async def build() -> ModuleOutlineOut:
+        quiz_id = select(func.min(Quiz.id)).where(Quiz.module_id == module_id).scalar_subquery()
+        question_count = select(func.count(Question.id)).where(Question.quiz_id == quiz_id).scalar_subquery()
+        rows = (
+            await db.execute(
+                select(
+                    Module.id,
+                    Module.title,
+                    Module.description,
+                    quiz_id.label("quiz_id"),
+                    question_count.label("question_count"),
+                    Lesson.id.label("lesson_id"),
+                    Lesson.title.label("lesson_title"),
+                    Lesson.order_index,
+                )
+                .outerjoin(Lesson, Lesson.module_id == Module.id)
+                .where(Module.id == module_id)
+                .order_by(Lesson.order_index, Lesson.id)
+            )
+        ).all()
+        if not rows:
+            raise HTTPException(status_code=404, detail="Module not found")
+        head = rows[0]
+        return ModuleOutlineOut(
+            id=head.id,
+            title=head.title,
+            description=head.description,
+            lessons=[
+                LessonSummaryOut(id=r.lesson_id, title=r.lesson_title, order_index=r.order_index)
+                for r in rows
+                if r.lesson_id is not None
+            ],
+            quiz_id=head.quiz_id,
+            question_count=head.question_count or 0,
+        )
+
+    return await _catalog_response(("outline", module_id), if_none_match, build)
 
 
 router_lessons = APIRouter(prefix="/lessons", tags=["lessons"])
@@ -36,11 +150,11 @@ router_lessons = APIRouter(prefix="/lessons", tags=["lessons"])
 
 # PUBLIC_INTERFACE
 @router_lessons.get("/{lesson_id}", response_model=LessonOut, summary="Get lesson")
-def get_lesson(lesson_id: int, _: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_lesson(lesson_id: int, _: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     """
     Return a lesson content by id.
     """
-    l = db.query(Lesson).filter(Lesson.id == lesson_id).first()
+    l = await db.scalar(select(Lesson).where(Lesson.id == lesson_id))
     if not l:
         raise HTTPException(status_code=404, detail="Lesson not found")
     return LessonOut(
@@ -52,35 +166,102 @@ def get_lesson(lesson_id: int, _: User = Depends(get_current_user), db: Session
     )
 
 
+# PUBLIC_INTERFACE
+@router_lessons.get(
+    "/{lesson_id}/content",
+    summary="Stream lesson body",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}}, 206: {"description": "Partial content"}},
+)
+async def get_lesson_content(
+    lesson_id: int,
+    accept_encoding: Optional[str] = Header(default=None),
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+    if_none_match: Optional[str] = Header(default=None),
+    if_range: Optional[str] = Header(default=None),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Stream a lesson's text body.
+
+    The body is stored gzip-compressed; clients sending `Accept-Encoding: gzip` get the stored bytes as-is
+    with `Content-Encoding: gzip`, others get it inflated on the fly. Single `Range: bytes=` requests
+    are answered with 206, and ETag/If-None-Match/If-Range are honored.
+    """
+    row = (
+        await db.execute(select(Lesson.id, type_coerce(Lesson.content, LargeBinary)).where(Lesson.id == lesson_id))
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    blob = row[1] if row[1] is not None else compress_text("")
+    return stream_gzip_body(blob, accept_encoding, range_header, if_none_match=if_none_match, if_range=if_range)
+
+
+def _progress_state(completed: ColumnElement, lesson_count: int) -> dict[str, ColumnElement]:
+    """progress_percent and status as SQL expressions of a completed-lessons count."""
+    done = completed >= lesson_count
+    return {
+        "progress_percent": case((done, 100.0), else_=completed * 100.0 / max(lesson_count, 1)),
+        "status": case((done, "completed"), else_="in_progress"),
+    }
+
+
 # PUBLIC_INTERFACE
 @router_lessons.post("/{lesson_id}/complete", summary="Complete lesson")
-def complete_lesson(lesson_id: int, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def complete_lesson(
+    lesson_id: int, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
     """
-    Mark a lesson as completed and update simple progress percent within its module.
+    Mark a lesson as completed and update the user's progress through its module.
+
+    Notes:
+    - Idempotent: a (user, lesson) completion is recorded once, so repeated or concurrent clicks count once.
+    - Constant work per call: the lesson lookup reads the module's denormalized lesson_count, and progress
+      is one INSERT .. ON CONFLICT DO UPDATE that increments completed_lessons atomically in the database.
     """
-    lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
-    if not lesson:
+    row = (
+        await db.execute(
+            select(Lesson.module_id, Module.lesson_count).join(Module, Module.id == Lesson.module_id).where(
+                Lesson.id == lesson_id
+            )
+        )
+    ).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Lesson not found")
+    module_id, lesson_count = row
+    now = datetime.utcnow()
 
-    # Update naive progress: percent based on number of lessons completed, tracked via current_lesson_id bump.
-    from sqlalchemy import func
-    from src.models.tracking import Progress  # local import to avoid cycles
+    recorded = await db.scalar(
+        conflict_insert(db, LessonCompletion)
+        .values(user_id=user.id, lesson_id=lesson_id, module_id=module_id, completed_at=now)
+        .on_conflict_do_nothing(index_elements=["user_id", "lesson_id"])
+        .returning(LessonCompletion.id)
+    )
+    added = 1 if recorded is not None else 0
 
-    total = db.query(func.count(Lesson.id)).filter(Lesson.module_id == lesson.module_id).scalar() or 1
-    prog = (
-        db.query(Progress)
-        .filter(Progress.user_id == user.id, Progress.module_id == lesson.module_id)
-        .first()
+    stmt = conflict_insert(db, Progress).values(
+        user_id=user.id,
+        module_id=module_id,
+        current_lesson_id=lesson_id,
+        completed_lessons=added,
+        updated_at=now,
+        **_progress_state(literal(added), lesson_count),
     )
-    if not prog:
-        prog = Progress(user_id=user.id, module_id=lesson.module_id, current_lesson_id=lesson.id, progress_percent=0.0)
-        db.add(prog)
-        db.flush()
-    prog.current_lesson_id = lesson.id
-    # naive increment: set progress to min(100, current index / total * 100)
-    idx = lesson.order_index if lesson.order_index else 1
-    percent = max(0.0, min(100.0, (idx / float(total)) * 100.0))
-    prog.progress_percent = percent
-    if percent >= 100.0:
-        prog.status = "completed"
-    return {"status": "ok", "progress_percent": round(prog.progress_percent, 2)}
+    completed = Progress.completed_lessons + added
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "module_id"],
+        set_={
+            "completed_lessons": completed,
+            **_progress_state(completed, lesson_count),
+            "current_lesson_id": stmt.excluded.current_lesson_id,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(Progress.completed_lessons, Progress.progress_percent)
+    progress = (await db.execute(stmt)).one()
+    return {
+        "status": "ok",
+        "progress_percent": round(float(progress.progress_percent), 2),
+        "completed_lessons": progress.completed_lessons,
+        "lesson_count": lesson_count,
+    }
@@ -1,8 +1,21 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import false, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_current_user, get_db
-from src.api.schemas import NotificationOut
+from src.api.deps import get_current_user, get_db, get_read_db
+from src.api.pagination import PageParams, page_params, paginate
+from src.api.schemas import (
+    BroadcastIn,
+    BroadcastOut,
+    MarkReadIn,
+    MarkReadOut,
+    NotificationOut,
+    Page,
+    UnreadCountOut,
+)
+from src.core.notification_service import broadcast_to_module
+from src.core.principal_cache import Principal
+from src.models.content import Module
 from src.models.extras import Notification
 from src.models.user import User
 
@@ -10,7 +23,86 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
 # PUBLIC_INTERFACE
-@router.get("", response_model=list[NotificationOut], summary="List my notifications")
-def list_notifications(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    rows = db.query(Notification).filter(Notification.user_id == user.id).order_by(Notification.id.desc()).all()
-    return [NotificationOut(id=n.id, message=n.message, is_read=n.is_read) for n in rows]
+@router.get("", response_model=Page[NotificationOut], summary="List my notifications")
+async def list_notifications(
+    page: PageParams = Depends(page_params),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Return one page of my notifications, newest first.
+    """
+    stmt = select(Notification).where(Notification.user_id == user.id)
+    rows, next_cursor = await paginate(db, stmt, Notification.id, page, descending=True)
+    return Page[NotificationOut](
+        items=[NotificationOut(id=n.id, message=n.message, is_read=n.is_read) for n in rows],
+        next_cursor=next_cursor,
+    )
+
+
+# PUBLIC_INTERFACE
+@router.get("/unread_count", response_model=UnreadCountOut, summary="Count my unread notifications")
+async def unread_count(user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
+    """
+    Return my unread notification count (for badges).
+
+    Notes:
+    - Read from the users.unread_notifications counter: one primary-key lookup, whatever the backlog size.
+    """
+    unread = await db.scalar(select(User.unread_notifications).where(User.id == user.id))
+    return UnreadCountOut(unread=max(unread or 0, 0))
+
+
+# PUBLIC_INTERFACE
+@router.post("/read", response_model=MarkReadOut, summary="Mark notifications read")
+async def mark_read(payload: MarkReadIn, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    """
+    Mark a list of my notifications (ids) or everything up to an id (up_to_id) as read.
+
+    Returns:
+    - marked: notifications that were unread before this call (ids that are already read, missing or owned by
+      someone else are ignored)
+    - unread: my remaining unread count
+
+    Notes:
+    - One UPDATE over ix_notifications_user_unread flips the rows, and the counter is lowered by the number of
+      rows it changed in the same transaction.
+    """
+    selector = Notification.id.in_(payload.ids) if payload.ids is not None else Notification.id <= payload.up_to_id
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user.id, Notification.is_read == false(), selector)
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    marked = result.rowcount
+    if marked:
+        unread = await db.scalar(
+            update(User)
+            .where(User.id == user.id)
+            .values(unread_notifications=User.unread_notifications - marked)
+            .returning(User.unread_notifications)
+        )
+    else:
+        unread = await db.scalar(select(User.unread_notifications).where(User.id == user.id))
+    return MarkReadOut(marked=marked, unread=max(unread or 0, 0))
+
+
+# PUBLIC_INTERFACE
+@router.post("/broadcast", response_model=BroadcastOut, summary="Notify every learner of a module")
+async def broadcast(
+    payload: BroadcastIn, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    """
+    Send a notification to every user with progress in a module (mentors only).
+
+    Notes:
+    - All rows are written by one INSERT ... SELECT; open sockets receive them in the background after the
+      commit, so the response does not wait for fan-out.
+    """
+    if not user.is_mentor:
+        raise HTTPException(status_code=403, detail="Mentor access required")
+    if await db.scalar(select(Module.id).where(Module.id == payload.module_id)) is None:
+        raise HTTPException(status_code=404, detail="Module not found")
+    recipients = await broadcast_to_module(db, payload.module_id, payload.message)
+    return BroadcastOut(recipients=recipients)
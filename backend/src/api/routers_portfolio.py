@@ -1,39 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_current_user, get_db
-from src.api.schemas import PortfolioItemIn, PortfolioItemOut
+from src.api.deps import get_current_user, get_db, get_read_db
+from src.api.pagination import PageParams, page_params, paginate
+from src.api.schemas import Page, PortfolioItemIn, PortfolioItemOut
+from src.core.principal_cache import Principal
 from src.models.extras import PortfolioItem
-from src.models.user import User
 
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
 
 # PUBLIC_INTERFACE
-@router.get("", response_model=list[PortfolioItemOut], summary="List my portfolio")
-def list_portfolio(user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    items = db.query(PortfolioItem).filter(PortfolioItem.user_id == user.id).all()
-    return [PortfolioItemOut(id=i.id, title=i.title, description=i.description, url=i.url) for i in items]
+@router.get("", response_model=Page[PortfolioItemOut], summary="List my portfolio")
+async def list_portfolio(
+    page: PageParams = Depends(page_params),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    stmt = select(PortfolioItem).where(PortfolioItem.user_id == user.id)
+    items, next_cursor = await paginate(db, stmt, PortfolioItem.id, page)
+    return Page[PortfolioItemOut](
+        items=[PortfolioItemOut(id=i.id, title=i.title, description=i.description, url=i.url) for i in items],
+        next_cursor=next_cursor,
+    )
 
 
 # PUBLIC_INTERFACE
 @router.post("", response_model=PortfolioItemOut, summary="Create portfolio item")
-def create_portfolio(payload: PortfolioItemIn, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def create_portfolio(
+    payload: PortfolioItemIn, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
     item = PortfolioItem(user_id=user.id, title=payload.title, description=payload.description, url=payload.url)
     db.add(item)
-    db.flush()
+    await db.flush()
     return PortfolioItemOut(id=item.id, title=item.title, description=item.description, url=item.url)
 
 
 # PUBLIC_INTERFACE
 @router.put("/{item_id}", response_model=PortfolioItemOut, summary="Update portfolio item")
-def update_portfolio(
+async def update_portfolio(
     item_id: int,
     payload: PortfolioItemIn,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    item = db.query(PortfolioItem).filter(PortfolioItem.id == item_id, PortfolioItem.user_id == user.id).first()
+    item = await db.scalar(select(PortfolioItem).where(PortfolioItem.id == item_id, PortfolioItem.user_id == user.id))
     if not item:
         raise HTTPException(status_code=404, detail="Not found")
     item.title = payload.title
@@ -44,9 +56,11 @@ def update_portfolio(
 
 # PUBLIC_INTERFACE
 @router.delete("/{item_id}", summary="Delete portfolio item")
-def delete_portfolio(item_id: int, user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    item = db.query(PortfolioItem).filter(PortfolioItem.id == item_id, PortfolioItem.user_id == user.id).first()
+async def delete_portfolio(
+    item_id: int, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    item = await db.scalar(select(PortfolioItem).where(PortfolioItem.id == item_id, PortfolioItem.user_id == user.id))
     if not item:
         raise HTTPException(status_code=404, detail="Not found")
-    db.delete(item)
+    await db.delete(item)
     return {"status": "ok"}
@@ -1,60 +1,311 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Optional
 
-from src.api.deps import get_current_user, get_db
-from src.api.schemas import QuizOut, QuizQuestionOut, QuizResult, QuizSubmitRequest
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import ColumnElement, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.api.deps import get_current_user, get_db, get_read_db
+from src.api.schemas import (
+    BulkAttemptResult,
+    BulkQuizSubmitRequest,
+    BulkQuizSubmitResponse,
+    QuizOut,
+    QuizQuestionOut,
+    LeaderboardEntryOut,
+    LeaderboardOut,
+    QuestionStatOut,
+    QuizResult,
+    QuizStatsOut,
+    QuizSubmitRequest,
+)
+from src.core.catalog_cache import catalog_cache
+from src.core.principal_cache import Principal
+from src.core.quiz_cache import QuizPayload, quiz_cache
+from src.db.leaderboard import ScoredAttempt, entrants, rank_of, record_best_scores
+from src.db.quiz_stats import COUNTERS, GradedAttempt, discrimination, record_answers
 from src.models.content import Question, Quiz
-from src.models.tracking import Attempt
+from src.models.tracking import Attempt, QuestionStat, QuizBestScore
 from src.models.user import User
 
 router = APIRouter(prefix="/quizzes", tags=["quizzes"])
 
 
+def _payload(quiz: Quiz) -> QuizPayload:
+    """Serialize a quiz (questions loaded) into its answer-free body plus answer key."""
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    body = QuizOut(
+        id=quiz.id,
+        title=quiz.title,
+        questions=[
+            QuizQuestionOut(
+                id=q.id,
+                prompt=q.prompt,
+                option_a=q.option_a,
+                option_b=q.option_b,
+                option_c=q.option_c,
+                option_d=q.option_d,
+            )
+            for q in questions
+        ],
+    ).model_dump_json().encode()
+    return QuizPayload(
+        quiz_id=quiz.id,
+        module_id=quiz.module_id,
+        body=body,
+        answers={q.id: q.correct_option.upper().strip() for q in questions},
+    )
+
+
+async def _load_quiz(db: AsyncSession, criterion: ColumnElement, for_module: bool = False) -> Optional[QuizPayload]:
+    """
+    Build (and cache) the payload of the lowest-id quiz matching criterion, questions eager-loaded in one
+    extra SELECT .. IN; None if there is no such quiz.
+    """
+    version = catalog_cache.version
+    quiz = await db.scalar(
+        select(Quiz).where(criterion).order_by(Quiz.id).limit(1).options(selectinload(Quiz.questions))
+    )
+    if quiz is None:
+        return None
+    payload = _payload(quiz)
+    quiz_cache.put(payload, version, for_module=for_module)
+    return payload
+
+
+async def _load_quizzes(db: AsyncSession, quiz_ids: set[int]) -> dict[int, QuizPayload]:
+    """Payloads for quiz_ids from the cache, loading every miss with one eager-loaded query."""
+    found: dict[int, QuizPayload] = {}
+    for quiz_id in quiz_ids:
+        cached = quiz_cache.get(quiz_id)
+        if cached is not None:
+            found[quiz_id] = cached
+    missing = quiz_ids - found.keys()
+    if missing:
+        version = catalog_cache.version
+        quizzes = await db.scalars(select(Quiz).where(Quiz.id.in_(missing)).options(selectinload(Quiz.questions)))
+        for quiz in quizzes:
+            found[quiz.id] = _payload(quiz)
+            quiz_cache.put(found[quiz.id], version)
+    return found
+
+
+def _grade(quiz: QuizPayload, answers: dict[int, str]) -> float:
+    """Percentage of the quiz's questions answered correctly (unknown question ids are ignored)."""
+    correct = 0
+    for qid, ans in answers.items():
+        expected = quiz.answers.get(qid)
+        if expected and isinstance(ans, str) and ans.upper().strip() == expected:
+            correct += 1
+    return (correct / max(1, len(quiz.answers))) * 100.0
+
+
+def _submitted_at(value: Optional[datetime], now: datetime) -> datetime:
+    """Client-reported attempt time as naive UTC (the column's convention), never later than now."""
+    if value is None:
+        return now
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(value, now)
+
+
 # PUBLIC_INTERFACE
 @router.post("/{module_id}/start", response_model=QuizOut, summary="Start quiz for module")
-def start_quiz(module_id: int, _: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def start_quiz(module_id: int, _: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     """
     Start a quiz for a given module. Returns quiz with questions (without answers).
+
+    The serialized payload is cached per quiz until a Quiz/Question write bumps the catalog version.
     """
-    quiz = db.query(Quiz).filter(Quiz.module_id == module_id).first()
-    if not quiz:
+    payload = quiz_cache.get_for_module(module_id) or await _load_quiz(db, Quiz.module_id == module_id, True)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
-    questions = [
-        QuizQuestionOut(
-            id=q.id,
-            prompt=q.prompt,
-            option_a=q.option_a,
-            option_b=q.option_b,
-            option_c=q.option_c,
-            option_d=q.option_d,
-        )
-        for q in quiz.questions
-    ]
-    return QuizOut(id=quiz.id, title=quiz.title, questions=questions)
+    return Response(content=payload.body, media_type="application/json")
 
 
 # PUBLIC_INTERFACE
 @router.post("/{quiz_id}/submit", response_model=QuizResult, summary="Submit quiz answers")
-def submit_quiz(
+async def submit_quiz(
     quiz_id: int,
     payload: QuizSubmitRequest,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Submit answers and return a simple score in [0..100].
+
+    Answers are checked against the cached answer key of the quiz (loaded with the start payload).
     """
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
-    if not quiz:
+    quiz = quiz_cache.get(quiz_id) or await _load_quiz(db, Quiz.id == quiz_id)
+    if quiz is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
-    q_by_id: dict[int, Question] = {q.id: q for q in quiz.questions}
-    correct = 0
-    for qid, ans in payload.answers.items():
-        q = q_by_id.get(qid)
-        if q and isinstance(ans, str) and ans.upper().strip() == q.correct_option.upper().strip():
-            correct += 1
-    total = max(1, len(q_by_id))
-    score = (correct / total) * 100.0
-    attempt = Attempt(user_id=user.id, quiz_id=quiz.id, score=score)
+    score = _grade(quiz, payload.answers)
+    attempt = Attempt(user_id=user.id, quiz_id=quiz.quiz_id, score=score)
     db.add(attempt)
+    await db.flush()
+    await record_answers(db, [GradedAttempt(attempt.id, quiz.answers, payload.answers, score)])
+    await record_best_scores(db, [ScoredAttempt(quiz.quiz_id, user.id, score, attempt.submitted_at)])
     return QuizResult(score=round(score, 2))
+
+
+# PUBLIC_INTERFACE
+@router.post("/submissions", response_model=BulkQuizSubmitResponse, summary="Submit many quiz attempts")
+async def submit_quiz_attempts(
+    payload: BulkQuizSubmitRequest,
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Record a batch of attempts (e.g. taken offline and replayed on reconnect) in one transaction.
+
+    Parameters:
+    - attempts: up to 500 of {quiz_id, answers, submitted_at?}, possibly across quizzes
+
+    Returns:
+    - recorded: number of stored attempts
+    - results: score per attempt in request order; attempts for unknown quizzes get an error and are not stored
+
+    Notes:
+    - Answer keys come from the quiz cache; all misses load in one query. The Attempt rows, their answers
+      and the question statistics are each written with a single executemany; leaderboards are updated
+      once per (quiz, user) with that user's best attempt of the batch.
+    """
+    quizzes = await _load_quizzes(db, {a.quiz_id for a in payload.attempts})
+    now = datetime.utcnow()
+    results: list[BulkAttemptResult] = []
+    rows: list[dict] = []
+    graded: list[tuple[QuizPayload, dict[int, str], float]] = []
+    for item in payload.attempts:
+        quiz = quizzes.get(item.quiz_id)
+        if quiz is None:
+            results.append(BulkAttemptResult(quiz_id=item.quiz_id, error="Quiz not found"))
+            continue
+        score = _grade(quiz, item.answers)
+        rows.append(
+            {
+                "user_id": user.id,
+                "quiz_id": item.quiz_id,
+                "score": score,
+                "submitted_at": _submitted_at(item.submitted_at, now),
+            }
+        )
+        graded.append((quiz, item.answers, score))
+        results.append(BulkAttemptResult(quiz_id=item.quiz_id, score=round(score, 2)))
+    if rows:
+        ids = await db.scalars(insert(Attempt).returning(Attempt.id, sort_by_parameter_order=True), rows)
+        await record_answers(
+            db,
+            [
+                GradedAttempt(attempt_id, quiz.answers, answers, score)
+                for attempt_id, (quiz, answers, score) in zip(ids.all(), graded)
+            ],
+        )
+        await record_best_scores(
+            db, [ScoredAttempt(row["quiz_id"], row["user_id"], row["score"], row["submitted_at"]) for row in rows]
+        )
+    return BulkQuizSubmitResponse(recorded=len(rows), results=results)
+
+
+# PUBLIC_INTERFACE
+@router.get("/{quiz_id}/stats", response_model=QuizStatsOut, summary="Per-question quiz statistics")
+async def quiz_stats(quiz_id: int, user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
+    """
+    Item statistics for every question of a quiz (mentors only, since option counts hint at the answers).
+
+    Returns:
+    - attempts: graded attempts seen by the quiz's questions
+    - questions: per question, correct_rate (difficulty), option_counts and discrimination (point-biserial
+      correlation with the attempt score; null while undefined)
+
+    Notes:
+    - Served from the question_stats running aggregates: one row per question, independent of attempt volume.
+    """
+    if not user.is_mentor:
+        raise HTTPException(status_code=403, detail="Mentor access required")
+    if await db.scalar(select(Quiz.id).where(Quiz.id == quiz_id)) is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    rows = (
+        await db.execute(
+            select(Question.id, QuestionStat)
+            .outerjoin(QuestionStat, QuestionStat.question_id == Question.id)
+            .where(Question.quiz_id == quiz_id)
+            .order_by(Question.id)
+        )
+    ).all()
+    questions = []
+    for question_id, stat in rows:
+        stat = stat or QuestionStat(question_id=question_id, **{name: 0 for name in COUNTERS})
+        separation = discrimination(stat)
+        questions.append(
+            QuestionStatOut(
+                question_id=question_id,
+                attempts=stat.attempts,
+                correct_rate=round(stat.correct / stat.attempts, 4) if stat.attempts else None,
+                option_counts={"A": stat.count_a, "B": stat.count_b, "C": stat.count_c, "D": stat.count_d},
+                discrimination=None if separation is None else round(separation, 4),
+            )
+        )
+    return QuizStatsOut(quiz_id=quiz_id, attempts=max((q.attempts for q in questions), default=0), questions=questions)
+
+
+# PUBLIC_INTERFACE
+@router.get("/{quiz_id}/leaderboard", response_model=LeaderboardOut, summary="Quiz leaderboard")
+async def quiz_leaderboard(
+    quiz_id: int,
+    limit: int = Query(default=10, ge=1, le=100),
+    user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Top best scores on a quiz and the caller's standing.
+
+    Parameters:
+    - limit: number of leaders (default 10, max 100)
+
+    Returns:
+    - entrants: users with at least one attempt
+    - top: leaders by best score; equal scores share a rank and are listed by who reached it first
+    - me: the caller's entry, or null if they have not attempted the quiz
+
+    Notes:
+    - Served from the quiz_best_scores ranking index (top-N) and the per-score user counts (rank), so the
+      cost does not grow with attempts or entrants.
+    """
+    if await db.scalar(select(Quiz.id).where(Quiz.id == quiz_id)) is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    leaders = (
+        await db.execute(
+            select(QuizBestScore, User.full_name)
+            .join(User, User.id == QuizBestScore.user_id)
+            .where(QuizBestScore.quiz_id == quiz_id)
+            .order_by(QuizBestScore.best_score.desc(), QuizBestScore.achieved_at, QuizBestScore.user_id)
+            .limit(limit)
+        )
+    ).all()
+    top: list[LeaderboardEntryOut] = []
+    for position, (row, full_name) in enumerate(leaders, start=1):
+        tied = top and top[-1].best_score == row.best_score
+        top.append(
+            LeaderboardEntryOut(
+                rank=top[-1].rank if tied else position,
+                user_id=row.user_id,
+                full_name=full_name,
+                best_score=row.best_score,
+                achieved_at=row.achieved_at,
+            )
+        )
+    me = next((entry for entry in top if entry.user_id == user.id), None)
+    if me is None:
+        mine = await db.scalar(
+            select(QuizBestScore).where(QuizBestScore.quiz_id == quiz_id, QuizBestScore.user_id == user.id)
+        )
+        if mine is not None:
+            me = LeaderboardEntryOut(
+                rank=await rank_of(db, quiz_id, mine.best_score),
+                user_id=user.id,
+                full_name=user.full_name,
+                best_score=mine.best_score,
+                achieved_at=mine.achieved_at,
+            )
+    return LeaderboardOut(quiz_id=quiz_id, entrants=await entrants(db, quiz_id), top=top, me=me)
@@ -0,0 +1,40 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.deps import get_current_user, get_read_db
+from src.api.schemas import SearchHitOut, SearchResponse
+from src.core.principal_cache import Principal
+from src.db.search_index import search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+# PUBLIC_INTERFACE
+@router.get("", response_model=SearchResponse, summary="Search modules, lessons and interview questions")
+async def search_content(
+    q: str = Query(..., min_length=1, max_length=200, description="Search words; the last word matches as a prefix"),
+    kind: Optional[Literal["module", "lesson", "interview_question"]] = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=50),
+    _: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Full-text search ranked by BM25 (title matches weigh more than body matches), with highlighted snippets.
+
+    Parameters:
+    - q: free text; all words must match
+    - kind: restrict to one document kind
+    - limit: max results (default 20, max 50)
+
+    Raises:
+    - 501: the configured database is not SQLite (the index is SQLite FTS5)
+    """
+    if db.bind.dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="Search requires the SQLite FTS5 index")
+    hits = await search(db, q, kind=kind, limit=limit)
+    return SearchResponse(
+        query=q,
+        items=[SearchHitOut(kind=h.kind, id=h.id, title=h.title, snippet=h.snippet, score=h.score) for h in hits],
+    )
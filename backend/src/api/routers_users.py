@@ -1,16 +1,16 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_current_user, get_db
+from src.api.deps import get_current_user, get_read_db
 from src.api.schemas import UserMe
-from src.models.user import User
+from src.core.principal_cache import Principal
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 # PUBLIC_INTERFACE
 @router.get("/me", response_model=UserMe, summary="Current user profile")
-def get_me(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_me(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     """
     Return minimal information for the currently authenticated user.
     """
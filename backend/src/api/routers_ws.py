@@ -1,15 +1,20 @@
+import asyncio
 import json
 from typing import Optional
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from jose import JWTError
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query
 
-from src.core.security import decode_token
-from src.db.session import db_session
-from src.models.user import User
+from src.api.deps import principal_from_token
+from src.core.config import get_settings
+from src.core.notification_hub import notification_hub
+from src.db.session import async_read_session
 
 router = APIRouter(tags=["websocket"])
 
+_settings = get_settings()
+# Seconds a socket may stay silent before it is closed (None = never)
+IDLE_TIMEOUT_S = (_settings.NOTIFY_IDLE_TIMEOUT_S if _settings.NOTIFY_IDLE_TIMEOUT_S is not None else 60) or None
+
 
 # PUBLIC_INTERFACE
 @router.get("/ws/usage", summary="WebSocket usage help", tags=["websocket"])
@@ -23,7 +28,10 @@ def websocket_usage():
 
     On connect:
     - Server validates token and sends a welcome message.
-    - Demo notifications may be sent periodically or triggered by actions.
+    - New notifications are pushed as they are created; a `resync` event means some were skipped.
+    - The server sends `{"type": "ping"}` periodically; reply `pong` (any message counts) or the socket is
+      closed with code 1001 once it has been silent for NOTIFY_IDLE_TIMEOUT_S.
+    - A worker at NOTIFY_MAX_CONNECTIONS closes new sockets with code 1013; retry later.
 
     Close:
     - Client should close cleanly when done.
@@ -31,7 +39,7 @@ def websocket_usage():
     return {
         "path": "/ws/notifications",
         "query": "token=<JWT access token>",
-        "note": "This is a demo notification stream. Use token from /auth/login.",
+        "note": "Pushes new notifications in real time. Use token from /auth/login. Answer server pings with pong.",
     }
 
 
@@ -46,45 +54,58 @@ async def ws_notifications(websocket: WebSocket, token: Optional[str] = Query(de
 
     Behavior:
     - Validates the token and associates the connection with the user.
-    - Sends a welcome event and awaits ping messages.
-    - Echoes back minimal demo notifications on 'ping'.
+    - Sends a welcome event, then pushes `{"type": "notification", ...}` for every notification committed
+      for the user in this process, without DB reads.
+    - A client that falls NOTIFY_QUEUE_MAX events behind gets `{"type": "resync"}` (or loses the oldest
+      events with NOTIFY_OVERFLOW_POLICY=drop_oldest) and should refetch GET /notifications.
+    - Replies `pong` to 'ping', ignores `pong` (heartbeat replies) and acks other messages.
+    - Heartbeat: the hub sends `{"type": "ping"}` every NOTIFY_HEARTBEAT_S; a socket that sends nothing for
+      NOTIFY_IDLE_TIMEOUT_S is closed with 1001, so dead peers do not hold a slot.
+    - Beyond NOTIFY_MAX_CONNECTIONS sockets in this worker, new ones are closed with 1013 (try again later).
+
+    Notes:
+    - Authentication is deps.principal_from_token, as for HTTP: refresh tokens are refused (close 1008), in
+      AUTH_CLAIMS_MODE the principal is built from the access token's claims without touching the DB, and
+      otherwise it comes from the principal cache or an async read session. A handshake never blocks the
+      loop serving other sockets.
     """
     # Accept early to allow clean close messages
     await websocket.accept()
-    if not token:
-        await websocket.send_json({"type": "error", "message": "token required"})
-        await websocket.close()
-        return
-    # Validate token and fetch user
+    # Same validation as HTTP requests (refresh tokens are rejected); 1008 = policy violation
     try:
-        payload = decode_token(token)
-    except JWTError:
-        await websocket.send_json({"type": "error", "message": "invalid token"})
-        await websocket.close()
-        return
-    sub = payload.get("sub")
-    user: Optional[User] = None
-    with db_session() as db:  # type: Session
-        if str(sub).isdigit():
-            user = db.query(User).filter(User.id == int(sub)).first()
-        if not user:
-            user = db.query(User).filter(User.email == str(sub)).first()
-    if not user or not user.is_active:
-        await websocket.send_json({"type": "error", "message": "user not found"})
-        await websocket.close()
+        async with async_read_session() as db:
+            user = await principal_from_token(db, token)
+    except HTTPException as exc:
+        await websocket.send_json({"type": "error", "message": exc.detail})
+        await websocket.close(code=1008)
         return
 
-    await websocket.send_json({"type": "welcome", "user_id": user.id})
+    if not notification_hub.has_capacity():
+        await websocket.send_json({"type": "error", "message": "too many connections"})
+        await websocket.close(code=1013)
+        return
 
+    # From here on only the connection's sender task writes to the socket (no await since the capacity check)
+    conn = notification_hub.register(user.id, websocket)
+    conn.offer(json.dumps({"type": "welcome", "user_id": user.id}))
     try:
         while True:
-            data = await websocket.receive_text()
-            # simple echo/trigger behavior
-            if data.strip().lower() == "ping":
-                await websocket.send_json({"type": "notification", "message": "pong"})
-            else:
-                # basic broadcast of receipt
-                await websocket.send_text(json.dumps({"type": "ack", "received": data}))
+            try:
+                data = await asyncio.wait_for(websocket.receive_text(), timeout=IDLE_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                notification_hub.idle_closed += 1
+                break
+            command = data.strip().lower()
+            if command == "ping":
+                conn.offer(json.dumps({"type": "notification", "message": "pong"}))
+            elif command != "pong":
+                conn.offer(json.dumps({"type": "ack", "received": data}))
     except WebSocketDisconnect:
         # client disconnected; simply exit
         return
+    finally:
+        await notification_hub.unregister(conn)
+    try:
+        await websocket.close(code=1001, reason="idle timeout")
+    except (RuntimeError, OSError):
+        pass  # the peer is already gone
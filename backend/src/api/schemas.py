@@ -1,11 +1,26 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, Field, model_validator
+
+T = TypeVar("T")
+
+
+# Pagination
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = Field(default=None, description="Pass as ?cursor= for the next page; null on the last")
 
 
 # Auth
 class TokenResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
+    refresh_token: Optional[str] = Field(default=None, description="Refresh token (claims-only auth mode)")
+    expires_in: Optional[int] = Field(default=None, description="Access token lifetime in seconds")
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 
 class LoginRequest(BaseModel):
@@ -34,6 +49,21 @@ class ModuleOut(BaseModel):
     description: Optional[str] = None
 
 
+class LessonSummaryOut(BaseModel):
+    id: int
+    title: str
+    order_index: int
+
+
+class ModuleOutlineOut(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    lessons: List[LessonSummaryOut]
+    quiz_id: Optional[int] = Field(default=None, description="Quiz served by POST /quizzes/{module_id}/start")
+    question_count: int = 0
+
+
 class LessonOut(BaseModel):
     id: int
     module_id: int
@@ -65,12 +95,67 @@ class QuizResult(BaseModel):
     score: float
 
 
+class QuizAttemptIn(BaseModel):
+    quiz_id: int
+    answers: dict[int, str] = Field(..., description="Map question_id -> selected option A-D")
+    submitted_at: Optional[datetime] = Field(
+        default=None, description="When the attempt was taken offline; defaults to the upload time"
+    )
+
+
+class BulkQuizSubmitRequest(BaseModel):
+    attempts: List[QuizAttemptIn] = Field(..., min_length=1, max_length=500)
+
+
+class QuestionStatOut(BaseModel):
+    question_id: int
+    attempts: int
+    correct_rate: Optional[float] = Field(default=None, description="Share of attempts answering correctly")
+    option_counts: dict[str, int]
+    discrimination: Optional[float] = Field(
+        default=None, description="Point-biserial correlation of correctness with the attempt score"
+    )
+
+
+class QuizStatsOut(BaseModel):
+    quiz_id: int
+    attempts: int
+    questions: List[QuestionStatOut]
+
+
+class LeaderboardEntryOut(BaseModel):
+    rank: int
+    user_id: int
+    full_name: Optional[str] = None
+    best_score: float
+    achieved_at: datetime
+
+
+class LeaderboardOut(BaseModel):
+    quiz_id: int
+    entrants: int
+    top: List[LeaderboardEntryOut]
+    me: Optional[LeaderboardEntryOut] = None
+
+
+class BulkAttemptResult(BaseModel):
+    quiz_id: int
+    score: Optional[float] = Field(default=None, description="Null when the attempt was rejected")
+    error: Optional[str] = None
+
+
+class BulkQuizSubmitResponse(BaseModel):
+    recorded: int = Field(..., description="Attempts stored")
+    results: List[BulkAttemptResult] = Field(..., description="One per submitted attempt, in request order")
+
+
 # Progress
 class ProgressOut(BaseModel):
     module_id: int
     status: str
     progress_percent: float
     current_lesson_id: Optional[int] = None
+    completed_lessons: int = 0
 
 
 # Mentorship
@@ -113,6 +198,49 @@ class NotificationOut(BaseModel):
     is_read: bool
 
 
+class UnreadCountOut(BaseModel):
+    unread: int
+
+
+class MarkReadIn(BaseModel):
+    ids: Optional[list[int]] = Field(default=None, max_length=500, description="Mark these notifications read")
+    up_to_id: Optional[int] = Field(default=None, description="Mark every notification with id <= up_to_id read")
+
+    @model_validator(mode="after")
+    def _one_selector(self) -> "MarkReadIn":
+        if (self.ids is None) == (self.up_to_id is None):
+            raise ValueError("Provide exactly one of ids or up_to_id")
+        return self
+
+
+class MarkReadOut(BaseModel):
+    marked: int = Field(..., description="Notifications that changed from unread to read")
+    unread: int
+
+
+class BroadcastIn(BaseModel):
+    module_id: int
+    message: str = Field(..., min_length=1, max_length=2000)
+
+
+class BroadcastOut(BaseModel):
+    recipients: int = Field(..., description="Users with progress in the module, one notification each")
+
+
+# Search
+class SearchHitOut(BaseModel):
+    kind: str = Field(..., description="module, lesson or interview_question")
+    id: int
+    title: str
+    snippet: str = Field(..., description="Body excerpt with matches wrapped in <mark></mark>")
+    score: float = Field(..., description="Relevance (higher is better)")
+
+
+class SearchResponse(BaseModel):
+    query: str
+    items: List[SearchHitOut]
+
+
 # Job tools
 class ResumePreviewIn(BaseModel):
     content: str = Field(..., description="Raw resume text/markdown")
@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.models.content import Lesson, Module, Question, Quiz
+
+# ORM classes whose writes change catalog responses
+CATALOG_MODELS: tuple[type, ...] = (Module, Lesson, Quiz, Question)
+
+
+# PUBLIC_INTERFACE
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the exact response bytes."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+# PUBLIC_INTERFACE
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header lists etag (weak comparison, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+class CatalogCache:
+    """
+    Versioned cache of pre-serialized catalog responses (module list pages, details and outlines).
+
+    Notes:
+    - Entries hold the encoded JSON body and its ETag, so a hit costs neither a query nor a JSON encode.
+    - Any Module/Lesson/Quiz/Question write committed through an ORM session bumps `version` and drops
+      every entry. A response built while a bump happened is not stored (see `put`), so stale bytes never
+      outlive a write.
+    - Writes made by other processes are only picked up after `ttl_s`; bulk Core loaders may call bump().
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_s: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.version = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bumps = 0
+
+    def get(self, key: Hashable) -> Optional[tuple[str, bytes]]:
+        """Return (etag, body) for key, or None on miss/expiry."""
+        if self.maxsize <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: Hashable, body: bytes, version: int) -> str:
+        """
+        Store body under key and return its ETag.
+
+        Parameters:
+        - version: value of `self.version` read before the response was built; if the catalog changed
+          since, the body may predate the write and is returned uncached.
+        """
+        etag = make_etag(body)
+        if self.maxsize <= 0:
+            return etag
+        with self._lock:
+            if version != self.version:
+                return etag
+            self._entries[key] = (time.monotonic() + self.ttl_s, etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return etag
+
+    def bump(self) -> None:
+        """Advance the catalog version and drop every cached response."""
+        with self._lock:
+            self.version += 1
+            self.bumps += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return a point-in-time view of size and counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bumps": self.bumps,
+            }
+
+
+_settings = get_settings()
+
+# Process-wide cache used by the modules router
+catalog_cache = CatalogCache(
+    maxsize=_settings.CATALOG_CACHE_MAX if _settings.CATALOG_CACHE_MAX is not None else 1024,
+    ttl_s=_settings.CATALOG_CACHE_TTL_S if _settings.CATALOG_CACHE_TTL_S is not None else 300,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_writes(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Flag the transaction when it inserts, updates or deletes catalog rows."""
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, CATALOG_MODELS):
+            session.info["catalog_changed"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_catalog_version(session: Session) -> None:
+    """Invalidate cached catalog responses once the write is visible to readers."""
+    if session.info.pop("catalog_changed", False):
+        catalog_cache.bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_writes(session: Session) -> None:
+    """Forget the pending bump when the transaction is rolled back."""
+    session.info.pop("catalog_changed", None)
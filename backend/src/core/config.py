@@ -38,6 +38,45 @@ class Settings(BaseSettings):
         description="SQLAlchemy database URL. e.g., sqlite:///./app.db or postgres://...",
     )
 
+    ASYNC_DATABASE_URL: str | None = Field(
+        default=None,
+        description="Async SQLAlchemy URL for the request path; derived from a SQLite DATABASE_URL when unset",
+        alias="async_database_url",
+    )
+
+    READ_DATABASE_URL: str | None = Field(
+        default=None,
+        description="Database URL for read-only endpoints (e.g. a replica); SQLite defaults to mode=ro on DATABASE_URL",
+        alias="read_database_url",
+    )
+
+    # Connection pool sizing (QueuePool); unset values keep SQLAlchemy defaults (5 + 10 overflow, 30s timeout)
+    DB_POOL_SIZE: int | None = Field(default=None, description="DB pool size", alias="db_pool_size")
+    DB_MAX_OVERFLOW: int | None = Field(default=None, description="DB pool max overflow", alias="db_max_overflow")
+    DB_POOL_TIMEOUT_S: int | None = Field(
+        default=None, description="DB pool checkout timeout", alias="db_pool_timeout_s"
+    )
+    DB_POOL_RECYCLE_S: int | None = Field(
+        default=None, description="DB connection recycle age", alias="db_pool_recycle_s"
+    )
+
+    # SQLite tuning applied on connect (see src/db/session.sqlite_pragmas)
+    SQLITE_PROFILE: str | None = Field(
+        default="production", description="SQLite tuning profile: production or safe", alias="sqlite_profile"
+    )
+    SQLITE_JOURNAL_MODE: str | None = Field(default=None, description="journal_mode (WAL)", alias="sqlite_journal_mode")
+    SQLITE_SYNCHRONOUS: str | None = Field(default=None, description="synchronous (NORMAL)", alias="sqlite_synchronous")
+    SQLITE_BUSY_TIMEOUT_MS: int | None = Field(
+        default=None, description="busy_timeout ms (5000)", alias="sqlite_busy_timeout_ms"
+    )
+    SQLITE_CACHE_SIZE_KB: int | None = Field(
+        default=None, description="Page cache KiB per connection (65536)", alias="sqlite_cache_size_kb"
+    )
+    SQLITE_MMAP_SIZE: int | None = Field(
+        default=None, description="mmap_size bytes (256 MiB)", alias="sqlite_mmap_size"
+    )
+    SQLITE_TEMP_STORE: str | None = Field(default=None, description="temp_store (MEMORY)", alias="sqlite_temp_store")
+
     # Explicit runtime-injected config (aliases kept to tolerate varied env naming)
     BACKEND_URL: str | None = Field(default=None, description="Public backend URL base", alias="backend_url")
     FRONTEND_URL: str | None = Field(default=None, description="Public frontend URL base", alias="frontend_url")
@@ -69,8 +108,109 @@ class Settings(BaseSettings):
     RATE_LIMIT_MAX: int | None = Field(
         default=None, description="Rate limit max requests per window", alias="rate_limit_max"
     )
+    RATE_LIMIT_ROUTES: str | None = Field(
+        default=None,
+        description="Per-route overrides, e.g. 'POST /auth/login=10/60,/modules=120'",
+        alias="rate_limit_routes",
+    )
     PORT: int | None = Field(default=3001, description="Service port", alias="port")
 
+    # Claims-only auth: short-lived access tokens carry the user's flags so requests skip the users table
+    AUTH_CLAIMS_MODE: bool | None = Field(
+        default=False,
+        description="Embed user claims in access tokens and issue refresh tokens",
+        alias="auth_claims_mode",
+    )
+    ACCESS_TOKEN_TTL_MIN: int | None = Field(
+        default=15, description="Access token TTL minutes in claims-only mode", alias="access_token_ttl_min"
+    )
+    REFRESH_TOKEN_TTL_DAYS: int | None = Field(
+        default=14, description="Refresh token TTL days in claims-only mode", alias="refresh_token_ttl_days"
+    )
+
+    # Authenticated principal cache (see src/core/principal_cache.py); set max to 0 to disable
+    PRINCIPAL_CACHE_MAX: int | None = Field(
+        default=10000, description="Max cached principals (LRU bound)", alias="principal_cache_max"
+    )
+    PRINCIPAL_CACHE_TTL_S: int | None = Field(
+        default=60, description="Principal cache entry TTL seconds", alias="principal_cache_ttl_s"
+    )
+
+    # Pre-serialized module catalog responses (see src/core/catalog_cache.py); set max to 0 to disable
+    CATALOG_CACHE_MAX: int | None = Field(
+        default=1024, description="Max cached catalog responses", alias="catalog_cache_max"
+    )
+    CATALOG_CACHE_TTL_S: int | None = Field(
+        default=300,
+        description="Catalog cache entry TTL seconds (bounds staleness across workers)",
+        alias="catalog_cache_ttl_s",
+    )
+    # Serialized quiz payloads and answer keys (see src/core/quiz_cache.py); expire with CATALOG_CACHE_TTL_S
+    QUIZ_CACHE_MAX: int | None = Field(
+        default=512, description="Max cached quizzes (payload + answer key)", alias="quiz_cache_max"
+    )
+
+    # WebSocket notification fan-out (see src/core/notification_hub.py)
+    NOTIFY_QUEUE_MAX: int | None = Field(
+        default=100, description="Max queued events per notification socket", alias="notify_queue_max"
+    )
+    NOTIFY_OVERFLOW_POLICY: str | None = Field(
+        default="coalesce",
+        description="Full socket queue handling: coalesce (replace with one resync event) or drop_oldest",
+        alias="notify_overflow_policy",
+    )
+    NOTIFY_BACKEND: str | None = Field(
+        default="memory",
+        description="Notification pub/sub: memory (one worker) or unix (broker shared by all workers)",
+        alias="notify_backend",
+    )
+    NOTIFY_SOCKET_PATH: str | None = Field(
+        default=None,
+        description="Unix socket of the notification broker (default /tmp/skillbridge-notify.sock)",
+        alias="notify_socket_path",
+    )
+    NOTIFY_MAX_CONNECTIONS: int | None = Field(
+        default=10000,
+        description="Max notification sockets per worker (0 = unlimited); extra clients are closed with 1013",
+        alias="notify_max_connections",
+    )
+    NOTIFY_HEARTBEAT_S: int | None = Field(
+        default=25,
+        description="Interval of server ping events on notification sockets (0 = off)",
+        alias="notify_heartbeat_s",
+    )
+    NOTIFY_IDLE_TIMEOUT_S: int | None = Field(
+        default=60,
+        description="Close notification sockets that send nothing (not even a pong) for this long (0 = never)",
+        alias="notify_idle_timeout_s",
+    )
+    NOTIFY_WRITE_BATCH: int | None = Field(
+        default=500, description="Rows per batched notification insert", alias="notify_write_batch"
+    )
+    NOTIFY_WRITE_INTERVAL_MS: int | None = Field(
+        default=50,
+        description="Max wait before a partial notification batch is written (src/core/notification_service.py)",
+        alias="notify_write_interval_ms",
+    )
+
+    # Dedicated bcrypt executor (see src/core/password_pool.py)
+    PASSWORD_HASH_EXECUTOR: str | None = Field(
+        default="process", description="Password hashing executor: process or thread", alias="password_hash_executor"
+    )
+    PASSWORD_HASH_WORKERS: int | None = Field(
+        default=None, description="Password hashing workers (default min(4, cpu count))", alias="password_hash_workers"
+    )
+    PASSWORD_HASH_MAX_PENDING: int | None = Field(
+        default=None,
+        description="Max queued+running hash jobs before 503 (default workers*16)",
+        alias="password_hash_max_pending",
+    )
+
+    # Request/DB instrumentation (see src/core/metrics.py)
+    METRICS_ENABLED: bool | None = Field(
+        default=True, description="Record per-request query stats, Server-Timing and /metrics", alias="metrics_enabled"
+    )
+
     # React-style variables (present in env but backend doesn't use them, declared to avoid 'extra' errors)
     REACT_APP_API_BASE: str | None = Field(default=None, description="React app API base")
     REACT_APP_BACKEND_URL: str | None = Field(default=None, description="React app backend URL")
@@ -118,6 +258,28 @@ class Settings(BaseSettings):
         "RATE_LIMIT_MAX",
         "CORS_MAX_AGE",
         "PORT",
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT_S",
+        "DB_POOL_RECYCLE_S",
+        "SQLITE_BUSY_TIMEOUT_MS",
+        "SQLITE_CACHE_SIZE_KB",
+        "SQLITE_MMAP_SIZE",
+        "PRINCIPAL_CACHE_MAX",
+        "PRINCIPAL_CACHE_TTL_S",
+        "CATALOG_CACHE_MAX",
+        "CATALOG_CACHE_TTL_S",
+        "QUIZ_CACHE_MAX",
+        "NOTIFY_QUEUE_MAX",
+        "NOTIFY_MAX_CONNECTIONS",
+        "NOTIFY_HEARTBEAT_S",
+        "NOTIFY_IDLE_TIMEOUT_S",
+        "NOTIFY_WRITE_BATCH",
+        "NOTIFY_WRITE_INTERVAL_MS",
+        "ACCESS_TOKEN_TTL_MIN",
+        "REFRESH_TOKEN_TTL_DAYS",
+        "PASSWORD_HASH_WORKERS",
+        "PASSWORD_HASH_MAX_PENDING",
         mode="before",
     )
     @classmethod
@@ -130,7 +292,7 @@ class Settings(BaseSettings):
         except Exception:
             return v
 
-    @field_validator("TRUST_PROXY", mode="before")
+    @field_validator("TRUST_PROXY", "AUTH_CLAIMS_MODE", "METRICS_ENABLED", mode="before")
     @classmethod
     def parse_bool(cls, v):
         """Cast common truthy/falsey string values to bool."""
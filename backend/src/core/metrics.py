@@ -0,0 +1,163 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional
+
+
+class RequestStats:
+    """Mutable per-request counters; the DB hooks add to the instance bound in `request_stats`."""
+
+    __slots__ = ("started", "queries", "db_time")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started
+
+
+# Bound by the request middleware; greenlets spawned by the async engine inherit the context.
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# PUBLIC_INTERFACE
+def record_query(duration: float) -> None:
+    """Attribute one executed statement to the current request, if any (startup/scripts have none)."""
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += duration
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram with one series per label tuple."""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...], buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        """Record value for the series identified by label_values."""
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # [per-bucket counts (+Inf last), sum, count]
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        """Exposition lines for every series."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(k, list(v[0]), v[1], v[2]) for k, v in sorted(self._series.items())]
+        for label_values, counts, total, count in snapshot:
+            base = _labels(self.labels, label_values)
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else _num(bound)
+                lines.append(f'{self.name}_bucket{{{base}{"," if base else ""}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{base}}} {_num(total)}")
+            lines.append(f"{self.name}_count{{{base}}} {count}")
+        return lines
+
+
+class Counter:
+    """Prometheus counter with one value per label tuple."""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values: tuple[str, ...], amount: float = 1) -> None:
+        """Add amount to the series identified by label_values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        """Exposition lines for every series."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            snapshot = sorted(self._values.items())
+        lines += [f"{self.name}{{{_labels(self.labels, k)}}} {_num(v)}" for k, v in snapshot]
+        return lines
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in values)
+    return ",".join(f'{n}="{v}"' for n, v in zip(names, escaped))
+
+
+def _num(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """
+    Request-level metrics rendered in the Prometheus text format.
+
+    Collectors registered with `register_gauges` are called at scrape time and return
+    {metric_name: value} for point-in-time gauges (cache sizes, queue depth, ...).
+    """
+
+    def __init__(self):
+        labels = ("method", "route")
+        self.requests = Counter(
+            "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "Total request time by route template.",
+            labels,
+            (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+        )
+        self.db_time = Histogram(
+            "db_query_duration_seconds",
+            "Time spent executing SQL per request.",
+            labels,
+            (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+        )
+        self.db_queries = Histogram(
+            "db_queries_per_request", "SQL statements executed per request.", labels, (0, 1, 2, 3, 5, 10, 20, 50, 100)
+        )
+        self._gauges: list[tuple[str, Callable[[], dict[str, float]]]] = []
+
+    def observe_request(self, method: str, route: str, status: int, stats: RequestStats, total: float) -> None:
+        """Record one finished request."""
+        labels = (method, route)
+        self.requests.inc((method, route, str(status)))
+        self.duration.observe(labels, total)
+        self.db_time.observe(labels, stats.db_time)
+        self.db_queries.observe(labels, stats.queries)
+
+    def register_gauges(self, help_text: str, collector: Callable[[], dict[str, float]]) -> None:
+        """Expose the numeric values returned by collector as gauges."""
+        self._gauges.append((help_text, collector))
+
+    def render(self) -> str:
+        """Full exposition document."""
+        lines: list[str] = []
+        for metric in (self.requests, self.duration, self.db_time, self.db_queries):
+            lines += metric.render()
+        for help_text, collector in self._gauges:
+            for name, value in collector().items():
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {_num(value)}"]
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry scraped by GET /metrics
+metrics = MetricsRegistry()
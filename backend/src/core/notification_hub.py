@@ -0,0 +1,289 @@
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.websockets import WebSocket
+
+from src.core.config import get_settings
+from src.core.notification_pubsub import MemoryBackend, UnixSocketBackend, make_backend
+from src.models.extras import Notification
+
+OVERFLOW_POLICIES = ("coalesce", "drop_oldest")
+PING_EVENT = json.dumps({"type": "ping"})
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class Connection:
+    """
+    One WebSocket registered with the hub, with a bounded queue drained by its own sender task.
+
+    Only the sender task writes to the socket, so a slow client never blocks publishers or other sockets.
+    """
+
+    def __init__(self, hub: "NotificationHub", user_id: int, websocket: WebSocket):
+        self.hub = hub
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=hub.queue_max)
+        self.queued_bytes = 0
+        self.dropped = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the sender task on the running loop."""
+        self._task = asyncio.create_task(self._sender())
+
+    async def stop(self) -> None:
+        """Cancel the sender task (pending events are discarded)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def offer(self, text: str) -> bool:
+        """
+        Enqueue an encoded event without waiting. Returns False if an event was discarded to make room.
+
+        Notes:
+        - coalesce: a full queue is replaced by one `{"type": "resync"}` event telling the client to refetch
+          GET /notifications; events published after it are queued normally.
+        - drop_oldest: the oldest queued event makes room for the new one.
+        """
+        try:
+            self.queue.put_nowait(text)
+            self.queued_bytes += len(text)
+            return True
+        except asyncio.QueueFull:
+            pass
+        if self.hub.overflow_policy == "drop_oldest":
+            self.queued_bytes += len(text) - len(self.queue.get_nowait())
+            self.dropped += 1
+            self.queue.put_nowait(text)
+            return False
+        discarded = self.queue.qsize() + 1
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.dropped += discarded
+        resync = json.dumps({"type": "resync", "dropped": discarded})
+        self.queued_bytes = len(resync)
+        self.queue.put_nowait(resync)
+        return False
+
+    async def _sender(self) -> None:
+        try:
+            while True:
+                text = await self.queue.get()
+                self.queued_bytes -= len(text)
+                await self.websocket.send_text(text)
+        except (asyncio.CancelledError, Exception):
+            # cancelled on unregister, or the peer went away (the receive loop notices and unregisters)
+            return
+
+
+class NotificationHub:
+    """
+    Registry of live notification sockets keyed by user id, with non-blocking fan-out.
+
+    Notes:
+    - publish() encodes an event once and hands it to the pub/sub backend (src/core/notification_pubsub.py),
+      which calls back into every worker's hub; the hub offers it to the user's local sockets. Neither step
+      touches the database or awaits a client.
+    - Must be driven from the event loop that owns the sockets; publishes from other threads (sync
+      sessions in the threadpool) are handed over with call_soon_threadsafe.
+    - One heartbeat task offers a `{"type": "ping"}` event to every socket each `heartbeat_s`, so live
+      clients have something to answer and dead peers surface as failed sends or idle receive loops.
+    - At most `max_connections` sockets (0 = unlimited) are registered per worker; see has_capacity().
+    """
+
+    def __init__(
+        self,
+        queue_max: int = 100,
+        overflow_policy: str = "coalesce",
+        backend: Optional[MemoryBackend | UnixSocketBackend] = None,
+        max_connections: int = 0,
+        heartbeat_s: float = 0.0,
+    ):
+        self.queue_max = max(1, queue_max)
+        self.overflow_policy = overflow_policy if overflow_policy in OVERFLOW_POLICIES else "coalesce"
+        self.backend = backend or MemoryBackend()
+        self.max_connections = max(0, max_connections)
+        self.heartbeat_s = max(0.0, heartbeat_s)
+        self._connections: dict[int, set[Connection]] = {}
+        self._count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._rss_at_start = 0
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+        self.rejected = 0
+        self.idle_closed = 0
+
+    async def start(self) -> None:
+        """Bind the hub to the running loop, start the pub/sub backend and the heartbeat (app startup)."""
+        self._loop = asyncio.get_running_loop()
+        self._rss_at_start = _rss_bytes()
+        await self.backend.start(self._deliver)
+        if self.heartbeat_s:
+            self._heartbeat = asyncio.create_task(self._ping_all())
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the backend; later publishes are dropped (app shutdown)."""
+        self._loop = None
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        await self.backend.stop()
+
+    def has_capacity(self) -> bool:
+        """True while another socket may register; counts rejections for the gauges when not."""
+        if self.max_connections and self._count >= self.max_connections:
+            self.rejected += 1
+            return False
+        return True
+
+    def register(self, user_id: int, websocket: WebSocket) -> Connection:
+        """Attach an accepted socket to user_id and start its sender; call from the event loop."""
+        conn = Connection(self, user_id, websocket)
+        conn.start()
+        with self._lock:
+            self._connections.setdefault(user_id, set()).add(conn)
+            self._count += 1
+        return conn
+
+    async def unregister(self, conn: Connection) -> None:
+        """Detach a socket and stop its sender."""
+        with self._lock:
+            peers = self._connections.get(conn.user_id)
+            if peers is not None and conn in peers:
+                peers.discard(conn)
+                self._count -= 1
+                if not peers:
+                    del self._connections[conn.user_id]
+        await conn.stop()
+
+    def publish(self, user_id: int, payload: dict[str, Any]) -> None:
+        """
+        Send an event to every socket of user_id, in whichever worker holds it; safe from any thread.
+        Dropped before start() and after stop().
+        """
+        text = json.dumps(payload, default=str)
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        self.published += 1
+        if running is loop:
+            self.backend.publish(user_id, text)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self.backend.publish, user_id, text)
+
+    def _deliver(self, user_id: int, text: str) -> None:
+        """Backend callback: offer an encoded event to this worker's sockets of user_id."""
+        with self._lock:
+            peers = list(self._connections.get(user_id, ()))
+        for conn in peers:
+            if conn.offer(text):
+                self.delivered += 1
+            else:
+                self.overflows += 1
+
+    async def _ping_all(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_s)
+            with self._lock:
+                peers = [conn for conns in self._connections.values() for conn in conns]
+            for n, conn in enumerate(peers, 1):
+                conn.offer(PING_EVENT)
+                if n % 1000 == 0:
+                    await asyncio.sleep(0)  # keep serving sockets while pinging many
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return a point-in-time view of connections and counters.
+
+        Notes:
+        - queued_bytes is the text waiting in send queues; rss_per_connection_bytes spreads the process's
+          RSS growth since start() over the open sockets, a rough per-socket cost for sizing
+          NOTIFY_MAX_CONNECTIONS.
+        """
+        with self._lock:
+            conns = [conn for peers in self._connections.values() for conn in peers]
+            users = len(self._connections)
+        rss = _rss_bytes()
+        return {
+            "connections": len(conns),
+            "max_connections": self.max_connections,
+            "users": users,
+            "queued_events": sum(conn.queue.qsize() for conn in conns),
+            "queued_bytes": sum(conn.queued_bytes for conn in conns),
+            "rss_bytes": rss,
+            "rss_per_connection_bytes": max(rss - self._rss_at_start, 0) // len(conns) if conns else 0,
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+            "rejected": self.rejected,
+            "idle_closed": self.idle_closed,
+            **{f"backend_{k}": v for k, v in self.backend.stats().items()},
+        }
+
+
+# PUBLIC_INTERFACE
+def notification_event(notification: Notification) -> dict[str, Any]:
+    """WebSocket event for a stored notification (same fields as GET /notifications items)."""
+    return {
+        "type": "notification",
+        "id": notification.id,
+        "message": notification.message,
+        "is_read": bool(notification.is_read),
+        "created_at": notification.created_at.isoformat() if notification.created_at else None,
+    }
+
+
+_settings = get_settings()
+
+# Process-wide hub used by the WebSocket router
+notification_hub = NotificationHub(
+    queue_max=_settings.NOTIFY_QUEUE_MAX if _settings.NOTIFY_QUEUE_MAX is not None else 100,
+    overflow_policy=_settings.NOTIFY_OVERFLOW_POLICY or "coalesce",
+    backend=make_backend(_settings.NOTIFY_BACKEND, _settings.NOTIFY_SOCKET_PATH),
+    max_connections=_settings.NOTIFY_MAX_CONNECTIONS if _settings.NOTIFY_MAX_CONNECTIONS is not None else 10000,
+    heartbeat_s=_settings.NOTIFY_HEARTBEAT_S if _settings.NOTIFY_HEARTBEAT_S is not None else 25,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_notifications(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Remember notifications inserted by this transaction, as events built from the flushed rows."""
+    for obj in session.new:
+        if isinstance(obj, Notification):
+            session.info.setdefault("notification_events", []).append((obj.user_id, notification_event(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_notifications(session: Session) -> None:
+    """Push committed notifications to connected sockets."""
+    for user_id, payload in session.info.pop("notification_events", ()):
+        notification_hub.publish(user_id, payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_notifications(session: Session) -> None:
+    """Rolled-back notifications are never announced."""
+    session.info.pop("notification_events", None)
@@ -0,0 +1,197 @@
+"""
+Pub/sub transports behind the notification hub.
+
+- MemoryBackend: delivers in-process; right for a single worker.
+- UnixSocketBackend: every worker connects to a tiny broker on a Unix domain socket, and the broker relays
+  each published line to all workers (the publisher included), so an event reaches a socket held by any
+  worker. The broker runs inside whichever worker holds an flock on `<path>.lock`; when that worker exits,
+  the others reconnect and one of them takes over. No external service is needed.
+
+Wire format: one line per event, `<user_id>\\t<json>\\n` (JSON never contains a raw newline).
+"""
+import asyncio
+import collections
+import fcntl
+import logging
+import os
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[int, str], None]
+# Lines longer than this are rejected by readers
+MAX_LINE = 1024 * 1024
+# A worker that stops reading is disconnected once this much is buffered for it
+MAX_BROKER_BUFFER = 8 * 1024 * 1024
+
+
+class MemoryBackend:
+    """In-process fan-out: publish() delivers immediately."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    def publish(self, user_id: int, text: str) -> None:
+        if self._deliver is not None:
+            self._deliver(user_id, text)
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+
+class _Broker:
+    """Relays every line received from any worker to all connected workers."""
+
+    def __init__(self) -> None:
+        self._clients: set[asyncio.StreamWriter] = set()
+        self.relayed = 0
+        self.evicted = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        try:
+            while line := await reader.readline():
+                self.relayed += 1
+                for client in list(self._clients):
+                    if client.transport.get_write_buffer_size() > MAX_BROKER_BUFFER:
+                        self.evicted += 1
+                        self._clients.discard(client)
+                        client.close()
+                        continue
+                    client.write(line)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+
+class UnixSocketBackend:
+    """
+    Cross-worker fan-out through a broker on a Unix domain socket (see module docstring).
+
+    Notes:
+    - publish() never blocks: lines are written to the broker connection, or kept in a bounded buffer
+      while (re)connecting; the oldest buffered lines are dropped if it fills up.
+    - Events published while no broker is reachable for longer than the buffer covers are lost; clients
+      recover through GET /notifications.
+    """
+
+    name = "unix"
+
+    def __init__(self, path: str, buffer_max: int = 10000, retry_s: float = 0.2):
+        self.path = path
+        self.retry_s = retry_s
+        self._pending: "collections.deque[bytes]" = collections.deque(maxlen=buffer_max)
+        self._deliver: Optional[Deliver] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._broker: Optional[_Broker] = None
+        self._lock_fd: Optional[int] = None
+        self.received = 0
+        self.reconnects = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def publish(self, user_id: int, text: str) -> None:
+        line = f"{user_id}\t{text}\n".encode()
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.write(line)
+        else:
+            self._pending.append(line)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hosting_broker": int(self._server is not None),
+            "connected": int(self._writer is not None),
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "pending": len(self._pending),
+        }
+
+    async def _try_host(self) -> None:
+        """Become the broker if no live worker holds the lock."""
+        if self._server is not None:
+            return
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return
+        try:
+            os.unlink(self.path)  # stale socket left by a previous broker
+        except FileNotFoundError:
+            pass
+        self._lock_fd = fd
+        self._broker = _Broker()
+        self._server = await asyncio.start_unix_server(self._broker.handle, path=self.path, limit=MAX_LINE)
+        logger.info("notification broker listening on %s", self.path)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._try_host()
+                reader, writer = await asyncio.open_unix_connection(self.path, limit=MAX_LINE)
+            except OSError:
+                await asyncio.sleep(self.retry_s)
+                continue
+            self._writer = writer
+            while self._pending:
+                writer.write(self._pending.popleft())
+            try:
+                while line := await reader.readline():
+                    user_id, _, text = line.decode().rstrip("\n").partition("\t")
+                    self.received += 1
+                    if self._deliver is not None and user_id.isdigit():
+                        self._deliver(int(user_id), text)
+            except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                pass
+            self._writer = None
+            writer.close()
+            self.reconnects += 1
+            await asyncio.sleep(self.retry_s)
+
+
+# PUBLIC_INTERFACE
+def make_backend(kind: Optional[str], socket_path: Optional[str] = None) -> "MemoryBackend | UnixSocketBackend":
+    """
+    Build the configured backend.
+
+    Parameters:
+    - kind: "memory" (default) or "unix"
+    - socket_path: broker socket for "unix"; all workers of one deployment must share it
+    """
+    if (kind or "memory") == "unix":
+        return UnixSocketBackend(socket_path or "/tmp/skillbridge-notify.sock")
+    return MemoryBackend()
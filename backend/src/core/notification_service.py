@@ -0,0 +1,244 @@
+"""
+Notification writes outside the request transaction.
+
+- NotificationWriter buffers notifications and inserts them with one executemany per batch, flushing when
+  a batch fills up or a short interval passes. Rows go to live sockets right after their batch commits.
+- broadcast_to_module() notifies every learner with progress in a module through a single
+  INSERT ... SELECT, then streams the new rows to live sockets in the background.
+
+Rows written here bypass ORM unit-of-work events, so they are published, and counted in
+users.unread_notifications (src/db/notification_counts.py), explicitly.
+"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import event, false, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.notification_hub import notification_hub
+from src.db.notification_counts import UNREAD_DELTA, unread_delta_params
+from src.db.session import async_db_session
+from src.models.extras import Notification
+from src.models.tracking import Progress
+
+logger = logging.getLogger(__name__)
+
+# Rows published per event-loop turn when streaming a broadcast to sockets
+PUBLISH_CHUNK = 1000
+
+
+def _event(row: Any, message: str, created_at: datetime) -> dict[str, Any]:
+    # same shape as notification_hub.notification_event
+    return {
+        "type": "notification",
+        "id": row.id,
+        "message": message,
+        "is_read": False,
+        "created_at": created_at.isoformat(),
+    }
+
+
+class NotificationWriter:
+    """
+    Buffered, batched notification inserts.
+
+    Notes:
+    - enqueue() is non-blocking; a background task flushes once `batch_size` rows are waiting or
+      `flush_interval_s` after the first buffered row.
+    - At most `max_pending` rows wait in memory; beyond that enqueue() drops the row and counts it, since
+      notifications are advisory and callers must not stall on them.
+    - A batch that fails to insert is logged and counted as failed, not retried.
+    """
+
+    def __init__(self, batch_size: int = 500, flush_interval_s: float = 0.05, max_pending: int = 50000):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_s = max(0.0, flush_interval_s)
+        self.max_pending = max(self.batch_size, max_pending)
+        self._pending: list[dict] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Start the flush task on the running loop (app startup)."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write whatever is still buffered, then end the flush task (app shutdown)."""
+        if self._task is not None:
+            # Not cancelled: the task may be mid-insert with its batch already taken off _pending
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        while self._pending:
+            await self._flush()
+        self._loop = None
+
+    def enqueue(self, user_id: int, message: str) -> None:
+        """Buffer one notification; safe to call from any thread."""
+        loop = self._loop
+        if loop is None:
+            self.dropped += 1
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._add(user_id, message)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._add, user_id, message)
+
+    def _add(self, user_id: int, message: str) -> None:
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append({"user_id": user_id, "message": message, "is_read": False})
+        if self._wakeup is not None and (len(self._pending) == 1 or len(self._pending) >= self.batch_size):
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if len(self._pending) < self.batch_size and self.flush_interval_s and not self._stopping:
+                # let a batch accumulate unless it is already full
+                try:
+                    await asyncio.wait_for(self._wait_full(), timeout=self.flush_interval_s)
+                except asyncio.TimeoutError:
+                    pass
+            while self._pending:
+                await self._flush()
+
+    async def _wait_full(self) -> None:
+        while len(self._pending) < self.batch_size and not self._stopping:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending[: self.batch_size], self._pending[self.batch_size :]
+        created_at = datetime.utcnow()
+        for row in batch:
+            row["created_at"] = created_at
+        try:
+            async with async_db_session() as db:
+                rows = (
+                    await db.execute(
+                        insert(Notification).returning(
+                            Notification.id, Notification.user_id, sort_by_parameter_order=True
+                        ),
+                        batch,
+                    )
+                ).all()
+                await db.execute(UNREAD_DELTA, unread_delta_params(Counter(row["user_id"] for row in batch)))
+        except Exception:  # noqa: BLE001
+            self.failed += len(batch)
+            logger.exception("notification batch of %d rows failed", len(batch))
+            return
+        self.written += len(rows)
+        self.batches += 1
+        for row, values in zip(rows, batch):
+            notification_hub.publish(row.user_id, _event(row, values["message"], created_at))
+
+    def stats(self) -> dict[str, int]:
+        """Return a point-in-time view of the buffer and counters."""
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+_settings = get_settings()
+
+# Process-wide writer, started and stopped with the app
+notification_writer = NotificationWriter(
+    batch_size=_settings.NOTIFY_WRITE_BATCH if _settings.NOTIFY_WRITE_BATCH is not None else 500,
+    flush_interval_s=(_settings.NOTIFY_WRITE_INTERVAL_MS if _settings.NOTIFY_WRITE_INTERVAL_MS is not None else 50)
+    / 1000.0,
+)
+
+
+# PUBLIC_INTERFACE
+def notify_after_commit(db: AsyncSession, user_id: int, message: str) -> None:
+    """
+    Queue a notification on the batched writer once db's transaction commits (dropped on rollback), so the
+    request transaction carries no notification insert.
+    """
+    db.sync_session.info.setdefault("queued_notifications", []).append((user_id, message))
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed(session: Session) -> None:
+    for user_id, message in session.info.pop("queued_notifications", ()):
+        notification_writer.enqueue(user_id, message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_queued(session: Session) -> None:
+    session.info.pop("queued_notifications", None)
+
+
+async def _publish_rows(rows: Sequence[Any], message: str, created_at: datetime) -> None:
+    for start in range(0, len(rows), PUBLISH_CHUNK):
+        for row in rows[start : start + PUBLISH_CHUNK]:
+            notification_hub.publish(row.user_id, _event(row, message, created_at))
+        await asyncio.sleep(0)  # keep serving requests between chunks
+
+
+# Background fan-out tasks (held so they are not garbage collected mid-run)
+_broadcasts: set[asyncio.Task] = set()
+
+
+# PUBLIC_INTERFACE
+async def broadcast_to_module(db: AsyncSession, module_id: int, message: str) -> int:
+    """
+    Notify every user with progress in module_id.
+
+    Parameters:
+    - db: request session; the rows are inserted by one INSERT ... SELECT over progress, the returned
+      recipients' unread counters are bumped with one executemany UPDATE, and both are committed here
+
+    Returns:
+    - number of notifications written
+
+    Notes:
+    - Once committed, the new rows are streamed to live sockets by a background task in chunks, so the
+      caller does not wait for fan-out and the event loop keeps serving other requests meanwhile.
+    """
+    created_at = datetime.utcnow()
+    cohort = select(Progress.user_id, literal(message), false(), literal(created_at)).where(
+        Progress.module_id == module_id
+    )
+    stmt = (
+        insert(Notification)
+        .from_select(["user_id", "message", "is_read", "created_at"], cohort)
+        .returning(Notification.id, Notification.user_id)
+    )
+    rows = (await db.execute(stmt)).all()
+    if rows:
+        # counted from what was actually inserted: re-running the cohort query could see progress rows
+        # committed after the INSERT and bump counters with no notification behind them
+        await db.execute(UNREAD_DELTA, unread_delta_params(Counter(row.user_id for row in rows)))
+    await db.commit()
+    if rows:
+        task = asyncio.create_task(_publish_rows(rows, message, created_at))
+        _broadcasts.add(task)
+        task.add_done_callback(_broadcasts.discard)
+    return len(rows)
@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from src.core.config import get_settings
+from src.core.security import hash_password, verify_password
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the password hashing queue is full or its workers keep dying; callers should answer 503."""
+
+
+class PasswordPool:
+    """
+    Dedicated, bounded executor for bcrypt work so it never occupies the shared request threadpool.
+
+    Notes:
+    - A process pool (default) scales across cores; a thread pool is available for constrained hosts.
+    - At most max_pending jobs may be queued or running; further submissions fail fast with PasswordPoolBusy.
+    - The executor is created lazily on first use and torn down by shutdown().
+    - A process pool whose worker died (OOM kill, segfault) is broken for good, so it is discarded and the job
+      retried once on a fresh pool; a second break surfaces as PasswordPoolBusy.
+    """
+
+    def __init__(self, workers: int, max_pending: int, kind: str = "process"):
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self.kind = kind
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "thread":
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pwhash")
+                else:
+                    # spawn avoids forking a process that already holds event-loop and threadpool locks
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+            return self._executor
+
+    def _discard(self, executor: Executor) -> None:
+        # only the pool that broke; a concurrent caller may already have replaced it
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordPoolBusy("password hashing queue is full")
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        succeeded = False
+        try:
+            try:
+                result = await self._submit(fn, *args)
+            except BrokenProcessPool:
+                try:
+                    result = await self._submit(fn, *args)
+                except BrokenProcessPool as exc:
+                    raise PasswordPoolBusy("password hashing workers are restarting") from exc
+            succeeded = True
+            return result
+        finally:
+            with self._lock:
+                self.pending -= 1
+                if succeeded:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a plaintext password in the dedicated pool."""
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plaintext password against a bcrypt hash in the dedicated pool."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and counters."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "queued": max(0, self.pending - self.workers),
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the executor; a later submission recreates it."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_settings = get_settings()
+_workers = _settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+
+# Process-wide pool used by the auth routers
+password_pool = PasswordPool(
+    workers=_workers,
+    max_pending=_settings.PASSWORD_HASH_MAX_PENDING or _workers * 16,
+    kind=(_settings.PASSWORD_HASH_EXECUTOR or "process").lower(),
+)
@@ -0,0 +1,171 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of the authenticated user, safe to share across requests and sessions."""
+
+    id: int
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_mentor: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build a snapshot from a loaded User row."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=bool(user.is_active),
+            is_mentor=bool(user.is_mentor),
+        )
+
+    def to_claims(self) -> dict[str, Any]:
+        """Claims embedded in access tokens issued in claims-only auth mode."""
+        return {"email": self.email, "name": self.full_name, "active": self.is_active, "mentor": self.is_mentor}
+
+    @classmethod
+    def from_claims(cls, payload: dict[str, Any]) -> Optional["Principal"]:
+        """Rebuild a Principal from a claims-carrying access token, or None if claims are missing."""
+        sub = str(payload.get("sub", ""))
+        if not sub.isdigit() or "email" not in payload or "active" not in payload:
+            return None
+        return cls(
+            id=int(sub),
+            email=payload["email"],
+            full_name=payload.get("name"),
+            is_active=bool(payload["active"]),
+            is_mentor=bool(payload.get("mentor", False)),
+        )
+
+
+class PrincipalCache:
+    """
+    Bounded TTL + LRU cache of Principals keyed by token `sub`.
+
+    Notes:
+    - A user may be cached under several subs (id and email); invalidation drops all of them.
+    - Only positive lookups are cached so a newly registered user is never shadowed by a stale miss.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl_s: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, tuple[float, Principal]]" = OrderedDict()
+        self._subs_by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, sub: str) -> Optional[Principal]:
+        """Return the cached Principal for sub, or None on miss/expiry."""
+        if self.maxsize <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(sub)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if expires_at <= now:
+                self._drop(sub)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(sub)
+            self.hits += 1
+            return principal
+
+    def put(self, sub: str, principal: Principal) -> None:
+        """Store principal under sub, evicting least recently used entries beyond maxsize."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[sub] = (time.monotonic() + self.ttl_s, principal)
+            self._entries.move_to_end(sub)
+            self._subs_by_user.setdefault(principal.id, set()).add(sub)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached sub that resolves to user_id."""
+        with self._lock:
+            for sub in list(self._subs_by_user.get(user_id, ())):
+                self._drop(sub)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._subs_by_user.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return a point-in-time view of size and counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _drop(self, sub: str) -> None:
+        # Caller holds the lock.
+        entry = self._entries.pop(sub, None)
+        if entry is None:
+            return
+        user_id = entry[1].id
+        subs = self._subs_by_user.get(user_id)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs_by_user[user_id]
+
+
+_settings = get_settings()
+
+# Process-wide cache shared by HTTP dependencies and the WebSocket handshake
+principal_cache = PrincipalCache(
+    maxsize=_settings.PRINCIPAL_CACHE_MAX if _settings.PRINCIPAL_CACHE_MAX is not None else 10000,
+    ttl_s=_settings.PRINCIPAL_CACHE_TTL_S if _settings.PRINCIPAL_CACHE_TTL_S is not None else 60,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Remember users whose snapshot fields changed or who were deleted in this transaction."""
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            session.info.setdefault("principal_invalidations", set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    """Evict cached principals once the change is visible to other sessions."""
+    for user_id in session.info.pop("principal_invalidations", ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    """Forget pending invalidations when the transaction is rolled back."""
+    session.info.pop("principal_invalidations", None)
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from src.core.catalog_cache import CatalogCache, catalog_cache
+from src.core.config import get_settings
+
+
+@dataclass(frozen=True)
+class QuizPayload:
+    """Everything start/submit need from a quiz, built once per catalog version."""
+
+    quiz_id: int
+    module_id: int
+    # Encoded QuizOut JSON (questions without correct options), sent as-is by POST /quizzes/{module_id}/start
+    body: bytes
+    # question id -> normalized correct option ("A".."D"); read-only by convention
+    answers: Mapping[int, str]
+
+
+class QuizCache:
+    """
+    Cache of quiz payloads keyed by quiz id, valid for one version of the catalog cache.
+
+    Notes:
+    - Quiz and Question writes bump `catalog.version` (see src/core/catalog_cache.py); entries store the
+      version they were built at and are ignored once it moves, so question edits are never served stale.
+    - A module id -> quiz id map lets start_quiz find the payload without a query; it is reset on a
+      version change too.
+    """
+
+    def __init__(self, catalog: CatalogCache, maxsize: int = 512, ttl_s: float = 300.0):
+        self.catalog = catalog
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[int, tuple[float, int, QuizPayload]]" = OrderedDict()
+        self._by_module: dict[int, int] = {}
+        self._modules_version = -1
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, quiz_id: int) -> Optional[QuizPayload]:
+        """Return the current payload for quiz_id, or None on miss/expiry/stale version."""
+        if self.maxsize <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(quiz_id)
+            if entry is None or entry[0] <= now or entry[1] != self.catalog.version:
+                if entry is not None:
+                    del self._entries[quiz_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(quiz_id)
+            self.hits += 1
+            return entry[2]
+
+    def get_for_module(self, module_id: int) -> Optional[QuizPayload]:
+        """Return the payload of the quiz start_quiz serves for module_id, if cached."""
+        if self.maxsize <= 0:
+            return None
+        with self._lock:
+            quiz_id = self._by_module.get(module_id) if self._modules_version == self.catalog.version else None
+            if quiz_id is None:
+                self.misses += 1
+                return None
+        return self.get(quiz_id)
+
+    def put(self, payload: QuizPayload, version: int, for_module: bool = False) -> None:
+        """
+        Store payload built from catalog version `version` (read before querying); dropped if it moved since.
+
+        Parameters:
+        - for_module: payload is the quiz start_quiz serves for payload.module_id, so map the module to it
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if version != self.catalog.version:
+                return
+            if self._modules_version != version:
+                self._by_module.clear()
+                self._modules_version = version
+            self._entries[payload.quiz_id] = (time.monotonic() + self.ttl_s, version, payload)
+            self._entries.move_to_end(payload.quiz_id)
+            if for_module:
+                self._by_module[payload.module_id] = payload.quiz_id
+            while len(self._entries) > self.maxsize:
+                evicted = self._entries.popitem(last=False)[1][2]
+                if self._by_module.get(evicted.module_id) == evicted.quiz_id:
+                    del self._by_module[evicted.module_id]
+
+    def stats(self) -> dict[str, int]:
+        """Return a point-in-time view of size and counters."""
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+_settings = get_settings()
+
+# Process-wide cache used by the quizzes router
+quiz_cache = QuizCache(
+    catalog_cache,
+    maxsize=_settings.QUIZ_CACHE_MAX if _settings.QUIZ_CACHE_MAX is not None else 512,
+    ttl_s=_settings.CATALOG_CACHE_TTL_S if _settings.CATALOG_CACHE_TTL_S is not None else 300,
+)
@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -22,25 +23,50 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 # PUBLIC_INTERFACE
-def create_access_token(subject: str | Any, expires_delta: Optional[timedelta] = None) -> str:
+def create_access_token(
+    subject: str | Any,
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[dict[str, Any]] = None,
+) -> str:
     """
     Create a signed JWT access token for the given subject.
 
     Parameters:
     - subject: Identifier for the user (e.g., user ID or email)
     - expires_delta: Optional TTL for the token; default 60 minutes
+    - claims: Optional extra claims (claims-only auth mode embeds the user's profile flags here)
 
     Returns:
     - Encoded JWT as string
     """
     settings = get_settings()
     to_encode = {"sub": str(subject), "iat": datetime.now(tz=timezone.utc)}
+    if claims:
+        to_encode.update(claims)
+        to_encode["typ"] = "access"
     expire = datetime.now(tz=timezone.utc) + (expires_delta or timedelta(minutes=60))
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
     return encoded_jwt
 
 
+# PUBLIC_INTERFACE
+def create_refresh_token(subject: str | Any, expires_delta: timedelta) -> tuple[str, str, datetime]:
+    """
+    Create a signed refresh token with a unique `jti` for server-side revocation tracking.
+
+    Returns:
+    - (encoded JWT, jti, expiry as naive UTC datetime for storage)
+    """
+    settings = get_settings()
+    now = datetime.now(tz=timezone.utc)
+    jti = uuid.uuid4().hex
+    expire = now + expires_delta
+    to_encode = {"sub": str(subject), "iat": now, "exp": expire, "jti": jti, "typ": "refresh"}
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
+    return encoded_jwt, jti, expire.replace(tzinfo=None)
+
+
 # PUBLIC_INTERFACE
 def decode_token(token: str) -> dict[str, Any]:
     """
@@ -0,0 +1,151 @@
+"""
+Per-quiz leaderboards: each user's best score plus a count of users per distinct best score.
+
+Quiz submissions keep both tables current in their own transaction (record_best_scores). Attempts loaded
+with Core (src/db/scale_data.py, migrations) or removed with their users are reconciled with:
+
+    python -m src.db.leaderboard rebuild
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Engine, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.upsert import conflict_insert
+from src.models.tracking import QuizBestScore, QuizScoreCount
+
+# Scores are rounded before comparison so equal results share one bucket
+SCORE_DIGITS = 4
+
+REBUILD_SQL = (
+    "DELETE FROM quiz_score_counts",
+    "DELETE FROM quiz_best_scores",
+    "INSERT INTO quiz_best_scores (quiz_id, user_id, best_score, achieved_at) "
+    f"SELECT a.quiz_id, a.user_id, round(CAST(a.score AS NUMERIC), {SCORE_DIGITS}), min(a.submitted_at) FROM attempts a "
+    "JOIN (SELECT quiz_id, user_id, max(score) AS score FROM attempts GROUP BY quiz_id, user_id) b "
+    "ON b.quiz_id = a.quiz_id AND b.user_id = a.user_id AND b.score = a.score "
+    "GROUP BY a.quiz_id, a.user_id, a.score",
+    "INSERT INTO quiz_score_counts (quiz_id, score, users) "
+    "SELECT quiz_id, best_score, count(*) FROM quiz_best_scores GROUP BY quiz_id, best_score",
+)
+
+
+class ScoredAttempt(NamedTuple):
+    """A stored attempt's contribution to its quiz leaderboard."""
+
+    quiz_id: int
+    user_id: int
+    score: float
+    submitted_at: datetime
+
+
+# PUBLIC_INTERFACE
+async def record_best_scores(db: AsyncSession, attempts: list[ScoredAttempt]) -> None:
+    """
+    Fold new attempts into quiz_best_scores and quiz_score_counts.
+
+    Parameters:
+    - db: session of the submitting transaction (which has already written its attempts, so on SQLite it
+      holds the write lock and the read-compare-update below cannot interleave with another submit)
+
+    Notes:
+    - Each (quiz, user) costs a keyed insert, or a keyed read plus update when a best score already
+      exists: O(log n) index work. Bucket deltas are applied with one executemany upsert.
+    """
+    best: dict[tuple[int, int], tuple[float, datetime]] = {}
+    for attempt in attempts:
+        key = (attempt.quiz_id, attempt.user_id)
+        candidate = (round(attempt.score, SCORE_DIGITS), attempt.submitted_at)
+        current = best.get(key)
+        if current is None or candidate[0] > current[0] or (candidate[0] == current[0] and candidate[1] < current[1]):
+            best[key] = candidate
+    deltas: Counter = Counter()
+    for (quiz_id, user_id), (score, achieved_at) in sorted(best.items()):
+        inserted = await db.scalar(
+            conflict_insert(db, QuizBestScore)
+            .values(quiz_id=quiz_id, user_id=user_id, best_score=score, achieved_at=achieved_at)
+            .on_conflict_do_nothing(index_elements=["quiz_id", "user_id"])
+            .returning(QuizBestScore.user_id)
+        )
+        if inserted is not None:
+            deltas[(quiz_id, score)] += 1
+            continue
+        key_filter = (QuizBestScore.quiz_id == quiz_id, QuizBestScore.user_id == user_id)
+        previous = await db.scalar(select(QuizBestScore.best_score).where(*key_filter).with_for_update())
+        if previous is not None and score > previous:
+            await db.execute(update(QuizBestScore).where(*key_filter).values(best_score=score, achieved_at=achieved_at))
+            deltas[(quiz_id, previous)] -= 1
+            deltas[(quiz_id, score)] += 1
+    changes = [
+        {"quiz_id": quiz_id, "score": score, "users": delta}
+        for (quiz_id, score), delta in sorted(deltas.items())
+        if delta
+    ]
+    if changes:
+        stmt = conflict_insert(db, QuizScoreCount)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["quiz_id", "score"], set_={"users": QuizScoreCount.users + stmt.excluded.users}
+        )
+        await db.execute(stmt, changes)
+
+
+# PUBLIC_INTERFACE
+async def rank_of(db: AsyncSession, quiz_id: int, score: float) -> int:
+    """Competition rank of a best score (1 + users with a strictly higher best); reads one row per bucket."""
+    above = await db.scalar(
+        select(func.coalesce(func.sum(QuizScoreCount.users), 0)).where(
+            QuizScoreCount.quiz_id == quiz_id, QuizScoreCount.score > score
+        )
+    )
+    return int(above) + 1
+
+
+# PUBLIC_INTERFACE
+async def entrants(db: AsyncSession, quiz_id: int) -> int:
+    """Users with at least one attempt at the quiz."""
+    total = await db.scalar(
+        select(func.coalesce(func.sum(QuizScoreCount.users), 0)).where(QuizScoreCount.quiz_id == quiz_id)
+    )
+    return int(total)
+
+
+# PUBLIC_INTERFACE
+def rebuild(engine: Engine) -> int:
+    """
+    Recompute both leaderboard tables from attempts in one transaction.
+
+    Returns:
+    - number of (quiz, user) best-score rows
+    """
+    with engine.begin() as conn:
+        for statement in REBUILD_SQL:
+            conn.execute(text(statement))
+        return conn.execute(text("SELECT count(*) FROM quiz_best_scores")).scalar_one()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point: `rebuild` recomputes the leaderboards from attempts."""
+    parser = argparse.ArgumentParser(description="Maintain quiz leaderboards")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL from settings")
+    args = parser.parse_args(argv)
+
+    from sqlalchemy import create_engine
+
+    from src.core.config import get_settings
+
+    engine = create_engine(args.database_url or str(get_settings().DATABASE_URL))
+    started = time.perf_counter()
+    total = rebuild(engine)
+    engine.dispose()
+    print(f"rebuilt {total} best scores in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
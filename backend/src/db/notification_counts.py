@@ -0,0 +1,73 @@
+"""
+Per-user unread notification counters (users.unread_notifications).
+
+ORM writes keep the counter current through the flush hook in src/models/extras.py; Core writes (the batched
+writer and broadcasts in src/core/notification_service.py, POST /notifications/read) apply their own deltas
+in the same transaction. Notifications loaded with Core (src/db/scale_data.py) are reconciled with:
+
+    python -m src.db.notification_counts recount
+"""
+import argparse
+import sys
+import time
+from typing import Mapping, Optional
+
+from sqlalchemy import Engine, bindparam, text, update
+
+from src.models.user import User
+
+_users = User.__table__
+
+RECOUNT_SQL = (
+    "UPDATE users SET unread_notifications = "
+    "(SELECT count(*) FROM notifications n WHERE n.user_id = users.id AND n.is_read = FALSE)"
+)
+
+# executemany with {"user": id, "delta": n} rows
+UNREAD_DELTA = (
+    update(_users)
+    .where(_users.c.id == bindparam("user"))
+    .values(unread_notifications=_users.c.unread_notifications + bindparam("delta"))
+)
+
+
+# PUBLIC_INTERFACE
+def unread_delta_params(deltas: Mapping[int, int]) -> list[dict[str, int]]:
+    """Parameters for UNREAD_DELTA, in user id order so concurrent writers lock rows in the same order."""
+    return [{"user": user_id, "delta": delta} for user_id, delta in sorted(deltas.items()) if delta]
+
+
+# PUBLIC_INTERFACE
+def recount(engine: Engine) -> int:
+    """
+    Recompute every user's counter from notifications in one statement (index-only on
+    ix_notifications_user_unread).
+
+    Returns:
+    - number of users updated
+    """
+    with engine.begin() as conn:
+        return conn.execute(text(RECOUNT_SQL)).rowcount
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point: `recount` recomputes the unread counters from notifications."""
+    parser = argparse.ArgumentParser(description="Maintain unread notification counters")
+    parser.add_argument("command", choices=["recount"])
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL from settings")
+    args = parser.parse_args(argv)
+
+    from sqlalchemy import create_engine
+
+    from src.core.config import get_settings
+
+    engine = create_engine(args.database_url or str(get_settings().DATABASE_URL))
+    started = time.perf_counter()
+    total = recount(engine)
+    engine.dispose()
+    print(f"recounted {total} users in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Per-question answer capture and running item statistics.
+
+Submissions write one attempt_answers row per answered question and fold every graded attempt into
+question_stats with an atomic upsert in the same transaction, so reading a quiz's statistics costs one
+row per question however many attempts exist.
+"""
+import math
+from typing import Mapping, NamedTuple, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.upsert import conflict_insert
+from src.models.tracking import AttemptAnswer, QuestionStat
+
+OPTIONS = ("A", "B", "C", "D")
+# question_stats columns that submissions add to
+COUNTERS = (
+    "attempts",
+    "correct",
+    "count_a",
+    "count_b",
+    "count_c",
+    "count_d",
+    "score_sum",
+    "score_sq_sum",
+    "correct_score_sum",
+)
+
+
+class GradedAttempt(NamedTuple):
+    """A stored attempt with what it was graded against."""
+
+    attempt_id: int
+    answer_key: Mapping[int, str]  # question id -> normalized correct option
+    answers: Mapping[int, str]  # question id -> raw submitted answer
+    score: float
+
+
+def _zero(question_id: int) -> dict:
+    return {"question_id": question_id, **{name: 0 for name in COUNTERS}}
+
+
+# PUBLIC_INTERFACE
+async def record_answers(db: AsyncSession, graded: list[GradedAttempt]) -> None:
+    """
+    Store the answers of graded attempts and add them to question_stats.
+
+    Parameters:
+    - db: session of the submitting transaction (the writes commit or roll back with the attempts)
+    - graded: attempts already inserted (ids known)
+
+    Notes:
+    - Every question of the quiz counts one exposure per attempt; only answered questions get an
+      attempt_answers row. Answers to questions outside the quiz are ignored, as in grading.
+    - Deltas are summed per question first, so a batch costs one executemany per table; upserts run in
+      question id order to keep lock order stable across concurrent submits.
+    """
+    rows: list[dict] = []
+    deltas: dict[int, dict] = {}
+    for attempt in graded:
+        for question_id, expected in attempt.answer_key.items():
+            delta = deltas.setdefault(question_id, _zero(question_id))
+            raw = attempt.answers.get(question_id)
+            selected = raw.upper().strip() if isinstance(raw, str) else None
+            correct = selected == expected
+            delta["attempts"] += 1
+            delta["score_sum"] += attempt.score
+            delta["score_sq_sum"] += attempt.score * attempt.score
+            if correct:
+                delta["correct"] += 1
+                delta["correct_score_sum"] += attempt.score
+            if selected in OPTIONS:
+                delta[f"count_{selected.lower()}"] += 1
+            if raw is not None:
+                rows.append(
+                    {
+                        "attempt_id": attempt.attempt_id,
+                        "question_id": question_id,
+                        "selected_option": selected if selected in OPTIONS else None,
+                        "is_correct": correct,
+                    }
+                )
+    if rows:
+        await db.execute(insert(AttemptAnswer), rows)
+    if deltas:
+        stmt = conflict_insert(db, QuestionStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["question_id"],
+            set_={name: getattr(QuestionStat, name) + stmt.excluded[name] for name in COUNTERS},
+        )
+        await db.execute(stmt, [deltas[question_id] for question_id in sorted(deltas)])
+
+
+# PUBLIC_INTERFACE
+def discrimination(stat: QuestionStat) -> Optional[float]:
+    """
+    Point-biserial correlation between answering the question correctly and the attempt's quiz score.
+
+    Returns:
+    - a value in [-1, 1] (higher: the question separates strong from weak attempts), or None while it is
+      undefined (fewer than two attempts, everyone right or everyone wrong, or identical scores)
+    """
+    n, right = stat.attempts, stat.correct
+    if n < 2 or right == 0 or right == n:
+        return None
+    mean = stat.score_sum / n
+    variance = stat.score_sq_sum / n - mean * mean
+    if variance <= 1e-9:
+        return None
+    mean_right = stat.correct_score_sum / right
+    mean_wrong = (stat.score_sum - stat.correct_score_sum) / (n - right)
+    p = right / n
+    return max(-1.0, min(1.0, (mean_right - mean_wrong) / math.sqrt(variance) * math.sqrt(p * (1 - p))))
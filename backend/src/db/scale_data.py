@@ -0,0 +1,362 @@
+"""
+Scale-data generator: bulk-seeds production-sized datasets for benchmarking.
+
+Unlike create_initial_data (idempotent, one query-then-insert per row), this fills every learning table
+through Core executemany inserts in fixed-size chunks, assigning primary keys up front so foreign keys
+never need a round trip. Output is fully determined by --seed and the scale options, so two runs against
+empty databases produce identical rows.
+
+Usage:
+    python -m src.db.scale_data --users 1000000 --attempts 50000000 --seed 7
+    python -m src.db.scale_data --database-url sqlite:///./bench.db --create-schema --users 10000
+"""
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+from passlib.hash import bcrypt
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import Engine
+
+# search_index also registers the FTS table DDL with Base.metadata, so --create-schema creates it
+from src.db import leaderboard, notification_counts, search_index
+from src.db.base import Base
+from src.models.content import Lesson, Module, Question, Quiz
+from src.models.extras import Notification
+from src.models.mentorship import MentorProfile
+from src.models.tracking import Attempt, LessonCompletion, Progress
+from src.models.user import User
+
+# Fixed epoch so timestamps do not depend on when the generator runs
+EPOCH = datetime(2024, 1, 1)
+SPAN_S = 365 * 24 * 3600
+WORDS = (
+    "data analysis design marketing python model cloud career project skill learner module lesson quiz "
+    "practice review mentor portfolio resume interview growth strategy metric report dashboard"
+).split()
+BCRYPT64 = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+EXPERTISE = ("Data Analytics", "Digital Marketing", "Software Engineering", "UX Design", "Project Management")
+
+
+@dataclass
+class ScaleConfig:
+    """Row counts (and text sizes) for one generated dataset."""
+
+    users: int = 10000
+    mentors: int = 100
+    modules: int = 50
+    lessons_per_module: int = 10
+    quizzes_per_module: int = 1
+    questions_per_quiz: int = 10
+    attempts: int = 100000
+    progress: int = 50000
+    notifications: int = 100000
+    lesson_words: int = 300
+    seed: int = 42
+    password: str = "scale1234"
+
+
+def _rng(config: ScaleConfig, table: str) -> random.Random:
+    # One stream per table so changing one count does not reshuffle every other table
+    return random.Random(f"{config.seed}:{table}")
+
+
+def _text(rnd: random.Random, words: int) -> str:
+    return " ".join(rnd.choices(WORDS, k=words))
+
+
+def _timestamp(rnd: random.Random) -> datetime:
+    return EPOCH + timedelta(seconds=rnd.randrange(SPAN_S))
+
+
+def _chunks(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    chunk: list[dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ScaleDataGenerator:
+    """
+    Generate and insert a dataset described by ScaleConfig.
+
+    Notes:
+    - Ids continue after the current max id of each table, so the generator can top up a seeded database;
+      determinism is only guaranteed when starting from the same state (typically empty tables).
+    - Each chunk commits separately, keeping memory and transaction size bounded at any scale.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        config: ScaleConfig,
+        chunk_size: int = 10000,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        self.engine = engine
+        self.config = config
+        self.chunk_size = max(1, chunk_size)
+        self.log = log or (lambda msg: None)
+        self.counts: dict[str, int] = {}
+        self._base: dict[str, int] = {}
+
+    def _load_offsets(self) -> None:
+        with self.engine.connect() as cx:
+            for model in (
+                User, MentorProfile, Module, Lesson, Quiz, Question, Attempt, Progress, LessonCompletion, Notification
+            ):
+                table = model.__table__
+                self._base[table.name] = cx.execute(select(func.coalesce(func.max(table.c.id), 0))).scalar_one()
+
+    def _insert(self, model, rows: Iterator[dict]) -> None:  # noqa: ANN001
+        table = model.__table__
+        started = time.perf_counter()
+        total = 0
+        for chunk in _chunks(rows, self.chunk_size):
+            with self.engine.begin() as cx:
+                cx.execute(insert(table), chunk)
+            total += len(chunk)
+        self.counts[table.name] = total
+        self.log(f"{table.name}: {total} rows in {time.perf_counter() - started:.1f}s")
+
+    # Row streams; all ids are derived from the table offsets so foreign keys are known without queries.
+
+    def _users(self) -> Iterator[dict]:
+        cfg = self.config
+        rnd = _rng(cfg, "users")
+        # One bcrypt for every generated account; the salt comes from the seed so the hash is reproducible too.
+        # The final salt character only carries padding bits, so it is drawn from the zero-padding subset.
+        salt = "".join(rnd.choices(BCRYPT64, k=21)) + rnd.choice(".Oeu")
+        hashed = bcrypt.using(salt=salt, rounds=12).hash(cfg.password)
+        base = self._base["users"]
+        for i in range(cfg.users):
+            uid = base + i + 1
+            mentor = i < cfg.mentors
+            yield {
+                "id": uid,
+                "email": f"{'mentor' if mentor else 'learner'}{uid}@scale.example.com",
+                "hashed_password": hashed,
+                "full_name": f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS).title()} {uid}",
+                "is_active": rnd.random() > 0.02,
+                "is_mentor": mentor,
+                "created_at": _timestamp(rnd),
+            }
+
+    def _mentor_profiles(self) -> Iterator[dict]:
+        cfg = self.config
+        rnd = _rng(cfg, "mentor_profiles")
+        base, user_base = self._base["mentor_profiles"], self._base["users"]
+        for i in range(min(cfg.mentors, cfg.users)):
+            yield {
+                "id": base + i + 1,
+                "user_id": user_base + i + 1,
+                "bio": _text(rnd, 20),
+                "expertise": rnd.choice(EXPERTISE),
+            }
+
+    def _modules(self) -> Iterator[dict]:
+        cfg = self.config
+        rnd = _rng(cfg, "modules")
+        base = self._base["modules"]
+        for i in range(cfg.modules):
+            yield {
+                "id": base + i + 1,
+                "title": f"{rnd.choice(WORDS).title()} {rnd.choice(WORDS).title()} {base + i + 1}",
+                "description": _text(rnd, 30),
+                "created_at": _timestamp(rnd),
+                "lesson_count": cfg.lessons_per_module,
+            }
+
+    def _lessons(self) -> Iterator[dict]:
+        cfg = self.config
+        rnd = _rng(cfg, "lessons")
+        base, module_base = self._base["lessons"], self._base["modules"]
+        for m in range(cfg.modules):
+            for n in range(cfg.lessons_per_module):
+                yield {
+                    "id": base + m * cfg.lessons_per_module + n + 1,
+                    "module_id": module_base + m + 1,
+                    "title": f"Lesson {n + 1}: {rnd.choice(WORDS).title()}",
+                    "content": _text(rnd, cfg.lesson_words),
+                    "order_index": n + 1,
+                }
+
+    def _quizzes(self) -> Iterator[dict]:
+        cfg = self.config
+        base, module_base = self._base["quizzes"], self._base["modules"]
+        for m in range(cfg.modules):
+            for q in range(cfg.quizzes_per_module):
+                yield {
+                    "id": base + m * cfg.quizzes_per_module + q + 1,
+                    "module_id": module_base + m + 1,
+                    "title": f"Quiz {q + 1} for module {module_base + m + 1}",
+                }
+
+    def _questions(self) -> Iterator[dict]:
+        cfg = self.config
+        rnd = _rng(cfg, "questions")
+        base, quiz_base = self._base["questions"], self._base["quizzes"]
+        quizzes = cfg.modules * cfg.quizzes_per_module
+        for z in range(quizzes):
+            for n in range(cfg.questions_per_quiz):
+                yield {
+                    "id": base + z * cfg.questions_per_quiz + n + 1,
+                    "quiz_id": quiz_base + z + 1,
+                    "prompt": _text(rnd, 12) + "?",
+                    "option_a": _text(rnd, 3),
+                    "option_b": _text(rnd, 3),
+                    "option_c": _text(rnd, 3),
+                    "option_d": _text(rnd, 3),
+                    "correct_option": rnd.choice("ABCD"),
+                }
+
+    def _attempts(self) -> Iterator[dict]:
+        cfg = self.config
+        quizzes = cfg.modules * cfg.quizzes_per_module
+        if not cfg.users or not quizzes:
+            return
+        rnd = _rng(cfg, "attempts")
+        base, user_base, quiz_base = self._base["attempts"], self._base["users"], self._base["quizzes"]
+        steps = max(1, cfg.questions_per_quiz)
+        for i in range(cfg.attempts):
+            yield {
+                "id": base + i + 1,
+                "user_id": user_base + rnd.randrange(cfg.users) + 1,
+                "quiz_id": quiz_base + rnd.randrange(quizzes) + 1,
+                "score": round(100.0 * rnd.randint(0, steps) / steps, 2),
+                "submitted_at": _timestamp(rnd),
+            }
+
+    def _progress(self) -> Iterator[dict]:
+        cfg = self.config
+        if not cfg.users or not cfg.modules:
+            return
+        rnd = _rng(cfg, "progress")
+        base, user_base = self._base["progress"], self._base["users"]
+        module_base, lesson_base = self._base["modules"], self._base["lessons"]
+        # At most one row per (user, module): walk the pairs module-major so rows spread over all users
+        for i in range(min(cfg.progress, cfg.users * cfg.modules)):
+            m, u = divmod(i, cfg.users)
+            done = rnd.randint(0, cfg.lessons_per_module)
+            percent = 100.0 * done / cfg.lessons_per_module if cfg.lessons_per_module else 0.0
+            yield {
+                "id": base + i + 1,
+                "user_id": user_base + u + 1,
+                "module_id": module_base + m + 1,
+                "current_lesson_id": lesson_base + m * cfg.lessons_per_module + done if done else None,
+                "status": "completed" if percent >= 100.0 else "in_progress",
+                "progress_percent": round(percent, 2),
+                "updated_at": _timestamp(rnd),
+                "completed_lessons": done,
+            }
+
+    def _lesson_completions(self) -> Iterator[dict]:
+        # Each progress row has completed its module's first `completed_lessons` lessons
+        cfg = self.config
+        base, lesson_base = self._base["lesson_completions"], self._base["lessons"]
+        module_base = self._base["modules"]
+        next_id = base
+        for progress in self._progress():
+            first = lesson_base + (progress["module_id"] - module_base - 1) * cfg.lessons_per_module
+            for n in range(progress["completed_lessons"]):
+                next_id += 1
+                yield {
+                    "id": next_id,
+                    "user_id": progress["user_id"],
+                    "lesson_id": first + n + 1,
+                    "module_id": progress["module_id"],
+                    "completed_at": progress["updated_at"],
+                }
+
+    def _notifications(self) -> Iterator[dict]:
+        cfg = self.config
+        if not cfg.users:
+            return
+        rnd = _rng(cfg, "notifications")
+        base, user_base = self._base["notifications"], self._base["users"]
+        for i in range(cfg.notifications):
+            yield {
+                "id": base + i + 1,
+                "user_id": user_base + rnd.randrange(cfg.users) + 1,
+                "message": f"Reminder: {_text(rnd, 8)}",
+                "is_read": rnd.random() < 0.6,
+                "created_at": _timestamp(rnd),
+            }
+
+    def run(self) -> dict[str, int]:
+        """Insert the whole dataset in dependency order and return rows written per table."""
+        self._load_offsets()
+        self._insert(User, self._users())
+        self._insert(MentorProfile, self._mentor_profiles())
+        self._insert(Module, self._modules())
+        self._insert(Lesson, self._lessons())
+        self._insert(Quiz, self._quizzes())
+        self._insert(Question, self._questions())
+        self._insert(Attempt, self._attempts())
+        self._insert(Progress, self._progress())
+        self._insert(LessonCompletion, self._lesson_completions())
+        self._insert(Notification, self._notifications())
+        started = time.perf_counter()
+        self.counts["quiz_best_scores"] = leaderboard.rebuild(self.engine)
+        self.log(f"leaderboards: rebuilt in {time.perf_counter() - started:.1f}s")
+        started = time.perf_counter()
+        notification_counts.recount(self.engine)
+        self.log(f"unread notification counts: recounted in {time.perf_counter() - started:.1f}s")
+        if self.engine.dialect.name == "sqlite":
+            started = time.perf_counter()
+            indexed = search_index.rebuild(self.engine)
+            self.log(f"search index: {indexed} documents in {time.perf_counter() - started:.1f}s")
+        return dict(self.counts)
+
+
+def _bulk_load_engine(url: str) -> Engine:
+    """Engine for loading; SQLite trades durability for speed since an interrupted load is simply rerun."""
+    engine = create_engine(url, future=True)
+    if url.startswith("sqlite"):
+        @event.listens_for(engine, "connect")
+        def _bulk_pragmas(dbapi_connection, connection_record):  # noqa: ANN001
+            cursor = dbapi_connection.cursor()
+            for pragma in ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=OFF", "PRAGMA cache_size=-262144"):
+                cursor.execute(pragma)
+            cursor.close()
+    return engine
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    defaults = ScaleConfig()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL from settings")
+    parser.add_argument("--create-schema", action="store_true", help="create missing tables before loading")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    for field, value in asdict(defaults).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args(argv)
+
+    config = ScaleConfig(**{field: getattr(args, field) for field in asdict(defaults)})
+    if args.database_url is None:
+        from src.core.config import get_settings
+
+        args.database_url = str(get_settings().DATABASE_URL)
+    engine = _bulk_load_engine(args.database_url)
+    if args.create_schema:
+        Base.metadata.create_all(bind=engine)
+
+    started = time.perf_counter()
+    log = lambda msg: print(msg, file=sys.stderr)  # noqa: E731
+    counts = ScaleDataGenerator(engine, config, chunk_size=args.chunk_size, log=log).run()
+    engine.dispose()
+    log(f"inserted {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s (seed={config.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+SQLite FTS5 search index over modules, lessons and interview questions.
+
+The `search_index` virtual table holds one row per document with rowid = source id * 4 + kind code,
+so ORM writes update it by rowid without scanning. ORM session events keep it in sync inside the
+writing transaction; Core bulk loads (src/db/scale_data.py, migrations) are reconciled with:
+
+    python -m src.db.search_index rebuild
+"""
+import argparse
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import DDL, Connection, event, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.db.base import Base
+from src.models.content import Lesson, Module
+from src.models.extras import InterviewQuestion
+
+TABLE = "search_index"
+KINDS = {"module": 1, "lesson": 2, "interview_question": 3}
+KIND_NAMES = {code: name for name, code in KINDS.items()}
+# bm25 weights per column (title, body, kind, ref_id): title hits rank well above body hits
+BM25_WEIGHTS = "10.0, 1.0, 0.0, 0.0"
+
+CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+    "title, body, kind UNINDEXED, ref_id UNINDEXED, tokenize = 'porter unicode61 remove_diacritics 2')"
+)
+
+# Created with the ORM tables by metadata.create_all (dev startup); alembic revision 0005 creates it otherwise
+event.listen(Base.metadata, "after_create", DDL(CREATE_SQL).execute_if(dialect="sqlite"))
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result."""
+
+    kind: str
+    id: int
+    title: str
+    snippet: str
+    score: float
+
+
+def _document(obj: Any) -> Optional[tuple[int, str, str]]:
+    """(kind code, title, body) for an indexable ORM object, else None."""
+    if isinstance(obj, Module):
+        return KINDS["module"], obj.title or "", obj.description or ""
+    if isinstance(obj, Lesson):
+        return KINDS["lesson"], obj.title or "", obj.content or ""
+    if isinstance(obj, InterviewQuestion):
+        return KINDS["interview_question"], obj.question or "", f"{obj.category or ''} {obj.answer_hint or ''}"
+    return None
+
+
+def _rowid(kind: int, ref_id: int) -> int:
+    return ref_id * 4 + kind
+
+
+def _row(kind: int, ref_id: int, title: Optional[str], body: Optional[str]) -> dict:
+    return {"rowid": _rowid(kind, ref_id), "title": title or "", "body": body or "", "kind": kind, "ref_id": ref_id}
+
+
+def _write(conn: Connection, upserts: list[dict], deletes: list[int]) -> None:
+    rowids = deletes + [row["rowid"] for row in upserts]
+    if rowids:
+        conn.execute(text(f"DELETE FROM {TABLE} WHERE rowid = :rowid"), [{"rowid": r} for r in rowids])
+    if upserts:
+        conn.execute(
+            text(
+                f"INSERT INTO {TABLE} (rowid, title, body, kind, ref_id) "
+                "VALUES (:rowid, :title, :body, :kind, :ref_id)"
+            ),
+            upserts,
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Mirror flushed module/lesson/interview question changes into the FTS table in the same transaction."""
+    upserts: list[dict] = []
+    deletes: list[int] = []
+    for obj in list(session.new) + list(session.dirty):
+        doc = _document(obj)
+        if doc is not None and obj.id is not None:
+            kind, title, body = doc
+            upserts.append(_row(kind, obj.id, title, body))
+    for obj in session.deleted:
+        doc = _document(obj)
+        if doc is not None and obj.id is not None:
+            deletes.append(_rowid(doc[0], obj.id))
+    if not (upserts or deletes):
+        return
+    conn = session.connection()
+    if conn.dialect.name == "sqlite":
+        _write(conn, upserts, deletes)
+
+
+def fts_query(raw: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted (so FTS5 operators and punctuation in user input are inert) and all words must
+    match; the last word also matches as a prefix to support search-as-you-type. Returns None if the
+    input has no searchable words.
+    """
+    words = re.findall(r"\w+", raw.lower())[:16]
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+# PUBLIC_INTERFACE
+def search_statement(kind: Optional[str] = None) -> Any:
+    """
+    Ranked search SQL with :query and :limit parameters (plus :kind when filtering by kind).
+
+    Every document matching the query is scored, so the best BM25 hits are returned however many documents
+    match. FTS5 evaluates `ORDER BY rank LIMIT n` with a bounded top-n sort, and snippets are built for
+    the returned rows only.
+    """
+    kind_filter = " AND kind = :kind" if kind else ""
+    return text(
+        f"SELECT kind, ref_id, title, snippet({TABLE}, 1, '<mark>', '</mark>', '…', 16) AS snippet, rank "
+        f"FROM {TABLE} WHERE {TABLE} MATCH :query AND rank MATCH 'bm25({BM25_WEIGHTS})'{kind_filter} "
+        "ORDER BY rank LIMIT :limit"
+    )
+
+
+def _documents(conn: Connection, batch: int) -> Iterator[list[dict]]:
+    """Yield every indexable source row as FTS rows, in batches (the ORM type decompresses lesson bodies)."""
+    question_body = (
+        func.coalesce(InterviewQuestion.category, "") + " " + func.coalesce(InterviewQuestion.answer_hint, "")
+    )
+    sources = (
+        (KINDS["module"], select(Module.id, Module.title, Module.description)),
+        (KINDS["lesson"], select(Lesson.id, Lesson.title, Lesson.content)),
+        (KINDS["interview_question"], select(InterviewQuestion.id, InterviewQuestion.question, question_body)),
+    )
+    for kind, stmt in sources:
+        rows: list[dict] = []
+        for ref_id, title, body in conn.execute(stmt.execution_options(yield_per=batch)):
+            rows.append(_row(kind, ref_id, title, body))
+            if len(rows) >= batch:
+                yield rows
+                rows = []
+        if rows:
+            yield rows
+
+
+# PUBLIC_INTERFACE
+def rebuild(engine: Engine, batch: int = 2000) -> int:
+    """
+    Recreate the search index from the source tables and optimize it, in one transaction
+    (readers keep seeing the previous index until it commits).
+
+    Returns:
+    - number of indexed documents
+    """
+    total = 0
+    with engine.begin() as conn:
+        conn.execute(text(CREATE_SQL))
+        conn.execute(text(f"DELETE FROM {TABLE}"))
+        for rows in _documents(conn, batch):
+            _write(conn, rows, [])
+            total += len(rows)
+        conn.execute(text(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')"))
+    return total
+
+
+# PUBLIC_INTERFACE
+async def search(db: AsyncSession, raw_query: str, kind: Optional[str] = None, limit: int = 20) -> list[SearchHit]:
+    """
+    Run a ranked search.
+
+    Parameters:
+    - raw_query: free text from the user
+    - kind: optional filter, one of KINDS
+    - limit: max hits
+
+    Returns:
+    - hits ordered by relevance over all matching documents; score is the negated bm25 value (higher is better)
+    """
+    query = fts_query(raw_query)
+    if query is None:
+        return []
+    params: dict[str, Any] = {"query": query, "limit": limit}
+    if kind:
+        params["kind"] = KINDS[kind]
+    rows = (await db.execute(search_statement(kind), params)).all()
+    return [
+        SearchHit(kind=KIND_NAMES[r.kind], id=r.ref_id, title=r.title, snippet=r.snippet, score=round(-r.rank, 4))
+        for r in rows
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point: `rebuild` repopulates the index from the source tables."""
+    parser = argparse.ArgumentParser(description="Maintain the FTS5 search index")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL from settings")
+    parser.add_argument("--batch", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    from sqlalchemy import create_engine
+
+    from src.core.config import get_settings
+
+    engine = create_engine(args.database_url or str(get_settings().DATABASE_URL))
+    if engine.dialect.name != "sqlite":
+        print("search index requires SQLite (FTS5)", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    total = rebuild(engine, batch=args.batch)
+    engine.dispose()
+    print(f"indexed {total} documents in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
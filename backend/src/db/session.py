@@ -1,31 +1,191 @@
-from contextlib import contextmanager
-from typing import Generator
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import get_settings
+from src.core.metrics import record_query
 
 # Load settings once; extra env vars are ignored by Settings to avoid validation errors
 settings = get_settings()
 
+_is_sqlite = str(settings.DATABASE_URL).startswith("sqlite")
+
+
+# PUBLIC_INTERFACE
+def sqlite_pragmas(profile: str | None = None) -> list[str]:
+    """
+    Return the PRAGMA statements applied to every new SQLite connection.
+
+    Profiles:
+    - "production" (default): WAL journal so readers never block on writers, synchronous=NORMAL
+      (durable across app crashes, fsync only at checkpoints), busy_timeout so writers queue instead
+      of failing, a larger page cache, memory-mapped reads and in-memory temp tables.
+    - "safe": foreign keys only (SQLite defaults: rollback journal, synchronous=FULL).
+
+    Individual SQLITE_* settings override the profile values.
+    """
+    profile = (profile or settings.SQLITE_PROFILE or "production").lower()
+    pragmas = ["PRAGMA foreign_keys=ON"]
+    if profile == "safe":
+        return pragmas
+
+    def _int(value: int | None, default: int) -> int:
+        return default if value is None else int(value)
+
+    pragmas += [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE or 'WAL'}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS or 'NORMAL'}",
+        f"PRAGMA busy_timeout={_int(settings.SQLITE_BUSY_TIMEOUT_MS, 5000)}",
+        # negative cache_size is in KiB
+        f"PRAGMA cache_size=-{_int(settings.SQLITE_CACHE_SIZE_KB, 65536)}",
+        f"PRAGMA mmap_size={_int(settings.SQLITE_MMAP_SIZE, 268435456)}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE or 'MEMORY'}",
+    ]
+    return pragmas
+
+
+# PUBLIC_INTERFACE
+def apply_sqlite_pragmas(dbapi_connection, pragmas: list[str]) -> None:  # noqa: ANN001
+    """Execute pragmas on a raw DBAPI connection (sqlite3 or the aiosqlite adapter)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _pool_kwargs(url: str) -> dict:
+    """Pool sizing from Settings; in-memory SQLite uses a singleton pool that takes no sizing."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_S,
+        "pool_recycle": settings.DB_POOL_RECYCLE_S,
+    }
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
 # Create engine; SQLite requires check_same_thread False for single-threaded apps when used across threads.
 engine = create_engine(
     str(settings.DATABASE_URL),
-    connect_args={"check_same_thread": False} if str(settings.DATABASE_URL).startswith("sqlite") else {},
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
     future=True,
+    **_pool_kwargs(str(settings.DATABASE_URL)),
+)
+
+
+def _async_url(url: str) -> str:
+    """
+    Map a plain SQLite URL onto aiosqlite (the only async driver in requirements.txt).
+
+    Other URLs are returned unchanged: their async driver (e.g. postgresql+asyncpg) is a deployment choice,
+    so it is named in ASYNC_DATABASE_URL / READ_DATABASE_URL and installed alongside the app.
+    """
+    parsed = make_url(url)
+    if parsed.drivername != "sqlite":
+        return url
+    return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+
+# Async engine used by the request path; points at the same database through an async driver.
+_async_db_url = str(settings.ASYNC_DATABASE_URL or _async_url(str(settings.DATABASE_URL)))
+async_engine = create_async_engine(
+    _async_db_url,
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    **_pool_kwargs(_async_db_url),
 )
 
-# Enable foreign keys for SQLite
-if str(settings.DATABASE_URL).startswith("sqlite"):
+
+def _read_only_url(url: str) -> str | None:
+    """
+    Derive a read-only URL for the primary database.
+
+    File-backed SQLite opens the same file through a `mode=ro` URI; other backends have no implicit
+    replica, so None is returned and reads share the primary engine unless READ_DATABASE_URL is set.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or parsed.database in (None, "", ":memory:"):
+        return None
+    if parsed.database.startswith("file:"):
+        return None
+    return parsed.set(
+        database=f"file:{os.path.abspath(parsed.database)}", query={"mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+# Read engine backing get_read_db: its own pool so read traffic never queues behind writers.
+# READ_DATABASE_URL can point at a replica; SQLite defaults to read-only connections on the same file.
+_read_db_url = (
+    _async_url(str(settings.READ_DATABASE_URL))
+    if settings.READ_DATABASE_URL
+    else _read_only_url(_async_db_url)
+)
+read_async_engine = (
+    create_async_engine(
+        _read_db_url,
+        connect_args={"check_same_thread": False} if _read_db_url.startswith("sqlite") else {},
+        **_pool_kwargs(_read_db_url),
+    )
+    if _read_db_url
+    else async_engine
+)
+
+# Apply the SQLite tuning profile (foreign keys, WAL, cache sizing, ...) on every new connection
+if _is_sqlite:
+    _sqlite_pragmas = sqlite_pragmas()
 
     @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):  # noqa: ANN001
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+        apply_sqlite_pragmas(dbapi_connection, _sqlite_pragmas)
+
+if read_async_engine is not async_engine and str(read_async_engine.url).startswith("sqlite"):
+    # Journal settings belong to the writer; readers only tune caching and refuse writes outright.
+    _read_pragmas = [
+        p for p in sqlite_pragmas() if not p.startswith(("PRAGMA journal_mode", "PRAGMA synchronous"))
+    ] + ["PRAGMA query_only=ON"]
+
+    @event.listens_for(read_async_engine.sync_engine, "connect")
+    def set_sqlite_read_pragma(dbapi_connection, connection_record):  # noqa: ANN001
+        apply_sqlite_pragmas(dbapi_connection, _read_pragmas)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+    record_query(time.perf_counter() - conn.info["query_start_time"].pop())
+
+
+def _handle_error(exception_context) -> None:  # noqa: ANN001
+    # failed statements never reach after_cursor_execute; keep the timing stack balanced
+    started = exception_context.connection.info.get("query_start_time") if exception_context.connection else None
+    if started:
+        record_query(time.perf_counter() - started.pop())
+
+
+# Per-request SQL count and DB time (see src/api/instrumentation.py); each engine is hooked once.
+if settings.METRICS_ENABLED is not False:
+    for _instrumented in {id(e): e for e in (engine, async_engine.sync_engine, read_async_engine.sync_engine)}.values():
+        event.listen(_instrumented, "before_cursor_execute", _before_cursor_execute)
+        event.listen(_instrumented, "after_cursor_execute", _after_cursor_execute)
+        event.listen(_instrumented, "handle_error", _handle_error)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+# expire_on_commit=False: async code cannot lazily refresh attributes after commit
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+ReadAsyncSessionLocal = async_sessionmaker(bind=read_async_engine, autoflush=False, expire_on_commit=False)
 
 
 # PUBLIC_INTERFACE
@@ -41,3 +201,30 @@ def db_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+# PUBLIC_INTERFACE
+@asynccontextmanager
+async def async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async transactional scope; commits on success and rolls back on error."""
+    session: AsyncSession = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+# PUBLIC_INTERFACE
+@asynccontextmanager
+async def async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a read-only async scope on the read engine; never commits, always ends its transaction."""
+    session: AsyncSession = ReadAsyncSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
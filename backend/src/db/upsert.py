@@ -0,0 +1,27 @@
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+# PUBLIC_INTERFACE
+def conflict_insert(db: AsyncSession, model: Any) -> Any:
+    """
+    INSERT construct for model with ON CONFLICT support on the session's database.
+
+    Parameters:
+    - db: session whose bind picks the dialect
+    - model: ORM class or Table to insert into
+
+    Returns:
+    - a dialect Insert exposing on_conflict_do_nothing / on_conflict_do_update and `excluded`
+
+    Raises:
+    - NotImplementedError: the database is neither SQLite nor PostgreSQL
+    """
+    dialect = db.bind.dialect.name
+    if dialect not in _INSERTS:
+        raise NotImplementedError(f"ON CONFLICT upserts are not supported on {dialect}")
+    return _INSERTS[dialect](model)
@@ -2,9 +2,17 @@
 ORM models package for SkillBridge LMS.
 """
 # Re-export for easier imports
-from .user import User  # noqa: F401
+from .user import User, RefreshToken  # noqa: F401
 from .content import Module, Lesson, Quiz, Question  # noqa: F401
-from .tracking import Attempt, Progress  # noqa: F401
+from .tracking import (  # noqa: F401
+    Attempt,
+    AttemptAnswer,
+    LessonCompletion,
+    Progress,
+    QuestionStat,
+    QuizBestScore,
+    QuizScoreCount,
+)
 from .mentorship import MentorProfile, MentorshipRequest  # noqa: F401
 from .extras import (
     PortfolioItem,
@@ -1,9 +1,11 @@
+from collections import Counter
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, bindparam, event, inspect, update
+from sqlalchemy.orm import Session, relationship
 
 from src.db.base import Base
+from src.db.types import GzipText
 
 
 class Module(Base):
@@ -14,6 +16,8 @@ class Module(Base):
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Denormalized count of the module's lessons, kept in step by _maintain_lesson_counts below
+    lesson_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     lessons = relationship("Lesson", back_populates="module", cascade="all, delete-orphan")
     quizzes = relationship("Quiz", back_populates="module", cascade="all, delete-orphan")
@@ -22,16 +26,46 @@ class Module(Base):
 class Lesson(Base):
     """A single lesson belonging to a module."""
     __tablename__ = "lessons"
+    # Serves per-module lesson lists in order (and plain module_id lookups via its leftmost column)
+    __table_args__ = (Index("ix_lessons_module_id_order_index", "module_id", "order_index"),)
 
     id = Column(Integer, primary_key=True)
-    module_id = Column(Integer, ForeignKey("modules.id", ondelete="CASCADE"), nullable=False, index=True)
+    module_id = Column(Integer, ForeignKey("modules.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
-    content = Column(Text, nullable=True)
+    # gzip-compressed at rest (column "content_gz"); GET /lessons/{id}/content streams the stored bytes
+    content = Column("content_gz", GzipText(), key="content", nullable=True)
     order_index = Column(Integer, default=0, nullable=False)
 
     module = relationship("Module", back_populates="lessons")
 
 
+@event.listens_for(Session, "after_flush")
+def _maintain_lesson_counts(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Apply the flush's lesson inserts, deletes and module moves to modules.lesson_count in the same transaction."""
+    deltas: Counter = Counter()
+    for obj in session.new:
+        if isinstance(obj, Lesson) and obj.module_id is not None:
+            deltas[obj.module_id] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Lesson) and obj.module_id is not None:
+            deltas[obj.module_id] -= 1
+    for obj in session.dirty:
+        if isinstance(obj, Lesson):
+            history = inspect(obj).attrs.module_id.history
+            if history.added and history.deleted:
+                deltas[history.deleted[0]] -= 1
+                deltas[history.added[0]] += 1
+    changes = [{"module": module_id, "delta": delta} for module_id, delta in deltas.items() if delta]
+    if changes:
+        modules = Module.__table__
+        session.connection().execute(
+            update(modules)
+            .where(modules.c.id == bindparam("module"))
+            .values(lesson_count=modules.c.lesson_count + bindparam("delta")),
+            changes,
+        )
+
+
 class Quiz(Base):
     """Quiz associated with a module."""
     __tablename__ = "quizzes"
@@ -1,9 +1,11 @@
+from collections import Counter
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, event, inspect
+from sqlalchemy.orm import Session, relationship
 
 from src.db.base import Base
+from src.db.notification_counts import UNREAD_DELTA, unread_delta_params
 
 
 class PortfolioItem(Base):
@@ -36,6 +38,8 @@ class Certificate(Base):
 class Notification(Base):
     """Notification sent to a user (e.g., lesson reminder)."""
     __tablename__ = "notifications"
+    # Serves unread lookups, range mark-read updates and counter recounts without touching the table
+    __table_args__ = (Index("ix_notifications_user_unread", "user_id", "is_read", "id"),)
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -46,6 +50,29 @@ class Notification(Base):
     user = relationship("User", back_populates="notifications")
 
 
+@event.listens_for(Session, "after_flush")
+def _maintain_unread_counts(session: Session, flush_context) -> None:  # noqa: ANN001
+    """Apply the flush's notification inserts, deletes and read-state changes to users.unread_notifications."""
+    deltas: Counter = Counter()
+    for obj in session.new:
+        if isinstance(obj, Notification) and not obj.is_read:
+            deltas[obj.user_id] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Notification) and not obj.is_read:
+            deltas[obj.user_id] -= 1
+    for obj in session.dirty:
+        if isinstance(obj, Notification):
+            attrs = inspect(obj).attrs
+            read, owner = attrs.is_read.history, attrs.user_id.history
+            if read.has_changes() or owner.has_changes():
+                was_read = read.deleted[0] if read.deleted else obj.is_read
+                deltas[owner.deleted[0] if owner.deleted else obj.user_id] -= 0 if was_read else 1
+                deltas[obj.user_id] += 0 if obj.is_read else 1
+    changes = unread_delta_params(deltas)
+    if changes:
+        session.connection().execute(UNREAD_DELTA, changes)
+
+
 class ResumeTemplate(Base):
     """Resume template metadata."""
     __tablename__ = "resume_templates"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, desc
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -20,16 +20,94 @@ class Attempt(Base):
     quiz = relationship("Quiz")
 
 
+class QuizBestScore(Base):
+    """A user's best score on a quiz (leaderboard row), kept current by quiz submissions."""
+    __tablename__ = "quiz_best_scores"
+    __table_args__ = (
+        # Top-N in leaderboard order straight off the index; ties go to whoever got there first
+        Index("ix_quiz_best_scores_ranking", "quiz_id", desc("best_score"), "achieved_at", "user_id"),
+    )
+
+    quiz_id = Column(Integer, ForeignKey("quizzes.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, index=True)
+    best_score = Column(Float, nullable=False)
+    achieved_at = Column(DateTime, nullable=False)
+
+
+class QuizScoreCount(Base):
+    """
+    How many users have each distinct best score on a quiz.
+
+    A caller's rank is 1 + the users in higher buckets; scores are fractions of the question count, so a
+    quiz has few buckets and ranking never walks the leaderboard itself.
+    """
+    __tablename__ = "quiz_score_counts"
+
+    quiz_id = Column(Integer, ForeignKey("quizzes.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Float, primary_key=True)
+    users = Column(Integer, default=0, nullable=False)
+
+
+class AttemptAnswer(Base):
+    """One answered question of an attempt."""
+    __tablename__ = "attempt_answers"
+
+    id = Column(Integer, primary_key=True)
+    attempt_id = Column(Integer, ForeignKey("attempts.id", ondelete="CASCADE"), nullable=False, index=True)
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True)
+    selected_option = Column(String(1), nullable=True)  # 'A'..'D'; NULL when the answer was not an option
+    is_correct = Column(Boolean, default=False, nullable=False)
+
+
+class QuestionStat(Base):
+    """
+    Running aggregates of every graded answer to a question, updated in the submitting transaction.
+
+    Each attempt at the question's quiz counts once in `attempts` (unanswered questions count as incorrect).
+    The score sums are of the attempt's total quiz score and give the point-biserial discrimination
+    without rescanning attempt_answers.
+    """
+    __tablename__ = "question_stats"
+
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    correct = Column(Integer, default=0, nullable=False)
+    count_a = Column(Integer, default=0, nullable=False)
+    count_b = Column(Integer, default=0, nullable=False)
+    count_c = Column(Integer, default=0, nullable=False)
+    count_d = Column(Integer, default=0, nullable=False)
+    score_sum = Column(Float, default=0.0, nullable=False)
+    score_sq_sum = Column(Float, default=0.0, nullable=False)
+    correct_score_sum = Column(Float, default=0.0, nullable=False)
+
+
 class Progress(Base):
     """Per-user progress through a module/lesson."""
     __tablename__ = "progress"
+    # One row per (user, module): the upsert target of lesson completion; also serves user_id lookups
+    __table_args__ = (Index("uq_progress_user_module", "user_id", "module_id", unique=True),)
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     module_id = Column(Integer, ForeignKey("modules.id", ondelete="CASCADE"), nullable=False, index=True)
     current_lesson_id = Column(Integer, ForeignKey("lessons.id", ondelete="SET NULL"), nullable=True)
     status = Column(String(50), default="in_progress", nullable=False)  # in_progress, completed
     progress_percent = Column(Float, default=0.0, nullable=False)
+    # Distinct lessons of the module completed by the user (rows in lesson_completions)
+    completed_lessons = Column(Integer, default=0, server_default="0", nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     user = relationship("User", back_populates="progresses")
+
+
+class LessonCompletion(Base):
+    """A lesson completed by a user; at most one row per (user, lesson)."""
+    __tablename__ = "lesson_completions"
+    __table_args__ = (UniqueConstraint("user_id", "lesson_id", name="uq_lesson_completions_user_lesson"),)
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    lesson_id = Column(Integer, ForeignKey("lessons.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Copied from the lesson so per-module completion counts need no join
+    module_id = Column(Integer, ForeignKey("modules.id", ondelete="CASCADE"), nullable=False)
+    completed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -17,6 +17,8 @@ class User(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_mentor = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Denormalized count of unread notifications (see src/db/notification_counts.py)
+    unread_notifications = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Relationships
     attempts = relationship("Attempt", back_populates="user", cascade="all, delete-orphan")
@@ -35,3 +37,19 @@ class User(Base):
     certificates = relationship("Certificate", back_populates="user", cascade="all, delete-orphan")
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
     language_preferences = relationship("LanguagePreference", back_populates="user", cascade="all, delete-orphan")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+
+
+class RefreshToken(Base):
+    """Server-side record of an issued refresh token; rotation and logout revoke it by jti."""
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(64), unique=True, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    replaced_by = Column(String(64), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    user = relationship("User", back_populates="refresh_tokens")
@@ -0,0 +1,45 @@
+"""
+Shared fixtures. The app reads settings at import time, so the test database is configured before any
+`src` import.
+"""
+import os
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="skillbridge-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP}/test.db"
+os.environ.pop("READ_DATABASE_URL", None)
+os.environ.pop("RATE_LIMIT_MAX", None)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.core.config import get_settings  # noqa: E402
+from src.core.principal_cache import principal_cache  # noqa: E402
+
+DEMO_LOGIN = {"email": "demo@example.com", "password": "demo1234"}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient with startup run once (tables created, demo users seeded)."""
+    from src.api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def claims_mode(monkeypatch):
+    """Switch to claims-only auth (short access tokens plus rotating refresh tokens) for one test."""
+    monkeypatch.setattr(get_settings(), "AUTH_CLAIMS_MODE", True)
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def tokens(client):
+    """Fresh login response for the demo user."""
+    response = client.post("/auth/login", json=DEMO_LOGIN)
+    assert response.status_code == 200
+    return response.json()
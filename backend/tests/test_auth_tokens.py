@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+
+def _handshake(client, token):
+    """First event of /ws/notifications and the close code (None while the socket stays open)."""
+    with client.websocket_connect(f"/ws/notifications?token={token}") as ws:
+        first = ws.receive_json()
+        if first["type"] == "welcome":
+            return first, None
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_json()
+        return first, closed.value.code
+
+
+def test_ws_accepts_access_token(client, tokens):
+    event, code = _handshake(client, tokens["access_token"])
+    assert event["type"] == "welcome" and code is None
+
+
+def test_ws_accepts_claims_access_token(client, claims_mode, tokens):
+    event, code = _handshake(client, tokens["access_token"])
+    assert event["type"] == "welcome" and code is None
+
+
+def test_ws_rejects_refresh_token(client, claims_mode, tokens):
+    event, code = _handshake(client, tokens["refresh_token"])
+    assert event["type"] == "error"
+    assert code == 1008
+
+
+@pytest.mark.parametrize("token", ["", "not-a-jwt"])
+def test_ws_rejects_missing_or_invalid_token(client, token):
+    event, code = _handshake(client, token)
+    assert event["type"] == "error"
+    assert code == 1008
+
+
+def test_http_rejects_refresh_token(client, claims_mode, tokens):
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {tokens['refresh_token']}"})
+    assert response.status_code == 401
+
+
+def test_refresh_rotates_and_reuse_revokes_family(client, claims_mode, tokens):
+    first = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert first.status_code == 200
+    rotated = first.json()["refresh_token"]
+
+    reused = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert reused.status_code == 401
+    # reuse revoked the whole chain, including the token issued by the rotation
+    assert client.post("/auth/refresh", json={"refresh_token": rotated}).status_code == 401
+
+
+def test_concurrent_refresh_of_one_token_succeeds_once(client, claims_mode, tokens):
+    async def race():
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            body = {"refresh_token": tokens["refresh_token"]}
+            return await asyncio.gather(*(http.post("/auth/refresh", json=body) for _ in range(4)))
+
+    # run on the app's event loop, which owns the pooled async connections
+    responses = client.portal.call(race)
+    assert sorted(r.status_code for r in responses) == [200, 401, 401, 401]
+    winner = next(r for r in responses if r.status_code == 200).json()["refresh_token"]
+    # the losers are treated as reuse, so the winner's token is revoked too
+    assert client.post("/auth/refresh", json={"refresh_token": winner}).status_code == 401
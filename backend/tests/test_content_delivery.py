@@ -0,0 +1,89 @@
+import pytest
+
+from src.api.content_delivery import accepts_gzip, parse_range
+
+BODY = "".join(f"{i:05d}\n" for i in range(20000))  # 120000 bytes, several inflate chunks
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=900-5000", (900, 999)),  # end clamped to the representation
+        ("bytes=-100", (900, 999)),  # suffix range
+        ("bytes=-5000", (0, 999)),  # suffix longer than the body
+        ("bytes=999-999", (999, 999)),
+    ],
+)
+def test_parse_range_satisfiable(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [None, "", "items=0-1", "bytes=0-1,5-6", "bytes=5-1", "bytes=-", "bytes=a-b", "bytes=1"],
+)
+def test_parse_range_ignored_means_full_body(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize(("header", "total"), [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=-10", 0)])
+def test_parse_range_unsatisfiable(header, total):
+    with pytest.raises(ValueError):
+        parse_range(header, total)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("gzip", True), ("br, gzip;q=0.5", True), ("gzip;q=0", False), ("*", True), ("identity", False), (None, False)],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.fixture(scope="module")
+def lesson_url(client):
+    from src.db.session import db_session
+    from src.models.content import Lesson
+
+    with db_session() as db:
+        lesson = Lesson(module_id=1, title="Range fixture", content=BODY, order_index=99)
+        db.add(lesson)
+        db.flush()
+        lesson_id = lesson.id
+    return f"/lessons/{lesson_id}/content"
+
+
+def _get(client, tokens, url, **headers):
+    return client.get(url, headers={"Authorization": f"Bearer {tokens['access_token']}", **headers})
+
+
+def test_identity_range_is_sliced_from_the_inflated_body(client, tokens, lesson_url):
+    response = _get(client, tokens, lesson_url, **{"Accept-Encoding": "identity", "Range": "bytes=70000-70011"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 70000-70011/{len(BODY)}"
+    assert response.text == BODY[70000:70012]
+
+
+def test_suffix_range(client, tokens, lesson_url):
+    response = _get(client, tokens, lesson_url, **{"Accept-Encoding": "identity", "Range": "bytes=-6"})
+    assert response.status_code == 206 and response.text == BODY[-6:]
+
+
+def test_unsatisfiable_range_is_416(client, tokens, lesson_url):
+    response = _get(client, tokens, lesson_url, **{"Accept-Encoding": "identity", "Range": f"bytes={len(BODY)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+def test_multi_range_serves_full_body(client, tokens, lesson_url):
+    response = _get(client, tokens, lesson_url, **{"Accept-Encoding": "identity", "Range": "bytes=0-1,4-5"})
+    assert response.status_code == 200 and response.text == BODY
+
+
+def test_stale_if_range_ignores_range(client, tokens, lesson_url):
+    response = _get(
+        client, tokens, lesson_url, **{"Accept-Encoding": "identity", "Range": "bytes=0-9", "If-Range": '"stale"'}
+    )
+    assert response.status_code == 200 and len(response.content) == len(BODY)
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.db.leaderboard import ScoredAttempt, entrants, rank_of, record_best_scores
+from src.models.tracking import QuizBestScore, QuizScoreCount
+
+QUIZ = 1
+T0 = datetime(2024, 1, 1)
+
+
+def _run(scenario):
+    """Run scenario(session) against a fresh in-memory copy of the two leaderboard tables."""
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all, tables=[QuizBestScore.__table__, QuizScoreCount.__table__]
+            )
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await scenario(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def _attempt(user_id, score, minutes=0):
+    return ScoredAttempt(QUIZ, user_id, score, T0 + timedelta(minutes=minutes))
+
+
+async def _buckets(db):
+    rows = await db.execute(select(QuizScoreCount.score, QuizScoreCount.users).where(QuizScoreCount.quiz_id == QUIZ))
+    return {score: users for score, users in rows if users}
+
+
+def test_ties_share_a_competition_rank():
+    async def scenario(db):
+        await record_best_scores(db, [_attempt(1, 1.0), _attempt(2, 0.8), _attempt(3, 0.8), _attempt(4, 0.5)])
+        return [await rank_of(db, QUIZ, s) for s in (1.0, 0.8, 0.5)], await entrants(db, QUIZ)
+
+    ranks, total = _run(scenario)
+    assert ranks == [1, 2, 4]  # the two 0.8s share 2nd; 3rd is skipped
+    assert total == 4
+
+
+def test_scores_equal_after_rounding_tie():
+    async def scenario(db):
+        await record_best_scores(db, [_attempt(1, 2 / 3), _attempt(2, 0.66666)])
+        return await _buckets(db), await rank_of(db, QUIZ, round(2 / 3, 4))
+
+    buckets, rank = _run(scenario)
+    assert buckets == {0.6667: 2}
+    assert rank == 1
+
+
+def test_improvement_moves_the_user_between_buckets():
+    async def scenario(db):
+        await record_best_scores(db, [_attempt(1, 0.9), _attempt(2, 0.5)])
+        await record_best_scores(db, [_attempt(2, 1.0, minutes=5)])
+        await record_best_scores(db, [_attempt(1, 0.4, minutes=6)])  # worse: ignored
+        best = dict((await db.execute(select(QuizBestScore.user_id, QuizBestScore.best_score))).all())
+        return await _buckets(db), best, await rank_of(db, QUIZ, 0.9), await entrants(db, QUIZ)
+
+    buckets, best, rank, total = _run(scenario)
+    assert buckets == {1.0: 1, 0.9: 1}
+    assert best == {1: 0.9, 2: 1.0}
+    assert rank == 2
+    assert total == 2
+
+
+def test_batch_keeps_one_best_per_user_earliest_on_ties():
+    async def scenario(db):
+        await record_best_scores(db, [_attempt(1, 0.7, 3), _attempt(1, 0.8, 2), _attempt(1, 0.8, 1)])
+        return (await db.execute(select(QuizBestScore.best_score, QuizBestScore.achieved_at))).one(), await _buckets(db)
+
+    (score, achieved_at), buckets = _run(scenario)
+    assert (score, achieved_at) == (0.8, T0 + timedelta(minutes=1))
+    assert buckets == {0.8: 1}
@@ -0,0 +1,35 @@
+from sqlalchemy import func, select
+
+from src.core.notification_service import broadcast_to_module
+from src.db.session import async_db_session, db_session
+from src.models.content import Module
+from src.models.extras import Notification
+from src.models.tracking import Progress
+from src.models.user import User
+
+
+def test_broadcast_counts_only_the_rows_it_inserted(client):
+    with db_session() as db:
+        module = Module(title="Broadcast fixture")
+        users = [User(email=f"broadcast{i}@example.com", hashed_password="x") for i in range(3)]
+        db.add_all([module, *users])
+        db.flush()
+        db.add_all([Progress(user_id=u.id, module_id=module.id) for u in users[:2]])
+        module_id, user_ids = module.id, [u.id for u in users]
+
+    async def send():
+        async with async_db_session() as db:
+            return await broadcast_to_module(db, module_id, "New lesson")
+
+    assert client.portal.call(send) == 2
+    with db_session() as db:
+        counters = dict(db.execute(select(User.id, User.unread_notifications).where(User.id.in_(user_ids))).all())
+        unread = dict(
+            db.execute(
+                select(Notification.user_id, func.count())
+                .where(Notification.user_id.in_(user_ids), Notification.is_read.is_(False))
+                .group_by(Notification.user_id)
+            ).all()
+        )
+    assert counters == {user_ids[0]: 1, user_ids[1]: 1, user_ids[2]: 0}
+    assert counters == {user_id: unread.get(user_id, 0) for user_id in user_ids}
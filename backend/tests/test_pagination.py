@@ -0,0 +1,64 @@
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.pagination import decode_cursor, encode_cursor
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize("last_id", [0, 1, 7, 2**40])
+def test_cursor_round_trip_is_url_safe_and_unpadded(last_id):
+    cursor = encode_cursor(last_id)
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == last_id
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not base64!", _raw_cursor([1]), _raw_cursor({"id": "5"}), _raw_cursor({"id": True}), _raw_cursor({"x": 1})],
+)
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def _walk(client, path, headers, limit):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        body = client.get(path, params=params, headers=headers).json()
+        assert len(body["items"]) <= limit
+        ids += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def test_keyset_pages_cover_every_row_once_in_both_orders(client, tokens):
+    from src.db.session import db_session
+    from src.models.content import Module
+    from src.models.extras import Notification
+
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    user_id = client.get("/users/me", headers=headers).json()["id"]
+    with db_session() as db:
+        db.add_all(Module(title=f"Paging module {i}") for i in range(5))
+        db.add_all(Notification(user_id=user_id, message=f"Paging {i}") for i in range(7))
+
+    modules = _walk(client, "/modules", headers, limit=2)
+    assert modules == sorted(set(modules)) and len(modules) >= 5
+
+    notifications = _walk(client, "/notifications", headers, limit=3)
+    assert notifications == sorted(set(notifications), reverse=True) and len(notifications) >= 7
+
+
+def test_last_full_page_has_no_next_cursor(client, tokens):
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    total = len(_walk(client, "/modules", headers, limit=200))
+    assert client.get("/modules", params={"limit": total}, headers=headers).json()["next_cursor"] is None
@@ -0,0 +1,38 @@
+import asyncio
+import os
+
+import pytest
+
+from src.core.password_pool import PasswordPool, PasswordPoolBusy
+from src.core.security import hash_password
+
+
+def test_dead_worker_is_replaced_and_counted_as_failed():
+    async def scenario():
+        pool = PasswordPool(workers=1, max_pending=4)
+        try:
+            with pytest.raises(PasswordPoolBusy):
+                await pool._run(os._exit, 1)  # kills the worker on the first try and on the retry
+            hashed = await pool.hash("secret123")
+            return await pool.verify("secret123", hashed), pool.stats()
+        finally:
+            pool.shutdown()
+
+    valid, stats = asyncio.run(scenario())
+    assert valid is True
+    assert (stats["completed"], stats["failed"], stats["pending"]) == (2, 1, 0)
+
+
+def test_errors_are_failed_not_completed():
+    async def scenario():
+        pool = PasswordPool(workers=1, max_pending=4, kind="thread")
+        try:
+            with pytest.raises(ValueError):
+                await pool._run(int, "not a number")
+            await pool.verify("secret123", hash_password("secret123"))
+            return pool.stats()
+        finally:
+            pool.shutdown()
+
+    stats = asyncio.run(scenario())
+    assert (stats["completed"], stats["failed"]) == (1, 1)
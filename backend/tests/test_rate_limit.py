@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+import pytest
+from fastapi.middleware.cors import CORSMiddleware
+
+from src.api.rate_limit import RateLimitMiddleware, RateLimitRule, SlidingWindowLimiter, parse_route_rules
+from src.core.security import create_access_token
+
+RULE = RateLimitRule(name="test", limit=3, window_s=10)
+KEY = ("test", "u:1", 10)
+
+
+def test_allows_up_to_limit_within_a_window():
+    limiter = SlidingWindowLimiter()
+    results = [limiter.hit(KEY, RULE, now=100.0 + i) for i in range(4)]
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert [remaining for _, remaining, _ in results] == [2, 1, 0, 0]
+    # denied with no previous window: retry when the current fixed window ends
+    assert results[-1][2] == pytest.approx(10.0 - 3.0)
+
+
+def test_previous_window_weight_decays_linearly():
+    limiter = SlidingWindowLimiter()
+    for _ in range(3):
+        assert limiter.hit(KEY, RULE, now=100.0)[0]
+    # window start: the previous window still counts fully
+    assert limiter.hit(KEY, RULE, now=110.0)[0] is False
+    # 20% into the next window the previous 3 weigh 2.4, so one more fits
+    assert limiter.hit(KEY, RULE, now=112.0)[0] is True
+    allowed, remaining, reset_after = limiter.hit(KEY, RULE, now=112.0)
+    assert (allowed, remaining) == (False, 0)
+    # 1 current + 3 * (1 - t/10) drops below 3 once t > 10/3
+    assert reset_after == pytest.approx(10 / 3 - 2.0)
+    assert limiter.hit(KEY, RULE, now=110.0 + 10 / 3 + 0.01)[0] is True
+
+
+def test_counts_reset_after_two_idle_windows():
+    limiter = SlidingWindowLimiter()
+    for _ in range(3):
+        limiter.hit(KEY, RULE, now=100.0)
+    assert limiter.hit(KEY, RULE, now=120.0)[:2] == (True, 2)
+
+
+def test_keys_are_independent():
+    limiter = SlidingWindowLimiter()
+    for _ in range(3):
+        limiter.hit(KEY, RULE, now=100.0)
+    assert limiter.hit(("test", "u:2", 10), RULE, now=100.0)[0] is True
+
+
+def test_parse_route_rules_longest_prefix_first_and_skips_garbage():
+    rules = parse_route_rules("/modules=120, POST /auth/login=10/60, bogus, /x=abc", default_window_s=30)
+    assert [(prefix, method, rule.limit, rule.window_s) for prefix, method, rule in rules] == [
+        ("/auth/login", "POST", 10, 60),
+        ("/modules", None, 120, 30),
+    ]
+
+
+def _token(sub, **expires):
+    return create_access_token(sub, expires_delta=timedelta(**expires)).encode()
+
+
+def test_token_subjects_skip_invalid_tokens_and_evict_lru():
+    middleware = RateLimitMiddleware(app=None, default_rule=RULE)
+    middleware._token_subjects_max = 2
+    first, second, third = _token("1", minutes=5), _token("2", minutes=5), _token("3", minutes=5)
+
+    assert middleware._token_subject(b"junk") is None
+    assert middleware._token_subject(_token("4", seconds=-1)) is None  # expired
+    assert len(middleware._token_subjects) == 0
+
+    assert [middleware._token_subject(t) for t in (first, second, first, third)] == ["u:1", "u:2", "u:1", "u:3"]
+    assert list(middleware._token_subjects) == [first, third]  # second was least recently used
+
+
+def test_token_subject_expires_with_the_token():
+    middleware = RateLimitMiddleware(app=None, default_rule=RULE)
+    token = _token("1", minutes=5)
+    assert middleware._token_subject(token) == "u:1"
+    middleware._token_subjects[token] = ("u:stale", 0.0)  # an entry whose exp has passed
+    assert middleware._token_subject(token) == "u:1"  # verified again rather than served from the memo
+    assert middleware._token_subjects[token][0] == "u:1"
+
+
+def test_cors_wraps_rate_limiter():
+    from src.api.main import app
+
+    # Starlette runs user_middleware[0] outermost, so even 429s get CORS headers
+    outermost = app.user_middleware[0]
+    assert outermost.cls is CORSMiddleware
+    assert {"Retry-After", "RateLimit-Remaining", "RateLimit-Policy"} <= set(outermost.kwargs["expose_headers"])